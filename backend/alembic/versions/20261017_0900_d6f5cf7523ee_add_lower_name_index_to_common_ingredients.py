@@ -0,0 +1,30 @@
+"""add lower(name) index to common_ingredients
+
+Revision ID: d6f5cf7523ee
+Revises: c4a7e2f1b3d5
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d6f5cf7523ee"
+down_revision: Union[str, None] = "c4a7e2f1b3d5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Functional index so case-insensitive name lookups (lower(name) = :name) can use
+    # an index seek. ingredient_aliases already has idx_alias_lower on LOWER(alias).
+    op.execute(
+        "CREATE INDEX idx_common_ingredient_name_lower ON common_ingredients (LOWER(name))"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_common_ingredient_name_lower")
@@ -0,0 +1,35 @@
+"""add partial index on indexed recipe_ingredients
+
+Revision ID: afe9a58c659b
+Revises: d6f5cf7523ee
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "afe9a58c659b"
+down_revision: Union[str, None] = "d6f5cf7523ee"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The recipe index only joins ingredients with is_indexed = true; a partial index
+    # keeps that join from touching the (much larger) non-indexed majority
+    op.create_index(
+        "ix_recipe_ingredients_indexed_recipe_id",
+        "recipe_ingredients",
+        ["recipe_id", "common_ingredient_id"],
+        unique=False,
+        postgresql_where=sa.text("is_indexed"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_recipe_ingredients_indexed_recipe_id", table_name="recipe_ingredients")
@@ -0,0 +1,34 @@
+"""add (week_template_id, instance_start_date) index to meal_plan_instances
+
+Revision ID: 8ad94b2f26a5
+Revises: afe9a58c659b
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8ad94b2f26a5"
+down_revision: Union[str, None] = "afe9a58c659b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Week advancement takes MAX(instance_start_date) per template, and the current
+    # instance lookup orders a template's instances by start date; both read this
+    # index directly
+    op.create_index(
+        "ix_meal_plan_instances_template_start_date",
+        "meal_plan_instances",
+        ["week_template_id", "instance_start_date"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_meal_plan_instances_template_start_date", table_name="meal_plan_instances")
@@ -13,6 +13,7 @@ from urllib.parse import urlparse
 from app.core.deps import get_current_user, get_current_user_no_db
 from app.models.user import User
 from app.core.config import get_settings
+from app.services.recipe_service import RecipeService
 
 router = APIRouter(prefix="/backup", tags=["backup"])
 
@@ -209,6 +210,9 @@ async def restore_backup(
         if migration_result.returncode != 0:
             raise Exception(f"Failed to run migrations: {migration_result.stderr}")
 
+        # Cached ingredient lookups refer to the pre-restore data
+        RecipeService.clear_common_ingredient_cache()
+
         return {
             "message": "Database restored successfully. Please reload the page to reconnect.",
             "filename": filename,
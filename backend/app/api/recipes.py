@@ -7,6 +7,7 @@ Includes recipe import/scraping functionality and usage tracking.
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File
 from fastapi.responses import StreamingResponse
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 from uuid import UUID
@@ -50,6 +51,8 @@ async def list_recipes(
     owner_id: Optional[UUID] = Query(None, description="Filter by owner"),
     include_retired: bool = Query(False, description="Include retired recipes"),
     dish_type: Optional[str] = Query(None, description="Filter by recipe type"),
+    limit: Optional[int] = Query(None, ge=1, description="Maximum number of recipes to return"),
+    offset: int = Query(0, ge=0, description="Number of recipes to skip"),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -59,6 +62,8 @@ async def list_recipes(
         owner_id: Optional UUID to filter recipes by owner
         include_retired: Include soft-deleted recipes in results
         dish_type: Filter by recipe type (e.g., "dinner", "breakfast")
+        limit: Optional page size (all recipes when omitted)
+        offset: Number of recipes to skip, for paging with limit
         db: Database session (injected)
         current_user: Authenticated user (injected)
 
@@ -70,6 +75,10 @@ async def list_recipes(
         owner_id=owner_id,
         include_retired=include_retired,
         dish_type=dish_type,
+        # RecipeResponse has no nested collections, so don't load them
+        include_details=False,
+        limit=limit,
+        offset=offset,
     )
     return recipes
 
@@ -268,9 +277,9 @@ async def import_multiple_recipes_json(
             )
 
         recipes_data = data["recipes"]
-        imported_count = 0
         failed_count = 0
         errors = []
+        valid_recipes = []
 
         for idx, recipe_data in enumerate(recipes_data):
             try:
@@ -280,7 +289,7 @@ async def import_multiple_recipes_json(
                     if field not in recipe_data:
                         raise ValueError(f"Missing required field: {field}")
 
-                # Create recipe
+                # Build recipe payload
                 create_data = RecipeCreate(
                     name=recipe_data["name"],
                     dish_type=recipe_data.get("dish_type"),
@@ -297,11 +306,7 @@ async def import_multiple_recipes_json(
                         RecipeInstructionCreate(**inst) for inst in recipe_data["instructions"]
                     ],
                 )
-
-                await RecipeService.create_recipe(
-                    db=db, recipe_data=create_data, owner_id=current_user.id
-                )
-                imported_count += 1
+                valid_recipes.append((idx, create_data))
 
             except Exception as e:
                 failed_count += 1
@@ -309,6 +314,33 @@ async def import_multiple_recipes_json(
                     f"Recipe {idx + 1} ('{recipe_data.get('name', 'unknown')}'): {str(e)}"
                 )
 
+        # Read before any rollback below expires the user loaded in this session
+        owner_id = current_user.id
+
+        # Create all valid recipes in a single transaction
+        try:
+            created_ids = await RecipeService.bulk_create_recipes(
+                db=db,
+                recipes_data=[create_data for _, create_data in valid_recipes],
+                owner_id=owner_id,
+            )
+            imported_count = len(created_ids)
+        except SQLAlchemyError:
+            # A database error in any recipe fails the whole batch; retry them one
+            # at a time so the rest still import and the failing ones are reported
+            await db.rollback()
+            imported_count = 0
+            for idx, create_data in valid_recipes:
+                try:
+                    await RecipeService.create_recipe(
+                        db=db, recipe_data=create_data, owner_id=owner_id
+                    )
+                    imported_count += 1
+                except SQLAlchemyError as e:
+                    await db.rollback()
+                    failed_count += 1
+                    errors.append(f"Recipe {idx + 1} ('{create_data.name}'): {str(e)}")
+
         result_message = f"Imported {imported_count} recipe(s)"
         if failed_count > 0:
             result_message += f", {failed_count} failed"
@@ -4,11 +4,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from pydantic import BaseModel
 from typing import Optional
+from zoneinfo import ZoneInfo
 
 from app.db.session import get_db
 from app.models.settings import Settings
 from app.core.deps import get_current_user
 from app.models.user import User
+from app.services.scheduler_service import schedule_notifications
 
 router = APIRouter(prefix="/settings", tags=["settings"])
 
@@ -28,6 +30,24 @@ class SettingsUpdate(BaseModel):
     notification_timezone: Optional[str] = None
 
 
+def _validate_notification_settings(
+    notification_time: Optional[str],
+    notification_timezone: Optional[str],
+) -> None:
+    """Raise a 400 unless the time is HH:MM and the timezone is a known zone name."""
+    try:
+        hour, minute = map(int, notification_time.split(":"))
+        if not (0 <= hour < 24 and 0 <= minute < 60):
+            raise ValueError(notification_time)
+        ZoneInfo(notification_timezone)
+    except (AttributeError, TypeError, ValueError, KeyError):
+        # Nulls, non-HH:MM strings, out-of-range values, and unknown zone names
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid notification time or timezone",
+        ) from None
+
+
 @router.get("", response_model=SettingsResponse)
 async def get_settings(
     current_user: User = Depends(get_current_user),
@@ -51,6 +71,8 @@ async def get_settings(
         await db.commit()
         await db.refresh(settings)
 
+        schedule_notifications(settings.notification_time, settings.notification_timezone)
+
     return SettingsResponse(
         id=str(settings.id),
         notification_time=settings.notification_time,
@@ -85,9 +107,15 @@ async def update_settings(
         for field, value in update_data.items():
             setattr(settings, field, value)
 
+    # Reject a malformed time or unknown timezone before it is saved
+    _validate_notification_settings(settings.notification_time, settings.notification_timezone)
+
     await db.commit()
     await db.refresh(settings)
 
+    # Move the daily notification job only once the new time is stored
+    schedule_notifications(settings.notification_time, settings.notification_timezone)
+
     return SettingsResponse(
         id=str(settings.id),
         notification_time=settings.notification_time,
@@ -16,6 +16,9 @@ engine = create_async_engine(
     echo=settings.debug,
     future=True,
     connect_args=connect_args,
+    # Room for every distinct statement shape the services issue, so repeat
+    # requests reuse compiled SQL instead of recompiling it
+    query_cache_size=1200,
 )
 
 # Create async session factory
@@ -30,6 +30,11 @@ class CommonIngredient(Base):
         cascade="all, delete-orphan",
     )
 
+    # Case-insensitive lookup index
+    __table_args__ = (
+        Index('idx_common_ingredient_name_lower', func.lower(name)),
+    )
+
     def __repr__(self):
         return f"<CommonIngredient {self.name} ({self.category})>"
 
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, Float, Date, DateTime, ForeignKey, Text
+from sqlalchemy import Column, String, Integer, Float, Date, DateTime, ForeignKey, Text, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -34,6 +34,16 @@ class MealPlanInstance(Base):
         nullable=False,
     )
 
+    __table_args__ = (
+        # Latest instance per template (week advancement, current instance) is a
+        # backward scan of this index instead of a sort over all of a template's weeks
+        Index(
+            "ix_meal_plan_instances_template_start_date",
+            "week_template_id",
+            "instance_start_date",
+        ),
+    )
+
     # Relationships
     sequence = relationship("ScheduleSequence")
     week_template = relationship("WeekTemplate")
@@ -135,6 +135,18 @@ class RecipeIngredient(Base):
     is_indexed = Column(Boolean, default=False, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
+    __table_args__ = (
+        # Partial index over just the indexed ingredients, which is all the recipe
+        # index query joins against
+        Index(
+            "ix_recipe_ingredients_indexed_recipe_id",
+            "recipe_id",
+            "common_ingredient_id",
+            postgresql_where=is_indexed.is_(True),
+            sqlite_where=is_indexed.is_(True),
+        ),
+    )
+
     # Relationships
     recipe = relationship("Recipe", back_populates="ingredients")
     common_ingredient = relationship("CommonIngredient")
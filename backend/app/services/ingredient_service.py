@@ -13,6 +13,7 @@ from app.schemas.ingredient import (
     CommonIngredientUpdate,
     CreateMappingRequest,
 )
+from app.services.recipe_service import RecipeService
 
 
 class IngredientService:
@@ -88,6 +89,7 @@ class IngredientService:
         )
         db.add(ingredient)
         await db.commit()
+        RecipeService.clear_common_ingredient_cache()
         await db.refresh(ingredient)
         return ingredient
 
@@ -109,6 +111,7 @@ class IngredientService:
             ingredient.category = ingredient_data.category
 
         await db.commit()
+        RecipeService.clear_common_ingredient_cache()
         await db.refresh(ingredient)
         return ingredient
 
@@ -126,6 +129,7 @@ class IngredientService:
         query = delete(CommonIngredient).where(CommonIngredient.id == ingredient_id)
         result = await db.execute(query)
         await db.commit()
+        RecipeService.clear_common_ingredient_cache()
         return result.rowcount > 0
 
     @staticmethod
@@ -158,6 +162,7 @@ class IngredientService:
         delete_query = delete(IngredientAlias).where(IngredientAlias.id == alias_id)
         await db.execute(delete_query)
         await db.commit()
+        RecipeService.clear_common_ingredient_cache()
         return True
 
     @staticmethod
@@ -278,6 +283,7 @@ class IngredientService:
             count += 1
 
         await db.commit()
+        RecipeService.clear_common_ingredient_cache()
         return count
 
     @staticmethod
@@ -313,6 +319,7 @@ class IngredientService:
             recipe_ingredient.common_ingredient_id = ingredient.id
 
         await db.commit()
+        RecipeService.clear_common_ingredient_cache()
         await db.refresh(ingredient)
         return ingredient
 
@@ -369,6 +376,7 @@ class IngredientService:
             ingredients_created += 1
 
         await db.commit()
+        RecipeService.clear_common_ingredient_cache()
 
         return {
             "ingredients_created": ingredients_created,
@@ -420,4 +428,5 @@ class IngredientService:
             await db.delete(source)
 
         await db.commit()
+        RecipeService.clear_common_ingredient_cache()
         return count
@@ -249,47 +249,38 @@ class MealPlanService:
         meal_assignments_result = await db.execute(meal_assignments_query)
         meal_assignments = meal_assignments_result.scalars().all()
 
-        results = []
-
-        # If there are per-instance overrides, use those
+        # Per-instance overrides win; otherwise use the template's assignments for this day
         if meal_assignments:
-            for assignment in meal_assignments:
-                # Get user
-                user_result = await db.execute(
-                    select(User).where(User.id == assignment.assigned_user_id)
-                )
-                user = user_result.scalar_one_or_none()
-
-                # Get recipe if needed
-                recipe = None
-                if assignment.recipe_id:
-                    recipe_result = await db.execute(
-                        select(Recipe).where(Recipe.id == assignment.recipe_id)
-                    )
-                    recipe = recipe_result.scalar_one_or_none()
-
-                results.append((assignment, user, recipe))
+            day_assignments = meal_assignments
         else:
-            # Use template assignments for this day
-            for day_assignment in template.day_assignments:
-                if day_assignment.day_of_week == day_of_week:
-                    # Get user
-                    user_result = await db.execute(
-                        select(User).where(User.id == day_assignment.assigned_user_id)
-                    )
-                    user = user_result.scalar_one_or_none()
+            day_assignments = [
+                day_assignment
+                for day_assignment in template.day_assignments
+                if day_assignment.day_of_week == day_of_week
+            ]
 
-                    # Get recipe if needed
-                    recipe = None
-                    if day_assignment.recipe_id:
-                        recipe_result = await db.execute(
-                            select(Recipe).where(Recipe.id == day_assignment.recipe_id)
-                        )
-                        recipe = recipe_result.scalar_one_or_none()
-
-                    results.append((day_assignment, user, recipe))
+        if not day_assignments:
+            return []
 
-        return results
+        # Load every referenced user and recipe with one query each
+        user_ids = {assignment.assigned_user_id for assignment in day_assignments}
+        users_result = await db.execute(select(User).where(User.id.in_(user_ids)))
+        users_by_id = {user.id: user for user in users_result.scalars()}
+
+        recipes_by_id = {}
+        recipe_ids = {assignment.recipe_id for assignment in day_assignments if assignment.recipe_id}
+        if recipe_ids:
+            recipes_result = await db.execute(select(Recipe).where(Recipe.id.in_(recipe_ids)))
+            recipes_by_id = {recipe.id: recipe for recipe in recipes_result.scalars()}
+
+        return [
+            (
+                assignment,
+                users_by_id.get(assignment.assigned_user_id),
+                recipes_by_id.get(assignment.recipe_id),
+            )
+            for assignment in day_assignments
+        ]
 
     @staticmethod
     async def build_instance_detail(
@@ -4,15 +4,22 @@ Service layer for recipe business logic.
 Handles recipe CRUD, retirement validation, and template usage checking.
 """
 
-from typing import Optional, List
+from typing import Any, Callable, Optional, List
 from uuid import UUID
+from collections import OrderedDict
 from datetime import datetime
+import asyncio
 import logging
+import re
+import time
+import uuid
+import httpx
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, delete, exists
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, and_, delete, insert, exists, func, bindparam, literal, union_all
+from sqlalchemy.orm import raiseload, selectinload
 from fastapi import HTTPException, status
-from recipe_scrapers import scrape_me, scrape_html, WebsiteNotImplementedError
+from recipe_scrapers import HEADERS, scrape_html, WebsiteNotImplementedError
+from recipe_scrapers._exceptions import RecipeScrapersExceptions
 
 from app.models.recipe import (
     Recipe,
@@ -42,6 +49,151 @@ from app.utils.ingredient_parser import parse_ingredient_line
 
 logger = logging.getLogger(__name__)
 
+# In-process LRU cache for common ingredient lookups:
+# stripped lowercased name -> (expires_at, common_ingredient_id or None for "no match").
+# IngredientService clears it whenever common ingredients or aliases change; the TTL
+# bounds staleness in other worker processes that didn't see the change.
+COMMON_INGREDIENT_CACHE_SIZE = 4096
+COMMON_INGREDIENT_CACHE_TTL_SECONDS = 300
+_common_ingredient_cache: OrderedDict[str, tuple[float, Optional[UUID]]] = OrderedDict()
+
+# Single-name common ingredient lookup, built once so every call reuses the same
+# compiled statement: alias match (priority 0) wins over a direct name match (priority 1).
+# Compares lower(column) with equality so the functional lower() indexes are used.
+_COMMON_INGREDIENT_LOOKUP = (
+    union_all(
+        select(
+            IngredientAlias.common_ingredient_id.label("common_ingredient_id"),
+            literal(0).label("priority"),
+        ).where(func.lower(IngredientAlias.alias) == bindparam("name_lower")),
+        select(
+            CommonIngredient.id.label("common_ingredient_id"),
+            literal(1).label("priority"),
+        ).where(func.lower(CommonIngredient.name) == bindparam("name_lower")),
+    )
+    .order_by("priority")
+    .limit(1)
+)
+
+
+# Bounds concurrent outbound recipe page fetches across all in-flight imports
+# in this process, so a burst of imports can't open an unbounded number of sockets.
+RECIPE_FETCH_CONCURRENCY = 10
+RECIPE_FETCH_TIMEOUT_SECONDS = 15
+_recipe_fetch_semaphore = asyncio.BoundedSemaphore(RECIPE_FETCH_CONCURRENCY)
+
+# In-process LRU cache of scraped previews: url -> (expires_at, preview), so a
+# preview followed by a save (or a repeat preview) doesn't fetch and parse twice
+IMPORT_PREVIEW_CACHE_SIZE = 256
+IMPORT_PREVIEW_CACHE_TTL_SECONDS = 300
+_import_preview_cache: OrderedDict[str, tuple[float, RecipeImportPreviewResponse]] = OrderedDict()
+
+# Scrapes currently running, keyed by url: concurrent previews of the same page
+# await the one in-flight scrape instead of each fetching it again
+_import_preview_inflight: dict[str, asyncio.Future[RecipeImportPreviewResponse]] = {}
+
+
+async def _fetch_html(url: str) -> str:
+    """Fetch a recipe page without blocking the event loop."""
+    async with (
+        _recipe_fetch_semaphore,
+        httpx.AsyncClient(headers=HEADERS, follow_redirects=True) as client,
+    ):
+        response = await client.get(url, timeout=RECIPE_FETCH_TIMEOUT_SECONDS)
+        response.raise_for_status()
+        return response.text
+
+
+# Rows fetched per round trip when streaming the recipe index projection
+INDEX_STREAM_BATCH_SIZE = 500
+
+# Above this many rows, bulk inserts on PostgreSQL go through COPY instead of an
+# executemany INSERT. Smaller batches aren't worth the extra round trip for the
+# raw connection.
+COPY_ROW_THRESHOLD = 100
+
+
+async def _copy_records(db: AsyncSession, model: type, rows: List[dict], columns: List[str]) -> None:
+    """Write rows with PostgreSQL COPY through the session's asyncpg connection."""
+    connection = await db.connection()
+    raw = await connection.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(
+        model.__tablename__,
+        records=[tuple(row[column] for column in columns) for row in rows],
+        columns=columns,
+    )
+
+
+async def _insert_rows(db: AsyncSession, model: type, rows: List[dict]) -> None:
+    """Bulk insert plain row dicts, using COPY for large batches on PostgreSQL.
+
+    COPY skips ORM column defaults, so primary keys are generated here and enum
+    members are written as their stored values; server defaults still apply, but
+    rows must carry any other column with only a Python-side default.
+    """
+    if not rows:
+        return
+    if len(rows) <= COPY_ROW_THRESHOLD or db.get_bind().dialect.name != "postgresql":
+        await db.execute(insert(model), rows)
+        return
+
+    copy_rows = [
+        {"id": uuid.uuid4(), **{key: getattr(value, "value", value) for key, value in row.items()}}
+        for row in rows
+    ]
+    await _copy_records(db, model, copy_rows, list(copy_rows[0]))
+
+
+# Tables written when creating recipes, in insert order (parents before children)
+_RECIPE_INSERT_ORDER = (
+    Recipe,
+    RecipeIngredient,
+    RecipeInstruction,
+    RecipePrepStep,
+    PrepStepIngredient,
+)
+
+# Splits a single instructions blob into steps on newlines or "1." style numbering
+_INSTRUCTION_SPLIT_RE = re.compile(r"\n+|\d+\.\s*")
+
+
+def _scrape_optional(
+    scraper: Any,
+    attribute: str,
+    url: str,
+    transform: Optional[Callable[[Any], Any]] = None,
+) -> Any:
+    """Read an optional scraper field, returning None if it's unavailable or fails.
+
+    Args:
+        scraper: recipe-scrapers scraper instance
+        attribute: Accessor name on the scraper (e.g. "prep_time")
+        url: Source URL for log messages
+        transform: Optional post-processing for truthy values (falsy values become None)
+
+    Returns:
+        The (transformed) value, or None
+    """
+    field = attribute.replace("_", " ")
+    method = getattr(scraper, attribute, None)
+    if not callable(method):
+        logger.debug(f"{field.capitalize()} method not available for {url}")
+        return None
+
+    try:
+        value = method()
+    except (NotImplementedError, RecipeScrapersExceptions):
+        # The site (or its schema.org markup) simply doesn't provide this field
+        logger.debug(f"{field.capitalize()} not provided for {url}")
+        return None
+    except Exception as e:
+        logger.warning(f"Failed to extract {field} from {url}: {e}")
+        return None
+
+    if transform is None:
+        return value
+    return transform(value) if value else None
+
 
 class RecipeService:
     """Service layer for recipe business logic."""
@@ -50,6 +202,35 @@ class RecipeService:
     # Ingredient Normalization Helper
     # ========================================================================
 
+    @staticmethod
+    def clear_common_ingredient_cache() -> None:
+        """Drop all cached common ingredient lookups (call after alias/name changes)."""
+        _common_ingredient_cache.clear()
+
+    @staticmethod
+    def _get_cached_common_ingredient(key: str) -> tuple[bool, Optional[UUID]]:
+        """Look up a normalized name in the cache, returning (hit, common_ingredient_id)."""
+        entry = _common_ingredient_cache.get(key)
+        if entry is None:
+            return False, None
+        expires_at, common_ingredient_id = entry
+        if expires_at <= time.monotonic():
+            del _common_ingredient_cache[key]
+            return False, None
+        _common_ingredient_cache.move_to_end(key)
+        return True, common_ingredient_id
+
+    @staticmethod
+    def _cache_common_ingredient(key: str, common_ingredient_id: Optional[UUID]) -> None:
+        """Store a lookup result, evicting the least recently used entry when full."""
+        _common_ingredient_cache[key] = (
+            time.monotonic() + COMMON_INGREDIENT_CACHE_TTL_SECONDS,
+            common_ingredient_id,
+        )
+        _common_ingredient_cache.move_to_end(key)
+        if len(_common_ingredient_cache) > COMMON_INGREDIENT_CACHE_SIZE:
+            _common_ingredient_cache.popitem(last=False)
+
     @staticmethod
     async def find_common_ingredient(
         db: AsyncSession,
@@ -59,43 +240,104 @@ class RecipeService:
         Find matching common ingredient ID for an ingredient name.
 
         Searches aliases (case-insensitive) and returns the common_ingredient_id if found.
-        Returns None if no match.
+        Returns None if no match. Results are cached in-process.
         """
-        # Search for alias match (case-insensitive)
-        query = select(IngredientAlias).where(IngredientAlias.alias.ilike(ingredient_name.strip()))
-        result = await db.execute(query)
-        alias = result.scalar_one_or_none()
+        key = ingredient_name.strip().lower()
+        hit, common_ingredient_id = RecipeService._get_cached_common_ingredient(key)
+        if hit:
+            return common_ingredient_id
 
-        if alias:
-            return alias.common_ingredient_id
+        # Search aliases, then common ingredient names (case-insensitive), in one query
+        common_ingredient_id = await db.scalar(_COMMON_INGREDIENT_LOOKUP, {"name_lower": key})
 
-        # Also check if it matches a common ingredient name directly
-        query = select(CommonIngredient).where(CommonIngredient.name.ilike(ingredient_name.strip()))
-        result = await db.execute(query)
-        common_ing = result.scalar_one_or_none()
+        RecipeService._cache_common_ingredient(key, common_ingredient_id)
+        return common_ingredient_id
 
-        if common_ing:
-            return common_ing.id
+    @staticmethod
+    async def resolve_common_ingredients(
+        db: AsyncSession,
+        ingredient_names: List[str],
+    ) -> dict[str, UUID]:
+        """
+        Resolve many ingredient names to common ingredient IDs in two queries.
 
-        return None
+        Batch counterpart of find_common_ingredient. Keys of the returned dict are
+        the stripped, lowercased names; names with no match are omitted. Alias
+        matches take precedence over direct common ingredient name matches.
+        Cached names are served from the in-process cache without querying.
+        """
+        resolved: dict[str, UUID] = {}
+        lowered = set()
+        for key in {name.strip().lower() for name in ingredient_names}:
+            hit, common_ingredient_id = RecipeService._get_cached_common_ingredient(key)
+            if not hit:
+                lowered.add(key)
+            elif common_ingredient_id is not None:
+                resolved[key] = common_ingredient_id
+        if not lowered:
+            return resolved
+
+        # Direct common ingredient name matches
+        name_key = func.lower(CommonIngredient.name)
+        result = await db.execute(
+            select(name_key, CommonIngredient.id).where(name_key.in_(lowered))
+        )
+        fetched = dict(result.all())
+
+        # Alias matches win over name matches
+        alias_key = func.lower(IngredientAlias.alias)
+        result = await db.execute(
+            select(alias_key, IngredientAlias.common_ingredient_id).where(alias_key.in_(lowered))
+        )
+        fetched.update(result.all())
+
+        for key in lowered:
+            RecipeService._cache_common_ingredient(key, fetched.get(key))
+        resolved.update(fetched)
+
+        return resolved
 
     # ========================================================================
     # Recipe Methods
     # ========================================================================
 
+    @staticmethod
+    def _recipe_loader_options() -> list:
+        """Loader options for fully-loaded recipes returned to the API.
+
+        Eagerly loads ingredients, instructions, and prep steps (with their links);
+        raiseload("*") makes any other relationship access fail fast instead of
+        silently lazy-loading during response serialization.
+        """
+        return [
+            selectinload(Recipe.ingredients).selectinload(RecipeIngredient.prep_step_links),
+            selectinload(Recipe.instructions),
+            selectinload(Recipe.prep_steps).selectinload(RecipePrepStep.ingredient_links),
+            raiseload("*"),
+        ]
+
     @staticmethod
     async def get_recipes(
         db: AsyncSession,
         owner_id: Optional[UUID] = None,
         include_retired: bool = False,
         dish_type: Optional[str] = None,
+        include_details: bool = True,
+        limit: Optional[int] = None,
+        offset: int = 0,
     ) -> List[Recipe]:
-        """Get list of recipes with optional filtering."""
-        query = select(Recipe).options(
-            selectinload(Recipe.ingredients).selectinload(RecipeIngredient.prep_step_links),
-            selectinload(Recipe.instructions),
-            selectinload(Recipe.prep_steps).selectinload(RecipePrepStep.ingredient_links),
-        )
+        """Get list of recipes with optional filtering.
+
+        Args:
+            include_details: Eager-load ingredients, instructions and prep steps.
+                Pass False when only recipe columns are needed (e.g. list views).
+            limit: Maximum number of recipes to return (None = all)
+            offset: Number of recipes to skip, for paging with limit
+        """
+        if include_details:
+            query = select(Recipe).options(*RecipeService._recipe_loader_options())
+        else:
+            query = select(Recipe).options(raiseload("*"))
 
         # Filter by owner
         if owner_id:
@@ -109,7 +351,12 @@ class RecipeService:
         if not include_retired:
             query = query.where(Recipe.retired_at.is_(None))
 
-        query = query.order_by(Recipe.name)
+        # id breaks ties between equal names so pages are stable
+        query = query.order_by(Recipe.name, Recipe.id)
+        if offset:
+            query = query.offset(offset)
+        if limit is not None:
+            query = query.limit(limit)
 
         result = await db.execute(query)
         return result.scalars().all()
@@ -119,19 +366,18 @@ class RecipeService:
         db: AsyncSession,
         recipe_id: UUID,
     ) -> Optional[Recipe]:
-        """Get a single recipe by ID with ingredients, instructions, and prep steps."""
-        query = (
-            select(Recipe)
-            .where(Recipe.id == recipe_id)
-            .options(
-                selectinload(Recipe.ingredients).selectinload(RecipeIngredient.prep_step_links),
-                selectinload(Recipe.instructions),
-                selectinload(Recipe.prep_steps).selectinload(RecipePrepStep.ingredient_links),
-            )
-        )
+        """Get a single recipe by ID with ingredients, instructions, and prep steps.
 
-        result = await db.execute(query)
-        return result.scalar_one_or_none()
+        Always re-reads the row and its collections (populate_existing): sessions
+        don't expire on commit, so a recipe already in the identity map may hold
+        stale or unloaded collections after nested writes.
+        """
+        return await db.get(
+            Recipe,
+            recipe_id,
+            options=RecipeService._recipe_loader_options(),
+            populate_existing=True,
+        )
 
     @staticmethod
     async def create_recipe(
@@ -140,93 +386,166 @@ class RecipeService:
         owner_id: UUID,
     ) -> Recipe:
         """Create a new recipe with ingredients and instructions."""
-        # Create recipe
-        recipe = Recipe(
-            owner_id=owner_id,
-            name=recipe_data.name,
-            index_name=recipe_data.index_name,
-            dish_type=recipe_data.dish_type,
-            description=recipe_data.description,
-            prep_time_minutes=recipe_data.prep_time_minutes,
-            cook_time_minutes=recipe_data.cook_time_minutes,
-            prep_notes=recipe_data.prep_notes,
-            postmortem_notes=recipe_data.postmortem_notes,
-            source_url=recipe_data.source_url,
+        # Resolve all common ingredients up front instead of once per ingredient
+        common_ingredient_ids = await RecipeService.resolve_common_ingredients(
+            db, [ing.ingredient_name for ing in recipe_data.ingredients or []]
         )
 
-        db.add(recipe)
-        await db.flush()  # Get recipe.id
+        rows = {model: [] for model in _RECIPE_INSERT_ORDER}
+        recipe_id = RecipeService._add_recipe_rows(
+            rows, recipe_data, owner_id, common_ingredient_ids
+        )
+        await RecipeService._insert_recipe_rows(db, rows)
 
-        # Create ingredients with prep step support
-        if recipe_data.ingredients:
-            # Initialize empty prep step cache (new recipe has no prep steps yet)
-            prep_step_map: dict[str, RecipePrepStep] = {}
+        await db.commit()
 
-            for ing_data in recipe_data.ingredients:
-                # Use create_ingredient to handle prep_step_description
-                await RecipeService.create_ingredient(
-                    db=db,
-                    recipe_id=recipe.id,
-                    ingredient_data=ing_data,
-                    prep_step_map=prep_step_map,
-                )
+        # Load relationships for response
+        recipe = await RecipeService.get_recipe_by_id(db=db, recipe_id=recipe_id)
+        return recipe
 
-        # Create instructions
-        if recipe_data.instructions:
-            for inst_data in recipe_data.instructions:
-                instruction = RecipeInstruction(
-                    recipe_id=recipe.id,
-                    step_number=inst_data.step_number,
-                    description=inst_data.description,
-                    duration_minutes=inst_data.duration_minutes,
-                )
-                db.add(instruction)
+    @staticmethod
+    async def bulk_create_recipes(
+        db: AsyncSession,
+        recipes_data: List[RecipeCreate],
+        owner_id: UUID,
+    ) -> List[UUID]:
+        """Create many recipes in one transaction using bulk INSERTs (for import flows).
 
-        await db.flush()  # Ensure ingredients have IDs
+        Builds every recipe's rows in memory (see _add_recipe_rows), then issues one
+        executemany INSERT per table and a single commit.
 
-        # Create prep steps with ingredient links (legacy direct prep_steps API)
-        if recipe_data.prep_steps:
-            # Query ingredients we just created to build order -> id mapping
-            ing_query = select(RecipeIngredient).where(RecipeIngredient.recipe_id == recipe.id)
-            ing_result = await db.execute(ing_query)
-            created_ingredients = ing_result.scalars().all()
+        Args:
+            db: Database session
+            recipes_data: Recipes to create
+            owner_id: Owner for all created recipes
 
-            ingredient_by_order = {}
-            for ing in created_ingredients:
-                ingredient_by_order[ing.order] = ing.id
+        Returns:
+            IDs of the created recipes, in input order
+        """
+        if not recipes_data:
+            return []
+
+        # Resolve common ingredients across all recipes at once
+        common_ingredient_ids = await RecipeService.resolve_common_ingredients(
+            db,
+            [
+                ing.ingredient_name
+                for recipe_data in recipes_data
+                for ing in recipe_data.ingredients or []
+            ],
+        )
 
-            for prep_data in recipe_data.prep_steps:
-                prep_step = RecipePrepStep(
-                    recipe_id=recipe.id,
-                    description=prep_data.description,
-                    order=prep_data.order,
-                )
-                db.add(prep_step)
-                await db.flush()  # Get prep_step.id
-
-                # Link to ingredients - support both ingredient_orders and ingredient_ids
-                ingredient_ids_to_link = []
-                if prep_data.ingredient_orders:
-                    # Map order values to actual ingredient IDs
-                    for order in prep_data.ingredient_orders:
-                        if order in ingredient_by_order:
-                            ingredient_ids_to_link.append(ingredient_by_order[order])
-                elif prep_data.ingredient_ids:
-                    ingredient_ids_to_link = prep_data.ingredient_ids
-
-                for ing_id in ingredient_ids_to_link:
-                    link = PrepStepIngredient(
-                        prep_step_id=prep_step.id,
-                        recipe_ingredient_id=ing_id,
-                    )
-                    db.add(link)
+        rows = {model: [] for model in _RECIPE_INSERT_ORDER}
+        recipe_ids = [
+            RecipeService._add_recipe_rows(rows, recipe_data, owner_id, common_ingredient_ids)
+            for recipe_data in recipes_data
+        ]
+        await RecipeService._insert_recipe_rows(db, rows)
 
         await db.commit()
-        await db.refresh(recipe)
 
-        # Load relationships for response
-        recipe = await RecipeService.get_recipe_by_id(db=db, recipe_id=recipe.id)
-        return recipe
+        return recipe_ids
+
+    @staticmethod
+    def _add_recipe_rows(
+        rows: dict[type, List[dict]],
+        recipe_data: RecipeCreate,
+        owner_id: UUID,
+        common_ingredient_ids: dict[str, UUID],
+    ) -> UUID:
+        """Build the insert rows for a new recipe and all of its children.
+
+        Appends recipe, ingredient, instruction, prep step, and prep step link rows
+        to ``rows`` (keyed by model). IDs are generated client-side, so children
+        can reference their parents before anything is written.
+
+        Returns:
+            ID of the new recipe
+        """
+        recipe_id = uuid.uuid4()
+        rows[Recipe].append(
+            {
+                "id": recipe_id,
+                "owner_id": owner_id,
+                "name": recipe_data.name,
+                "index_name": recipe_data.index_name,
+                "dish_type": recipe_data.dish_type,
+                "description": recipe_data.description,
+                "prep_time_minutes": recipe_data.prep_time_minutes,
+                "cook_time_minutes": recipe_data.cook_time_minutes,
+                "prep_notes": recipe_data.prep_notes,
+                "postmortem_notes": recipe_data.postmortem_notes,
+                "source_url": recipe_data.source_url,
+            }
+        )
+
+        def new_prep_step(description: str, order: int) -> UUID:
+            prep_step_id = uuid.uuid4()
+            rows[RecipePrepStep].append(
+                {
+                    "id": prep_step_id,
+                    "recipe_id": recipe_id,
+                    "description": description,
+                    "order": order,
+                }
+            )
+            return prep_step_id
+
+        def link(prep_step_id: UUID, ingredient_id: UUID) -> None:
+            rows[PrepStepIngredient].append(
+                {
+                    "id": uuid.uuid4(),
+                    "prep_step_id": prep_step_id,
+                    "recipe_ingredient_id": ingredient_id,
+                }
+            )
+
+        # Ingredients (with prep_step_id / prep_step_description linking)
+        prep_step_map: dict[str, UUID] = {}
+        ingredient_by_order = {}
+        for ing_data in recipe_data.ingredients or []:
+            ingredient_id = uuid.uuid4()
+            ingredient_by_order[ing_data.order] = ingredient_id
+            rows[RecipeIngredient].append(
+                {
+                    "id": ingredient_id,
+                    **RecipeService._ingredient_values(
+                        ing_data,
+                        recipe_id,
+                        common_ingredient_ids.get(ing_data.ingredient_name.strip().lower()),
+                    ),
+                }
+            )
+            prep_step_id = RecipeService._prep_step_target(ing_data, prep_step_map, new_prep_step)
+            if prep_step_id is not None:
+                link(prep_step_id, ingredient_id)
+
+        # Instructions
+        for inst_data in recipe_data.instructions or []:
+            rows[RecipeInstruction].append(
+                {
+                    "id": uuid.uuid4(),
+                    "recipe_id": recipe_id,
+                    "step_number": inst_data.step_number,
+                    "description": inst_data.description,
+                    "duration_minutes": inst_data.duration_minutes,
+                }
+            )
+
+        # Prep steps with ingredient links (legacy direct prep_steps API)
+        for prep_data in recipe_data.prep_steps or []:
+            prep_step_id = new_prep_step(prep_data.description, prep_data.order)
+            for ing_id in RecipeService._prep_step_ingredient_ids(prep_data, ingredient_by_order):
+                link(prep_step_id, ing_id)
+
+        return recipe_id
+
+    @staticmethod
+    async def _insert_recipe_rows(db: AsyncSession, rows: dict[type, List[dict]]) -> None:
+        """Write rows from _add_recipe_rows: one executemany INSERT per table, parents first."""
+        for model in _RECIPE_INSERT_ORDER:
+            if rows[model]:
+                await db.execute(insert(model), rows[model])
 
     @staticmethod
     async def update_recipe(
@@ -265,8 +584,12 @@ class RecipeService:
         if "owner_id" in fields_set:
             recipe.owner_id = recipe_data.owner_id
 
+        # Ingredient order -> id, kept current below for prep_steps' ingredient_orders
+        ingredient_by_order = {ing.order: ing.id for ing in recipe.ingredients}
+
         # Handle ingredients (diff-based: update existing in place, insert new, delete missing)
         if recipe_data.ingredients is not None:
+            ingredient_by_order = {}
             existing_by_id = {ing.id: ing for ing in recipe.ingredients}
             payload_ids = {ing.id for ing in recipe_data.ingredients if ing.id is not None}
 
@@ -278,26 +601,35 @@ class RecipeService:
                     detail=f"Unknown ingredient ids for this recipe: {sorted(str(i) for i in unknown_ids)}",
                 )
 
-            # Delete existing ingredients whose ids aren't in the payload
-            # (cascade also removes their prep_step_links)
-            for ingredient_id in existing_by_id.keys() - payload_ids:
-                await db.delete(existing_by_id[ingredient_id])
-            await db.flush()
+            # Bulk-delete existing ingredients whose ids aren't in the payload,
+            # removing their prep_step_links first
+            removed_ids = existing_by_id.keys() - payload_ids
+            if removed_ids:
+                await db.execute(
+                    delete(PrepStepIngredient)
+                    .where(PrepStepIngredient.recipe_ingredient_id.in_(removed_ids))
+                    .execution_options(synchronize_session="fetch")
+                )
+                await db.execute(
+                    delete(RecipeIngredient)
+                    .where(RecipeIngredient.id.in_(removed_ids))
+                    .execution_options(synchronize_session="fetch")
+                )
 
             # Clean up orphaned prep steps (those with no remaining ingredient links).
             # Using NOT EXISTS is more efficient than LEFT JOIN for this pattern.
-            orphaned_prep_steps_query = select(RecipePrepStep).where(
-                RecipePrepStep.recipe_id == recipe.id,
-                ~exists(
-                    select(1)
-                    .where(PrepStepIngredient.prep_step_id == RecipePrepStep.id)
-                    .correlate(RecipePrepStep)
-                ),
+            await db.execute(
+                delete(RecipePrepStep)
+                .where(
+                    RecipePrepStep.recipe_id == recipe.id,
+                    ~exists(
+                        select(1)
+                        .where(PrepStepIngredient.prep_step_id == RecipePrepStep.id)
+                        .correlate(RecipePrepStep)
+                    ),
+                )
+                .execution_options(synchronize_session=False)
             )
-            orphaned_result = await db.execute(orphaned_prep_steps_query)
-            for orphan in orphaned_result.scalars().all():
-                await db.delete(orphan)
-            await db.flush()
 
             # Fetch surviving prep steps once for relinking/inserting
             existing_prep_steps_query = select(RecipePrepStep).where(
@@ -308,6 +640,17 @@ class RecipeService:
                 step.description: step for step in existing_prep_steps_result.scalars().all()
             }
 
+            # Resolve common ingredients for new or renamed ingredients in one batch
+            common_ingredient_ids = await RecipeService.resolve_common_ingredients(
+                db,
+                [
+                    ing.ingredient_name
+                    for ing in recipe_data.ingredients
+                    if ing.id is None
+                    or existing_by_id[ing.id].ingredient_name != ing.ingredient_name
+                ],
+            )
+
             # Apply updates and inserts in payload order
             for ing_data in recipe_data.ingredients:
                 if ing_data.id is not None:
@@ -315,12 +658,13 @@ class RecipeService:
                     # Re-resolve common ingredient only if name changed (avoids needless lookup)
                     if existing.ingredient_name != ing_data.ingredient_name:
                         existing.ingredient_name = ing_data.ingredient_name
-                        existing.common_ingredient_id = await RecipeService.find_common_ingredient(
-                            db, ing_data.ingredient_name
+                        existing.common_ingredient_id = common_ingredient_ids.get(
+                            ing_data.ingredient_name.strip().lower()
                         )
                     existing.quantity = ing_data.quantity
                     existing.unit = ing_data.unit
                     existing.order = ing_data.order
+                    ingredient_by_order[existing.order] = existing.id
                     existing.prep_note = ing_data.prep_note
                     existing.is_indexed = ing_data.is_indexed
 
@@ -351,19 +695,25 @@ class RecipeService:
                             recipe_ingredient_id=existing.id,
                         ))
                 else:
-                    await RecipeService.create_ingredient(
+                    new_ingredient = await RecipeService.create_ingredient(
                         db=db,
                         recipe_id=recipe.id,
                         ingredient_data=ing_data,
                         prep_step_map=prep_step_map,
+                        common_ingredient_ids=common_ingredient_ids,
+                        commit=False,
+                        verify_recipe=False,
                     )
+                    ingredient_by_order[new_ingredient.order] = new_ingredient.id
 
         # Handle instructions replacement if provided
         if recipe_data.instructions is not None:
-            # Delete existing instructions
-            for instruction in recipe.instructions:
-                await db.delete(instruction)
-            await db.flush()
+            # Bulk-delete existing instructions
+            await db.execute(
+                delete(RecipeInstruction)
+                .where(RecipeInstruction.recipe_id == recipe.id)
+                .execution_options(synchronize_session="fetch")
+            )
 
             # Add new instructions
             for inst_data in recipe_data.instructions:
@@ -377,57 +727,38 @@ class RecipeService:
 
         # Handle prep steps replacement if provided (legacy direct prep_steps API)
         if recipe_data.prep_steps is not None:
-            # Delete existing prep steps and links
-            for prep_step in recipe.prep_steps:
-                await db.delete(prep_step)
-            await db.flush()
-
-            # Query ingredients to build order -> id mapping (for ingredient_orders)
-            ing_query = select(RecipeIngredient).where(RecipeIngredient.recipe_id == recipe.id)
-            ing_result = await db.execute(ing_query)
-            created_ingredients = ing_result.scalars().all()
-
-            ingredient_by_order = {}
-            for ing in created_ingredients:
-                ingredient_by_order[ing.order] = ing.id
+            # Bulk-delete existing prep steps and links
+            existing_prep_step_ids = [prep_step.id for prep_step in recipe.prep_steps]
+            if existing_prep_step_ids:
+                await db.execute(
+                    delete(PrepStepIngredient)
+                    .where(PrepStepIngredient.prep_step_id.in_(existing_prep_step_ids))
+                    .execution_options(synchronize_session="fetch")
+                )
+                await db.execute(
+                    delete(RecipePrepStep)
+                    .where(RecipePrepStep.id.in_(existing_prep_step_ids))
+                    .execution_options(synchronize_session="fetch")
+                )
 
             # Create new prep steps with ingredient links
-            for prep_data in recipe_data.prep_steps:
-                prep_step = RecipePrepStep(
-                    recipe_id=recipe.id,
-                    description=prep_data.description,
-                    order=prep_data.order,
-                )
-                db.add(prep_step)
-                await db.flush()  # Get prep_step.id
-
-                # Link to ingredients - support both ingredient_orders and ingredient_ids
-                ingredient_ids_to_link = []
-                if prep_data.ingredient_orders:
-                    # Map order values to actual ingredient IDs
-                    for order in prep_data.ingredient_orders:
-                        if order in ingredient_by_order:
-                            ingredient_ids_to_link.append(ingredient_by_order[order])
-                elif prep_data.ingredient_ids:
-                    ingredient_ids_to_link = prep_data.ingredient_ids
-
-                for ing_id in ingredient_ids_to_link:
-                    link = PrepStepIngredient(
-                        prep_step_id=prep_step.id,
-                        recipe_ingredient_id=ing_id,
-                    )
-                    db.add(link)
+            await RecipeService._add_prep_steps(
+                db, recipe.id, recipe_data.prep_steps, ingredient_by_order
+            )
 
         await db.commit()
-        await db.refresh(recipe)
 
-        # Reload with relationships if any nested data was updated
+        # Reload with relationships if any nested data was updated. Otherwise the
+        # collections loaded above are still current, so only re-read the
+        # server-generated updated_at (a bare refresh would re-run every selectinload)
         if (
             recipe_data.ingredients is not None
             or recipe_data.instructions is not None
             or recipe_data.prep_steps is not None
         ):
             recipe = await RecipeService.get_recipe_by_id(db=db, recipe_id=recipe.id)
+        else:
+            await db.refresh(recipe, attribute_names=["updated_at"])
 
         return recipe
 
@@ -451,13 +782,13 @@ class RecipeService:
                 detail="Recipe is already retired",
             )
 
-        # Check if recipe is used in any active week templates
-        templates_using_recipe = await RecipeService.check_recipe_usage(
-            db=db,
-            recipe_id=recipe_id,
-        )
-
-        if templates_using_recipe:
+        # Check if recipe is used in any active week templates (cheap EXISTS first;
+        # only fetch template names for the error message when it is)
+        if await RecipeService.has_recipe_usage(db=db, recipe_id=recipe_id):
+            templates_using_recipe = await RecipeService.check_recipe_usage(
+                db=db,
+                recipe_id=recipe_id,
+            )
             template_names = [t["name"] for t in templates_using_recipe]
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -499,6 +830,24 @@ class RecipeService:
 
         return recipe
 
+    @staticmethod
+    async def has_recipe_usage(
+        db: AsyncSession,
+        recipe_id: UUID,
+    ) -> bool:
+        """Check whether any active week template uses this recipe."""
+        from app.models.schedule import WeekTemplate
+
+        query = select(
+            exists()
+            .where(
+                WeekDayAssignment.recipe_id == recipe_id,
+                WeekDayAssignment.week_template_id == WeekTemplate.id,
+                WeekTemplate.retired_at.is_(None),
+            )
+        )
+        return bool(await db.scalar(query))
+
     @staticmethod
     async def check_recipe_usage(
         db: AsyncSession,
@@ -508,8 +857,9 @@ class RecipeService:
         from app.models.schedule import WeekTemplate
 
         # Find all assignments using this recipe in non-retired templates
+        # (only the returned columns, no ORM entities)
         query = (
-            select(WeekTemplate)
+            select(WeekTemplate.id, WeekTemplate.name)
             .join(WeekDayAssignment)
             .where(
                 and_(
@@ -521,14 +871,13 @@ class RecipeService:
         )
 
         result = await db.execute(query)
-        templates = result.scalars().all()
 
         return [
             {
-                "template_id": str(template.id),
-                "name": template.name,
+                "template_id": str(row.id),
+                "name": row.name,
             }
-            for template in templates
+            for row in result.all()
         ]
 
     # ========================================================================
@@ -550,12 +899,143 @@ class RecipeService:
         result = await db.execute(query)
         return result.scalars().all()
 
+    @staticmethod
+    def _build_ingredient(
+        ingredient_data: RecipeIngredientCreate,
+        recipe_id: UUID,
+        common_ingredient_id: Optional[UUID],
+        prep_step_map: dict[str, RecipePrepStep],
+    ) -> tuple[RecipeIngredient, Optional[UUID | RecipePrepStep]]:
+        """Build an unpersisted ingredient and resolve the prep step it links to.
+
+        New prep steps (from prep_step_description) are created in memory and added
+        to prep_step_map; the caller is responsible for adding them to the session.
+
+        Returns:
+            Tuple of (ingredient, prep step target), where the target is an existing
+            prep step ID, a RecipePrepStep from prep_step_map, or None if unlinked
+        """
+        ingredient = RecipeIngredient(
+            **RecipeService._ingredient_values(ingredient_data, recipe_id, common_ingredient_id)
+        )
+        prep_step_target = RecipeService._prep_step_target(
+            ingredient_data,
+            prep_step_map,
+            lambda description, order: RecipePrepStep(
+                recipe_id=recipe_id,
+                description=description,
+                order=order,
+            ),
+        )
+        return ingredient, prep_step_target
+
+    @staticmethod
+    def _ingredient_values(
+        ingredient_data: RecipeIngredientCreate,
+        recipe_id: UUID,
+        common_ingredient_id: Optional[UUID],
+    ) -> dict:
+        """Column values for a new ingredient (shared by the ORM and bulk row paths)."""
+        return {
+            "recipe_id": recipe_id,
+            "ingredient_name": ingredient_data.ingredient_name,
+            "quantity": ingredient_data.quantity,
+            "unit": ingredient_data.unit,
+            "order": ingredient_data.order,
+            "common_ingredient_id": common_ingredient_id,  # Auto-matched or None
+            "prep_note": ingredient_data.prep_note,
+            "is_indexed": ingredient_data.is_indexed,
+        }
+
+    @staticmethod
+    def _prep_step_target(
+        ingredient_data: RecipeIngredientCreate,
+        prep_step_map: dict[str, Any],
+        new_prep_step: Callable[[str, int], Any],
+    ) -> Any:
+        """Resolve the prep step an ingredient links to.
+
+        An explicit prep_step_id links to an existing step. Otherwise ingredients
+        with the same prep_step_description share one step: the first creates it
+        with new_prep_step(description, order) and it's cached in prep_step_map.
+
+        Returns:
+            The prep step ID or the prep_step_map entry, or None if unlinked
+        """
+        if ingredient_data.prep_step_id:
+            # Link to existing prep step
+            return ingredient_data.prep_step_id
+
+        if ingredient_data.prep_step_description:
+            # Reuse prep step from cache, or create a new one for subsequent ingredients
+            description = ingredient_data.prep_step_description.strip()
+            if description not in prep_step_map:
+                prep_step_map[description] = new_prep_step(description, len(prep_step_map))
+            return prep_step_map[description]
+
+        return None
+
+    @staticmethod
+    def _prep_step_ingredient_ids(
+        prep_data: RecipePrepStepCreate,
+        ingredient_by_order: dict[int, UUID],
+    ) -> List[UUID]:
+        """Ingredients a legacy prep step links to: ingredient_orders (mapped through
+        ingredient_by_order) if given, otherwise ingredient_ids."""
+        if prep_data.ingredient_orders:
+            return [
+                ingredient_by_order[order]
+                for order in prep_data.ingredient_orders
+                if order in ingredient_by_order
+            ]
+        return prep_data.ingredient_ids
+
+    @staticmethod
+    def _prep_step_target_id(prep_step_target: UUID | RecipePrepStep) -> UUID:
+        """Get the prep step ID for a target returned by _build_ingredient (after flush)."""
+        if isinstance(prep_step_target, RecipePrepStep):
+            return prep_step_target.id
+        return prep_step_target
+
+    @staticmethod
+    async def _add_prep_steps(
+        db: AsyncSession,
+        recipe_id: UUID,
+        prep_steps_data: List[RecipePrepStepCreate],
+        ingredient_by_order: dict[int, UUID],
+    ) -> None:
+        """Add prep steps (legacy direct prep_steps API) and link them to ingredients.
+
+        ingredient_by_order maps ingredient order -> id for ``ingredient_orders`` and
+        comes from ingredients the caller already has in memory.
+        """
+        prep_steps = [
+            RecipePrepStep(
+                recipe_id=recipe_id,
+                description=prep_data.description,
+                order=prep_data.order,
+            )
+            for prep_data in prep_steps_data
+        ]
+        db.add_all(prep_steps)
+        await db.flush()  # Get prep step IDs
+
+        for prep_step, prep_data in zip(prep_steps, prep_steps_data, strict=True):
+            ingredient_ids = RecipeService._prep_step_ingredient_ids(prep_data, ingredient_by_order)
+            db.add_all(
+                PrepStepIngredient(prep_step_id=prep_step.id, recipe_ingredient_id=ing_id)
+                for ing_id in ingredient_ids
+            )
+
     @staticmethod
     async def create_ingredient(
         db: AsyncSession,
         recipe_id: UUID,
         ingredient_data: RecipeIngredientCreate,
         prep_step_map: dict[str, RecipePrepStep],
+        common_ingredient_ids: Optional[dict[str, UUID]] = None,
+        commit: bool = True,
+        verify_recipe: bool = True,
     ) -> RecipeIngredient:
         """Add an ingredient to a recipe.
 
@@ -566,76 +1046,57 @@ class RecipeService:
             prep_step_map: Cache of existing prep steps by description.
                           Will be updated with any newly created prep steps
                           to prevent duplicates.
+            common_ingredient_ids: Optional pre-resolved lowercased name -> common
+                          ingredient ID map (see resolve_common_ingredients).
+                          When omitted, the name is looked up individually.
+            commit: Commit and refresh the ingredient. Pass False when called as
+                          part of a larger write that commits on its own.
+            verify_recipe: Check that the recipe exists. Pass False when the
+                          caller has already loaded it in this transaction.
 
         Returns:
             Created RecipeIngredient instance
         """
-        # Verify recipe exists
-        recipe = await RecipeService.get_recipe_by_id(db=db, recipe_id=recipe_id)
-        if not recipe:
+        # Verify recipe exists (existence check only, no relationship loading)
+        if verify_recipe and not await db.scalar(select(exists().where(Recipe.id == recipe_id))):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Recipe not found",
             )
 
         # Try to find matching common ingredient
-        common_ingredient_id = await RecipeService.find_common_ingredient(
-            db, ingredient_data.ingredient_name
-        )
+        if common_ingredient_ids is not None:
+            common_ingredient_id = common_ingredient_ids.get(
+                ingredient_data.ingredient_name.strip().lower()
+            )
+        else:
+            common_ingredient_id = await RecipeService.find_common_ingredient(
+                db, ingredient_data.ingredient_name
+            )
 
-        ingredient = RecipeIngredient(
+        ingredient, prep_step_target = RecipeService._build_ingredient(
+            ingredient_data=ingredient_data,
             recipe_id=recipe_id,
-            ingredient_name=ingredient_data.ingredient_name,
-            quantity=ingredient_data.quantity,
-            unit=ingredient_data.unit,
-            order=ingredient_data.order,
-            common_ingredient_id=common_ingredient_id,  # Auto-matched or None
-            prep_note=ingredient_data.prep_note,
-            is_indexed=ingredient_data.is_indexed,
+            common_ingredient_id=common_ingredient_id,
+            prep_step_map=prep_step_map,
         )
 
         db.add(ingredient)
-        await db.flush()  # Get ingredient.id before linking prep steps
+        if isinstance(prep_step_target, RecipePrepStep):
+            db.add(prep_step_target)
+        await db.flush()  # Get ingredient.id (and new prep step id) before linking
 
-        # Handle prep step linking
-        if ingredient_data.prep_step_id:
-            # Link to existing prep step
+        # Link ingredient to prep step (whether new or existing)
+        if prep_step_target is not None:
             link = PrepStepIngredient(
-                prep_step_id=ingredient_data.prep_step_id,
+                prep_step_id=RecipeService._prep_step_target_id(prep_step_target),
                 recipe_ingredient_id=ingredient.id,
             )
             db.add(link)
-        elif ingredient_data.prep_step_description:
-            # Check if prep step already exists in our cache
-            description = ingredient_data.prep_step_description.strip()
 
-            if description in prep_step_map:
-                # Reuse existing prep step from cache
-                prep_step_id = prep_step_map[description].id
-            else:
-                # Create new prep step
-                next_order = len(prep_step_map)
-                new_prep_step = RecipePrepStep(
-                    recipe_id=recipe_id,
-                    description=description,
-                    order=next_order,
-                )
-                db.add(new_prep_step)
-                await db.flush()
-                prep_step_id = new_prep_step.id
-
-                # Add to cache for subsequent ingredients
-                prep_step_map[description] = new_prep_step
-
-            # Link ingredient to prep step (whether new or existing)
-            link = PrepStepIngredient(
-                prep_step_id=prep_step_id,
-                recipe_ingredient_id=ingredient.id,
-            )
-            db.add(link)
-
-        await db.commit()
-        await db.refresh(ingredient)
+        if commit:
+            await db.commit()
+            await db.refresh(ingredient)
 
         return ingredient
 
@@ -664,9 +1125,7 @@ class RecipeService:
         ingredient_data: RecipeIngredientUpdate,
     ) -> RecipeIngredient:
         """Update a recipe ingredient."""
-        query = select(RecipeIngredient).where(RecipeIngredient.id == ingredient_id)
-        result = await db.execute(query)
-        ingredient = result.scalar_one_or_none()
+        ingredient = await db.get(RecipeIngredient, ingredient_id)
 
         if not ingredient:
             raise HTTPException(
@@ -692,52 +1151,27 @@ class RecipeService:
             ingredient.is_indexed = ingredient_data.is_indexed
 
         # Handle prep step linking/unlinking
+        relink = False
+        new_prep_step_id = None
         if hasattr(ingredient_data, "prep_step_id"):
-            # Get current prep step links
-            current_links_query = select(PrepStepIngredient).where(
-                PrepStepIngredient.recipe_ingredient_id == ingredient_id
-            )
-            current_links_result = await db.execute(current_links_query)
-            current_links = current_links_result.scalars().all()
-            old_prep_step_ids = [link.prep_step_id for link in current_links]
-
-            # Remove all existing links
-            for link in current_links:
-                await db.delete(link)
-
-            # Add new link if provided
-            if ingredient_data.prep_step_id is not None:
-                new_link = PrepStepIngredient(
-                    prep_step_id=ingredient_data.prep_step_id,
-                    recipe_ingredient_id=ingredient_id,
-                )
-                db.add(new_link)
+            # Link to an existing prep step, or unlink when None
+            relink = True
+            new_prep_step_id = ingredient_data.prep_step_id
         elif (
             hasattr(ingredient_data, "prep_step_description")
             and ingredient_data.prep_step_description
         ):
             # Create new prep step and link
-            # Get current links to remove
-            current_links_query = select(PrepStepIngredient).where(
-                PrepStepIngredient.recipe_ingredient_id == ingredient_id
-            )
-            current_links_result = await db.execute(current_links_query)
-            current_links = current_links_result.scalars().all()
-            old_prep_step_ids = [link.prep_step_id for link in current_links]
-
-            # Remove existing links
-            for link in current_links:
-                await db.delete(link)
-
-            # Get recipe_id from ingredient
+            relink = True
             recipe_id = ingredient.recipe_id
 
-            # Get next order number
-            prep_steps_query = select(RecipePrepStep).where(RecipePrepStep.recipe_id == recipe_id)
-            existing_prep_steps = await db.execute(prep_steps_query)
-            next_order = len(existing_prep_steps.scalars().all())
+            # Get next order number (MAX + 1 stays correct even if orders have gaps)
+            next_order = await db.scalar(
+                select(func.coalesce(func.max(RecipePrepStep.order), -1) + 1).where(
+                    RecipePrepStep.recipe_id == recipe_id
+                )
+            )
 
-            # Create new prep step
             new_prep_step = RecipePrepStep(
                 recipe_id=recipe_id,
                 description=ingredient_data.prep_step_description,
@@ -745,32 +1179,40 @@ class RecipeService:
             )
             db.add(new_prep_step)
             await db.flush()
-
-            # Link to new prep step
-            new_link = PrepStepIngredient(
-                prep_step_id=new_prep_step.id,
-                recipe_ingredient_id=ingredient_id,
+            new_prep_step_id = new_prep_step.id
+
+        if relink:
+            # Remove existing links, getting back the prep steps they pointed at
+            removed_links = await db.execute(
+                delete(PrepStepIngredient)
+                .where(PrepStepIngredient.recipe_ingredient_id == ingredient_id)
+                .returning(PrepStepIngredient.prep_step_id)
             )
-            db.add(new_link)
+            old_prep_step_ids = list(removed_links.scalars().all())
 
-        await db.flush()
+            if new_prep_step_id is not None:
+                await db.execute(
+                    insert(PrepStepIngredient).values(
+                        prep_step_id=new_prep_step_id,
+                        recipe_ingredient_id=ingredient_id,
+                    )
+                )
 
         # Clean up orphaned prep steps (prep steps with no linked ingredients)
-        for old_prep_step_id in old_prep_step_ids:
-            # Check if this prep step still has any links
-            links_check = select(PrepStepIngredient).where(
-                PrepStepIngredient.prep_step_id == old_prep_step_id
-            )
-            remaining_links = await db.execute(links_check)
-            if remaining_links.scalars().first() is None:
-                # No more links - delete the orphaned prep step
-                prep_step_query = select(RecipePrepStep).where(
-                    RecipePrepStep.id == old_prep_step_id
+        # in a single correlated DELETE
+        if old_prep_step_ids:
+            await db.execute(
+                delete(RecipePrepStep)
+                .where(
+                    RecipePrepStep.id.in_(old_prep_step_ids),
+                    ~exists(
+                        select(1)
+                        .where(PrepStepIngredient.prep_step_id == RecipePrepStep.id)
+                        .correlate(RecipePrepStep)
+                    ),
                 )
-                prep_step_result = await db.execute(prep_step_query)
-                prep_step = prep_step_result.scalar_one_or_none()
-                if prep_step:
-                    await db.delete(prep_step)
+                .execution_options(synchronize_session=False)
+            )
 
         await db.commit()
         await db.refresh(ingredient)
@@ -783,9 +1225,7 @@ class RecipeService:
         ingredient_id: UUID,
     ) -> None:
         """Delete a recipe ingredient."""
-        query = select(RecipeIngredient).where(RecipeIngredient.id == ingredient_id)
-        result = await db.execute(query)
-        ingredient = result.scalar_one_or_none()
+        ingredient = await db.get(RecipeIngredient, ingredient_id)
 
         if not ingredient:
             raise HTTPException(
@@ -850,9 +1290,7 @@ class RecipeService:
         instruction_data: RecipeInstructionUpdate,
     ) -> RecipeInstruction:
         """Update a recipe instruction."""
-        query = select(RecipeInstruction).where(RecipeInstruction.id == instruction_id)
-        result = await db.execute(query)
-        instruction = result.scalar_one_or_none()
+        instruction = await db.get(RecipeInstruction, instruction_id)
 
         if not instruction:
             raise HTTPException(
@@ -879,17 +1317,17 @@ class RecipeService:
         instruction_id: UUID,
     ) -> None:
         """Delete a recipe instruction."""
-        query = select(RecipeInstruction).where(RecipeInstruction.id == instruction_id)
-        result = await db.execute(query)
-        instruction = result.scalar_one_or_none()
+        # One DELETE; its rowcount tells a missing instruction apart
+        result = await db.execute(
+            delete(RecipeInstruction).where(RecipeInstruction.id == instruction_id)
+        )
 
-        if not instruction:
+        if result.rowcount == 0:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Instruction not found",
             )
 
-        await db.delete(instruction)
         await db.commit()
 
     # ========================================================================
@@ -912,6 +1350,23 @@ class RecipeService:
         result = await db.execute(query)
         return result.scalars().all()
 
+    @staticmethod
+    async def _recipe_ingredient_ids(
+        db: AsyncSession,
+        recipe_id: UUID,
+        ingredient_ids: List[UUID],
+    ) -> set[UUID]:
+        """Return the subset of ingredient_ids that belong to the recipe."""
+        if not ingredient_ids:
+            return set()
+        result = await db.execute(
+            select(RecipeIngredient.id).where(
+                RecipeIngredient.recipe_id == recipe_id,
+                RecipeIngredient.id.in_(ingredient_ids),
+            )
+        )
+        return set(result.scalars().all())
+
     @staticmethod
     async def create_prep_step(
         db: AsyncSession,
@@ -920,8 +1375,8 @@ class RecipeService:
     ) -> RecipePrepStep:
         """Add a prep step to a recipe."""
         # Verify recipe exists
-        recipe = await RecipeService.get_recipe_by_id(db=db, recipe_id=recipe_id)
-        if not recipe:
+        recipe_exists = await db.scalar(select(exists().where(Recipe.id == recipe_id)))
+        if not recipe_exists:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Recipe not found",
@@ -936,38 +1391,41 @@ class RecipeService:
         db.add(prep_step)
         await db.flush()
 
-        # Build ingredient ID set for validation
-        ingredient_ids_set = {ing.id for ing in recipe.ingredients}
-
-        # Link to ingredients
+        # Link to ingredients, resolving/validating only the requested ones in SQL
         ingredient_ids_to_link = []
         if prep_step_data.ingredient_orders:
-            ingredient_by_order = {ing.order: ing.id for ing in recipe.ingredients}
+            ingredient_rows = await db.execute(
+                select(RecipeIngredient.order, RecipeIngredient.id).where(
+                    RecipeIngredient.recipe_id == recipe_id,
+                    RecipeIngredient.order.in_(prep_step_data.ingredient_orders),
+                )
+            )
+            ingredient_by_order = dict(ingredient_rows.all())
             for order in prep_step_data.ingredient_orders:
                 if order in ingredient_by_order:
                     ingredient_ids_to_link.append(ingredient_by_order[order])
         elif prep_step_data.ingredient_ids:
+            ingredient_ids_set = await RecipeService._recipe_ingredient_ids(
+                db, recipe_id, prep_step_data.ingredient_ids
+            )
             ingredient_ids_to_link = [
                 ing_id for ing_id in prep_step_data.ingredient_ids if ing_id in ingredient_ids_set
             ]
 
-        for ing_id in ingredient_ids_to_link:
-            link = PrepStepIngredient(
-                prep_step_id=prep_step.id,
-                recipe_ingredient_id=ing_id,
+        if ingredient_ids_to_link:
+            await db.execute(
+                insert(PrepStepIngredient),
+                [
+                    {"prep_step_id": prep_step.id, "recipe_ingredient_id": ing_id}
+                    for ing_id in ingredient_ids_to_link
+                ],
             )
-            db.add(link)
 
         await db.commit()
 
-        # Reload with relationships
-        query = (
-            select(RecipePrepStep)
-            .where(RecipePrepStep.id == prep_step.id)
-            .options(selectinload(RecipePrepStep.ingredient_links))
-        )
-        result = await db.execute(query)
-        return result.scalar_one()
+        # Load the links (inserted outside the unit of work) onto the new prep step
+        await db.refresh(prep_step, ["ingredient_links"])
+        return prep_step
 
     @staticmethod
     async def update_prep_step(
@@ -976,13 +1434,8 @@ class RecipeService:
         prep_step_data: RecipePrepStepUpdate,
     ) -> RecipePrepStep:
         """Update a recipe prep step."""
-        query = (
-            select(RecipePrepStep)
-            .where(RecipePrepStep.id == prep_step_id)
-            .options(selectinload(RecipePrepStep.ingredient_links))
-        )
-        result = await db.execute(query)
-        prep_step = result.scalar_one_or_none()
+        # ingredient_links is loaded once by the refresh at the end
+        prep_step = await db.get(RecipePrepStep, prep_step_id)
 
         if not prep_step:
             raise HTTPException(
@@ -1002,20 +1455,20 @@ class RecipeService:
             await db.execute(
                 delete(PrepStepIngredient).where(PrepStepIngredient.prep_step_id == prep_step.id)
             )
-            await db.flush()
 
-            # Get recipe to validate ingredient IDs
-            recipe = await RecipeService.get_recipe_by_id(db=db, recipe_id=prep_step.recipe_id)
-            ingredient_ids_set = {ing.id for ing in recipe.ingredients}
+            # Keep only IDs that belong to this prep step's recipe
+            ingredient_ids_set = await RecipeService._recipe_ingredient_ids(
+                db, prep_step.recipe_id, prep_step_data.ingredient_ids
+            )
 
             # Add new links
-            for ing_id in prep_step_data.ingredient_ids:
-                if ing_id in ingredient_ids_set:
-                    link = PrepStepIngredient(
-                        prep_step_id=prep_step.id,
-                        recipe_ingredient_id=ing_id,
-                    )
-                    db.add(link)
+            link_rows = [
+                {"prep_step_id": prep_step.id, "recipe_ingredient_id": ing_id}
+                for ing_id in prep_step_data.ingredient_ids
+                if ing_id in ingredient_ids_set
+            ]
+            if link_rows:
+                await db.execute(insert(PrepStepIngredient), link_rows)
 
         await db.commit()
 
@@ -1029,17 +1482,19 @@ class RecipeService:
         prep_step_id: UUID,
     ) -> None:
         """Delete a recipe prep step."""
-        query = select(RecipePrepStep).where(RecipePrepStep.id == prep_step_id)
-        result = await db.execute(query)
-        prep_step = result.scalar_one_or_none()
+        # Delete the links explicitly rather than relying on the FK cascade, then the
+        # step itself; its rowcount tells a missing prep step apart
+        await db.execute(
+            delete(PrepStepIngredient).where(PrepStepIngredient.prep_step_id == prep_step_id)
+        )
+        result = await db.execute(delete(RecipePrepStep).where(RecipePrepStep.id == prep_step_id))
 
-        if not prep_step:
+        if result.rowcount == 0:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Prep step not found",
             )
 
-        await db.delete(prep_step)
         await db.commit()
 
     # ========================================================================
@@ -1047,14 +1502,26 @@ class RecipeService:
     # ========================================================================
 
     @staticmethod
-    async def import_recipe_preview(url: str) -> RecipeImportPreviewResponse:
+    def clear_import_preview_cache() -> None:
+        """Drop all cached recipe import previews."""
+        _import_preview_cache.clear()
+
+    @staticmethod
+    async def import_recipe_preview(
+        url: str,
+        use_cache: bool = True,
+    ) -> RecipeImportPreviewResponse:
         """Import and preview recipe from URL without saving to database.
 
         Attempts to scrape from 551 supported sites first, then falls back to
-        generic schema.org parsing for unsupported sites.
+        generic schema.org parsing for unsupported sites. Successful previews
+        are cached in-process for a few minutes, and concurrent previews of the
+        same url share one scrape.
 
         Args:
             url: The URL to scrape the recipe from
+            use_cache: Return a cached preview if one is fresh. Pass False to
+                       always scrape (the new result is still cached).
 
         Returns:
             RecipeImportPreviewResponse with scraped data
@@ -1062,17 +1529,74 @@ class RecipeService:
         Raises:
             HTTPException: If website not supported or scraping fails
         """
-        scraper = None
+        if use_cache:
+            entry = _import_preview_cache.get(url)
+            if entry is not None:
+                expires_at, preview = entry
+                if expires_at > time.monotonic():
+                    _import_preview_cache.move_to_end(url)
+                    return preview.model_copy(deep=True)
+                del _import_preview_cache[url]
+
+        # Join a scrape of the same url that is already running. Check-and-set has
+        # no await in between, so it can't race on the event loop.
+        inflight = _import_preview_inflight.get(url)
+        if inflight is None:
+            inflight = asyncio.ensure_future(RecipeService._scrape_and_cache_preview(url))
+            _import_preview_inflight[url] = inflight
+
+            def _forget(done: asyncio.Future) -> None:
+                if _import_preview_inflight.get(url) is done:
+                    del _import_preview_inflight[url]
+
+            inflight.add_done_callback(_forget)
+
+        # Shield so one cancelled caller doesn't cancel the scrape for the others
+        preview = await asyncio.shield(inflight)
+        return preview.model_copy(deep=True)
+
+    @staticmethod
+    async def _scrape_and_cache_preview(url: str) -> RecipeImportPreviewResponse:
+        """Scrape a recipe preview and store it in the preview cache."""
+        preview = await RecipeService._scrape_recipe_preview(url)
+
+        _import_preview_cache[url] = (time.monotonic() + IMPORT_PREVIEW_CACHE_TTL_SECONDS, preview)
+        _import_preview_cache.move_to_end(url)
+        if len(_import_preview_cache) > IMPORT_PREVIEW_CACHE_SIZE:
+            _import_preview_cache.popitem(last=False)
+
+        return preview
+
+    @staticmethod
+    async def _scrape_recipe_preview(url: str) -> RecipeImportPreviewResponse:
+        """Fetch and parse a recipe page into a preview (uncached)."""
+        try:
+            html = await _fetch_html(url)
+        except httpx.HTTPError as e:
+            logger.warning(f"Failed to fetch recipe page {url}: {e}")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Could not fetch recipe page: {e}",
+            ) from e
+
+        # Parsing and extraction are synchronous BeautifulSoup/regex work; run them
+        # all in one worker thread hop so the event loop keeps serving requests
+        return await asyncio.to_thread(RecipeService._parse_recipe_preview, html, url)
+
+    @staticmethod
+    def _parse_recipe_preview(html: str, url: str) -> RecipeImportPreviewResponse:
+        """Parse a fetched recipe page into a preview (blocking; run off the event loop)."""
         used_fallback = False
 
         try:
             # Try supported sites first
-            scraper = scrape_me(url)
+            scraper = scrape_html(html, org_url=url)
         except WebsiteNotImplementedError:
-            # Fallback to generic schema.org parsing for unsupported sites
+            # Fallback to generic schema.org parsing for unsupported sites,
+            # reusing the page we already downloaded
             logger.info(f"Site not in supported list, trying schema.org fallback for {url}")
             try:
-                scraper = scrape_html(None, url, online=True, supported_only=False)
+                scraper = scrape_html(html, org_url=url, supported_only=False)
                 used_fallback = True
             except Exception as fallback_error:
                 logger.error(f"Fallback scraping failed for {url}: {fallback_error}")
@@ -1083,86 +1607,68 @@ class RecipeService:
 
         try:
             # Parse ingredients
-            ingredients = []
-            for idx, ingredient_line in enumerate(scraper.ingredients()):
-                quantity, unit, ingredient_name = parse_ingredient_line(ingredient_line)
-                ingredients.append(
-                    RecipeImportPreviewIngredient(
-                        ingredient_name=ingredient_name,
-                        quantity=quantity,
-                        unit=unit,
-                    )
+            ingredients = [
+                RecipeImportPreviewIngredient(
+                    ingredient_name=ingredient_name,
+                    quantity=quantity,
+                    unit=unit,
+                )
+                for quantity, unit, ingredient_name in map(
+                    parse_ingredient_line, scraper.ingredients()
                 )
+            ]
 
             # Parse instructions
-            instructions = []
             instruction_list = scraper.instructions_list()
             if not instruction_list:
                 # Fallback to single instruction string if list not available
                 instruction_text = scraper.instructions()
                 if instruction_text:
                     # Split by newlines or numbers
-                    import re
+                    steps = _INSTRUCTION_SPLIT_RE.split(instruction_text)
+                    instruction_list = [step for step in map(str.strip, steps) if step]
 
-                    steps = re.split(r"\n+|\d+\.\s*", instruction_text)
-                    instruction_list = [s.strip() for s in steps if s.strip()]
-
-            for idx, step in enumerate(instruction_list, 1):
-                instructions.append(
-                    RecipeImportPreviewInstruction(
-                        step_number=idx,
-                        description=step.strip(),
-                    )
+            instructions = [
+                RecipeImportPreviewInstruction(
+                    step_number=idx,
+                    description=step.strip(),
                 )
+                for idx, step in enumerate(instruction_list, 1)
+            ]
 
-            # Extract times (recipe-scrapers returns minutes as int or None)
-            prep_time = None
-            try:
-                prep_time = scraper.prep_time()
-            except (AttributeError, NotImplementedError):
-                logger.debug(f"Prep time method not available for {url}")
-            except Exception as e:
-                logger.warning(f"Failed to extract prep time from {url}: {e}")
-
-            cook_time = None
-            try:
-                cook_time = scraper.cook_time()
-            except (AttributeError, NotImplementedError):
-                logger.debug(f"Cook time method not available for {url}")
-            except Exception as e:
-                logger.warning(f"Failed to extract cook time from {url}: {e}")
-
-            # Get description if available
-            description = None
-            try:
-                desc = scraper.description()
-                # Only use description if it's not empty
-                if desc and desc.strip():
-                    description = desc.strip()
-            except (AttributeError, NotImplementedError):
-                # Method not available for this scraper
-                logger.debug(f"Description method not available for {url}")
-            except Exception as e:
-                # Other error accessing description
-                logger.warning(f"Failed to extract description from {url}: {e}")
-
-            return RecipeImportPreviewResponse(
-                name=scraper.title(),
-                dish_type="dinner",  # Default
-                description=description,
-                prep_time_minutes=prep_time,
-                cook_time_minutes=cook_time,
-                source_url=url,
-                ingredients=ingredients,
-                instructions=instructions,
-            )
+            name = scraper.title()
 
-        except Exception as e:
-            logger.error(f"Failed to parse recipe from {url}: {e}")
+        except (
+            RecipeScrapersExceptions,
+            KeyError,
+            AttributeError,
+            ValueError,
+            TypeError,
+        ) as e:
+            logger.exception("Failed to parse recipe from %s", url)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to parse recipe: {str(e)}",
-            )
+                detail=f"Failed to parse recipe: {e}",
+            ) from e
+
+        # Extract optional metadata (recipe-scrapers returns minutes as int or None)
+        prep_time = _scrape_optional(scraper, "prep_time", url)
+        cook_time = _scrape_optional(scraper, "cook_time", url)
+        # Only use description if it's not empty
+        description = _scrape_optional(
+            scraper, "description", url, lambda desc: desc.strip() or None
+        )
+
+        return RecipeImportPreviewResponse(
+            name=name,
+            dish_type="dinner",  # Default
+            description=description,
+            prep_time_minutes=prep_time,
+            cook_time_minutes=cook_time,
+            source_url=url,
+            ingredients=ingredients,
+            instructions=instructions,
+        )
 
     @staticmethod
     async def reimport_recipe(
@@ -1181,8 +1687,9 @@ class RecipeService:
         Raises:
             HTTPException: If recipe not found, no source_url, or scraping fails
         """
-        # Get existing recipe
-        recipe = await RecipeService.get_recipe_by_id(db=db, recipe_id=recipe_id)
+        # Get existing recipe. Its collections are replaced with set-based statements
+        # below, so only the row itself is needed here.
+        recipe = await db.get(Recipe, recipe_id)
         if not recipe:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -1195,8 +1702,8 @@ class RecipeService:
                 detail="Recipe has no source URL to re-import from",
             )
 
-        # Scrape fresh data
-        preview = await RecipeService.import_recipe_preview(recipe.source_url)
+        # Scrape fresh data (the point of a re-import is to pick up source changes)
+        preview = await RecipeService.import_recipe_preview(recipe.source_url, use_cache=False)
 
         # Update recipe fields (preserve user edits to postmortem_notes and owner_id)
         recipe.name = preview.name
@@ -1205,40 +1712,54 @@ class RecipeService:
         recipe.cook_time_minutes = preview.cook_time_minutes
         # Note: Don't update dish_type - user may have customized it
 
-        # Delete existing ingredients and instructions
-        for ingredient in recipe.ingredients:
-            await db.delete(ingredient)
-        for instruction in recipe.instructions:
-            await db.delete(instruction)
+        # Bulk-delete existing ingredients (and their prep step links) and instructions
+        recipe_ingredient_ids = select(RecipeIngredient.id).where(
+            RecipeIngredient.recipe_id == recipe.id
+        )
+        await db.execute(
+            delete(PrepStepIngredient)
+            .where(PrepStepIngredient.recipe_ingredient_id.in_(recipe_ingredient_ids))
+            .execution_options(synchronize_session="fetch")
+        )
+        await db.execute(
+            delete(RecipeIngredient)
+            .where(RecipeIngredient.recipe_id == recipe.id)
+            .execution_options(synchronize_session="fetch")
+        )
+        await db.execute(
+            delete(RecipeInstruction)
+            .where(RecipeInstruction.recipe_id == recipe.id)
+            .execution_options(synchronize_session="fetch")
+        )
 
-        await db.flush()
+        # Add new ingredients and instructions with one bulk write per table
+        ingredient_rows = [
+            {
+                "recipe_id": recipe.id,
+                "ingredient_name": ing_data.ingredient_name,
+                "quantity": ing_data.quantity,
+                "unit": ing_data.unit,
+                "order": idx,
+                "is_indexed": False,
+            }
+            for idx, ing_data in enumerate(preview.ingredients)
+        ]
+        await _insert_rows(db, RecipeIngredient, ingredient_rows)
 
-        # Add new ingredients
-        for idx, ing_data in enumerate(preview.ingredients):
-            ingredient = RecipeIngredient(
-                recipe_id=recipe.id,
-                ingredient_name=ing_data.ingredient_name,
-                quantity=ing_data.quantity,
-                unit=ing_data.unit,
-                order=idx,
-            )
-            db.add(ingredient)
-
-        # Add new instructions
-        for inst_data in preview.instructions:
-            instruction = RecipeInstruction(
-                recipe_id=recipe.id,
-                step_number=inst_data.step_number,
-                description=inst_data.description,
-            )
-            db.add(instruction)
+        instruction_rows = [
+            {
+                "recipe_id": recipe.id,
+                "step_number": inst_data.step_number,
+                "description": inst_data.description,
+            }
+            for inst_data in preview.instructions
+        ]
+        await _insert_rows(db, RecipeInstruction, instruction_rows)
 
         await db.commit()
-        await db.refresh(recipe)
 
-        # Reload with relationships
-        recipe = await RecipeService.get_recipe_by_id(db=db, recipe_id=recipe.id)
-        return recipe
+        # One reload re-reads the row (updated_at included) and the new collections
+        return await RecipeService.get_recipe_by_id(db=db, recipe_id=recipe.id)
 
     # ========================================================================
     # Recipe Index
@@ -1265,86 +1786,94 @@ class RecipeService:
         """
         from collections import defaultdict
 
-        # Query all recipes with indexed ingredients
-        query = select(Recipe).options(
-            selectinload(Recipe.ingredients).selectinload(RecipeIngredient.common_ingredient)
+        # One flat projection: a row per (recipe, indexed ingredient), or a single row
+        # with a NULL ingredient_key for recipes without indexed ingredients. Only the
+        # needed columns come back as plain rows, so no ORM objects are built.
+        ingredient_key = func.coalesce(CommonIngredient.name, RecipeIngredient.ingredient_name)
+        query = (
+            select(
+                Recipe.id,
+                Recipe.name,
+                Recipe.index_name,
+                Recipe.dish_type,
+                ingredient_key.label("ingredient_key"),
+            )
+            .outerjoin(
+                RecipeIngredient,
+                and_(
+                    RecipeIngredient.recipe_id == Recipe.id,
+                    RecipeIngredient.is_indexed.is_(True),
+                ),
+            )
+            .outerjoin(
+                CommonIngredient,
+                CommonIngredient.id == RecipeIngredient.common_ingredient_id,
+            )
         )
 
         if not include_retired:
             query = query.where(Recipe.retired_at.is_(None))
 
-        result = await db.execute(query)
-        recipes = result.scalars().all()
-
-        # Build two structures:
-        # 1. Recipes grouped by ingredient
-        ingredient_to_recipes = defaultdict(list)
-        # 2. Track which recipes have indexed ingredients
-        recipes_with_indexed_ingredients = set()
-
-        for recipe in recipes:
-            for ingredient in recipe.ingredients:
-                if ingredient.is_indexed:
-                    recipes_with_indexed_ingredients.add(recipe.id)
-
-                    # Use common_ingredient.name if available, otherwise raw ingredient_name
-                    ingredient_key = (
-                        ingredient.common_ingredient.name
-                        if ingredient.common_ingredient
-                        else ingredient.ingredient_name
-                    )
+        # Order rows by the name of the index entry they belong to (the ingredient,
+        # or the recipe itself when standalone) so entries come out already sorted.
+        # On equal names ingredient entries come first; recipes within an
+        # ingredient entry are alphabetical.
+        query = query.order_by(
+            func.lower(func.coalesce(ingredient_key, Recipe.name)),
+            ingredient_key.is_(None),
+            func.lower(Recipe.name),
+        )
 
-                    # Generate sub-entry text: use index_name override, or algorithm
-                    if recipe.index_name:
-                        sub_entry = recipe.index_name.lower()
-                    else:
-                        sub_entry = generate_sub_entry(
-                            recipe.name, ingredient_key, recipe.dish_type
-                        )
+        # Stream the rows in batches (server-side cursor) rather than buffering them all
+        result = await db.stream(query.execution_options(yield_per=INDEX_STREAM_BATCH_SIZE))
 
-                    ingredient_to_recipes[ingredient_key].append(
-                        {
-                            "id": str(recipe.id),
-                            "name": recipe.name,
-                            "sub_entry": sub_entry,
-                        }
-                    )
-
-        # Build the unified index
-        all_entries = []
+        # Build the unified index in one pass, appending each entry straight into its
+        # letter bucket; rows arrive in entry order, so buckets need no further sort
+        index_by_letter = defaultdict(list)
+        ingredient_entries = {}
 
-        # Add ingredient entries
-        for ingredient_name, recipe_refs in ingredient_to_recipes.items():
-            all_entries.append(
-                {
-                    "type": "ingredient",
-                    "name": ingredient_name,
-                    "recipes": recipe_refs,
-                }
-            )
+        def add_entry(entry: dict) -> None:
+            first_letter = entry["name"][0].upper()
+            # Only include A-Z, put numbers/symbols under '#'
+            if not first_letter.isalpha():
+                first_letter = "#"
+            index_by_letter[first_letter].append(entry)
 
-        # Add standalone recipe entries (those without indexed ingredients)
-        for recipe in recipes:
-            if recipe.id not in recipes_with_indexed_ingredients:
-                all_entries.append(
+        async for recipe_id, name, index_name, dish_type, key in result:
+            if key is None:
+                # Standalone recipe entry (no indexed ingredients)
+                add_entry(
                     {
                         "type": "recipe",
-                        "name": recipe.name,
-                        "id": str(recipe.id),
+                        "name": name,
+                        "id": str(recipe_id),
                         "indexed_ingredients": [],
                     }
                 )
+                continue
+
+            entry = ingredient_entries.get(key)
+            if entry is None:
+                entry = {
+                    "type": "ingredient",
+                    "name": key,
+                    "recipes": [],
+                }
+                ingredient_entries[key] = entry
+                add_entry(entry)
 
-        # Sort all entries alphabetically by name
-        all_entries.sort(key=lambda x: x["name"].lower())
+            # Generate sub-entry text: use index_name override, or algorithm
+            if index_name:
+                sub_entry = index_name.lower()
+            else:
+                sub_entry = generate_sub_entry(name, key, dish_type)
 
-        # Group by first letter
-        index_by_letter = defaultdict(list)
-        for entry in all_entries:
-            first_letter = entry["name"][0].upper()
-            # Only include A-Z, put numbers/symbols under '#'
-            if not first_letter.isalpha():
-                first_letter = "#"
-            index_by_letter[first_letter].append(entry)
+            entry["recipes"].append(
+                {
+                    "id": str(recipe_id),
+                    "name": name,
+                    "sub_entry": sub_entry,
+                }
+            )
 
         return dict(index_by_letter)
@@ -1,9 +1,9 @@
 from typing import Optional, List
 from uuid import UUID
-from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, and_, bindparam, case, delete, func, insert, update
+from sqlalchemy.orm import raiseload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 from fastapi import HTTPException, status
 
 from app.models.schedule import (
@@ -20,6 +20,29 @@ from app.schemas.schedule import (
     TemplateReorderRequest,
 )
 
+# Key in AsyncSession.info for the per-session sequence memo:
+# (sequence_id, include_mappings) -> ScheduleSequence
+_SEQUENCE_CACHE_KEY = "schedule_sequences"
+
+# Hot read statements, built once; only the bound parameters vary per call
+_ACTIVE_MAPPINGS_QUERY = (
+    select(SequenceWeekMapping)
+    .where(
+        SequenceWeekMapping.sequence_id == bindparam("sequence_id"),
+        SequenceWeekMapping.removed_at.is_(None),
+    )
+    .options(selectinload(SequenceWeekMapping.week_template), raiseload("*"))
+    .order_by(SequenceWeekMapping.position)
+)
+
+_TEMPLATE_ASSIGNMENTS_QUERY = (
+    select(WeekDayAssignment)
+    .where(WeekDayAssignment.week_template_id == bindparam("template_id"))
+    # recipe backs the recipe_name property the responses read
+    .options(selectinload(WeekDayAssignment.recipe), raiseload("*"))
+    .order_by(WeekDayAssignment.day_of_week, WeekDayAssignment.order)
+)
+
 
 class ScheduleService:
     """Service layer for schedule business logic."""
@@ -31,7 +54,12 @@ class ScheduleService:
     @staticmethod
     async def get_sequences(db: AsyncSession) -> List[ScheduleSequence]:
         """Get list of all schedule sequences."""
-        query = select(ScheduleSequence).order_by(ScheduleSequence.created_at)
+        # List responses are scalar-only; fail loudly on any accidental lazy load
+        query = (
+            select(ScheduleSequence)
+            .options(raiseload("*"))
+            .order_by(ScheduleSequence.created_at)
+        )
         result = await db.execute(query)
         return result.scalars().all()
 
@@ -41,18 +69,39 @@ class ScheduleService:
         sequence_id: UUID,
         include_mappings: bool = True,
     ) -> Optional[ScheduleSequence]:
-        """Get a single sequence by ID with optional template mappings."""
+        """Get a single sequence by ID with optional template mappings.
+
+        Found sequences are memoized in the session's info dict, so repeat lookups
+        within one request (one session) don't query again. Methods that change a
+        sequence or its mappings drop the entry.
+        """
+        cache = db.info.setdefault(_SEQUENCE_CACHE_KEY, {})
+        cached = cache.get((sequence_id, include_mappings))
+        if cached is not None:
+            return cached
+
         query = select(ScheduleSequence).where(ScheduleSequence.id == sequence_id)
 
         if include_mappings:
             query = query.options(
-                selectinload(ScheduleSequence.week_mappings).selectinload(
+                selectinload(ScheduleSequence.week_mappings).joinedload(
                     SequenceWeekMapping.week_template
                 )
             )
 
         result = await db.execute(query)
-        return result.scalar_one_or_none()
+        sequence = result.scalar_one_or_none()
+        if sequence is not None:
+            cache[(sequence_id, include_mappings)] = sequence
+        return sequence
+
+    @staticmethod
+    def _forget_sequence(db: AsyncSession, sequence_id: UUID) -> None:
+        """Drop a sequence from the per-session get_sequence_by_id memo."""
+        cache = db.info.get(_SEQUENCE_CACHE_KEY)
+        if cache:
+            cache.pop((sequence_id, True), None)
+            cache.pop((sequence_id, False), None)
 
     @staticmethod
     async def create_sequence(
@@ -60,15 +109,19 @@ class ScheduleService:
         sequence_data: ScheduleSequenceCreate,
     ) -> ScheduleSequence:
         """Create a new schedule sequence."""
-        sequence = ScheduleSequence(
-            name=sequence_data.name,
-            advancement_day_of_week=sequence_data.advancement_day_of_week,
-            advancement_time=sequence_data.advancement_time,
+        # INSERT ... RETURNING hands back the server-generated columns in the
+        # same round trip, so no refresh is needed after the commit
+        result = await db.execute(
+            insert(ScheduleSequence)
+            .values(
+                name=sequence_data.name,
+                advancement_day_of_week=sequence_data.advancement_day_of_week,
+                advancement_time=sequence_data.advancement_time,
+            )
+            .returning(ScheduleSequence)
         )
-
-        db.add(sequence)
+        sequence = result.scalar_one()
         await db.commit()
-        await db.refresh(sequence)
 
         return sequence
 
@@ -79,11 +132,27 @@ class ScheduleService:
         sequence_data: ScheduleSequenceUpdate,
     ) -> ScheduleSequence:
         """Update a schedule sequence."""
-        sequence = await ScheduleService.get_sequence_by_id(
-            db=db,
-            sequence_id=sequence_id,
-            include_mappings=False,
-        )
+        values = {}
+        if sequence_data.name is not None:
+            values["name"] = sequence_data.name
+        if sequence_data.advancement_day_of_week is not None:
+            values["advancement_day_of_week"] = sequence_data.advancement_day_of_week
+        if sequence_data.advancement_time is not None:
+            values["advancement_time"] = sequence_data.advancement_time
+
+        if values:
+            # One UPDATE ... RETURNING both applies the change and tells a missing
+            # sequence apart, with the new updated_at included
+            result = await db.execute(
+                update(ScheduleSequence)
+                .where(ScheduleSequence.id == sequence_id)
+                .values(**values)
+                .returning(ScheduleSequence)
+                .execution_options(populate_existing=True)
+            )
+            sequence = result.scalar_one_or_none()
+        else:
+            sequence = await db.get(ScheduleSequence, sequence_id)
 
         if not sequence:
             raise HTTPException(
@@ -91,16 +160,8 @@ class ScheduleService:
                 detail="Schedule sequence not found",
             )
 
-        # Update fields
-        if sequence_data.name is not None:
-            sequence.name = sequence_data.name
-        if sequence_data.advancement_day_of_week is not None:
-            sequence.advancement_day_of_week = sequence_data.advancement_day_of_week
-        if sequence_data.advancement_time is not None:
-            sequence.advancement_time = sequence_data.advancement_time
-
+        ScheduleService._forget_sequence(db, sequence_id)
         await db.commit()
-        await db.refresh(sequence)
 
         return sequence
 
@@ -110,19 +171,23 @@ class ScheduleService:
         sequence_id: UUID,
     ) -> bool:
         """Delete a schedule sequence."""
-        sequence = await ScheduleService.get_sequence_by_id(
-            db=db,
-            sequence_id=sequence_id,
-            include_mappings=False,
+        ScheduleService._forget_sequence(db, sequence_id)
+
+        # Delete the mappings explicitly rather than relying on the FK cascade, then
+        # the sequence itself; its rowcount tells a missing sequence apart
+        await db.execute(
+            delete(SequenceWeekMapping).where(SequenceWeekMapping.sequence_id == sequence_id)
+        )
+        result = await db.execute(
+            delete(ScheduleSequence).where(ScheduleSequence.id == sequence_id)
         )
 
-        if not sequence:
+        if result.rowcount == 0:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Schedule sequence not found",
             )
 
-        await db.delete(sequence)
         await db.commit()
         return True
 
@@ -136,18 +201,44 @@ class ScheduleService:
         sequence_id: UUID,
     ) -> List[SequenceWeekMapping]:
         """Get all active (non-removed) template mappings for a sequence."""
+        result = await db.execute(_ACTIVE_MAPPINGS_QUERY, {"sequence_id": sequence_id})
+        return result.scalars().all()
+
+    @staticmethod
+    async def _get_sequence_with_active_mappings(
+        db: AsyncSession,
+        sequence_id: UUID,
+    ) -> ScheduleSequence:
+        """Get a sequence with only its active template mappings loaded, or raise 404.
+
+        The sequence row, its active mappings and their templates come back in one
+        call, so callers don't need a separate existence check.
+        """
+        # The filtered load replaces week_mappings on any memoized copy of the sequence
+        ScheduleService._forget_sequence(db, sequence_id)
+
         query = (
-            select(SequenceWeekMapping)
-            .where(
-                SequenceWeekMapping.sequence_id == sequence_id,
-                SequenceWeekMapping.removed_at.is_(None),
+            select(ScheduleSequence)
+            .where(ScheduleSequence.id == sequence_id)
+            .options(
+                selectinload(
+                    ScheduleSequence.week_mappings.and_(SequenceWeekMapping.removed_at.is_(None))
+                ).joinedload(SequenceWeekMapping.week_template)
             )
-            .options(selectinload(SequenceWeekMapping.week_template))
-            .order_by(SequenceWeekMapping.position)
+            # Replace a mappings collection already loaded (unfiltered) in this session
+            .execution_options(populate_existing=True)
         )
 
         result = await db.execute(query)
-        return result.scalars().all()
+        sequence = result.scalar_one_or_none()
+
+        if not sequence:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Schedule sequence not found",
+            )
+
+        return sequence
 
     @staticmethod
     async def add_template_to_sequence(
@@ -157,19 +248,12 @@ class ScheduleService:
         position: Optional[int] = None,
     ) -> SequenceWeekMapping:
         """Add a template to a sequence at a specific position."""
-        # Verify sequence exists
-        sequence = await ScheduleService.get_sequence_by_id(
+        # Verify sequence exists (and get its existing mappings)
+        sequence = await ScheduleService._get_sequence_with_active_mappings(
             db=db,
             sequence_id=sequence_id,
-            include_mappings=False,
         )
 
-        if not sequence:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Schedule sequence not found",
-            )
-
         # Verify template exists
         from app.services.template_service import TemplateService
 
@@ -185,15 +269,9 @@ class ScheduleService:
                 detail="Week template not found",
             )
 
-        # Get existing mappings
-        existing_mappings = await ScheduleService.get_active_templates_for_sequence(
-            db=db,
-            sequence_id=sequence_id,
-        )
-
         # Determine position
         if position is None:
-            position = len(existing_mappings) + 1
+            position = len(sequence.week_mappings) + 1
 
         # Create mapping
         mapping = SequenceWeekMapping(
@@ -203,6 +281,7 @@ class ScheduleService:
         )
 
         db.add(mapping)
+        ScheduleService._forget_sequence(db, sequence_id)
         await db.commit()
         await db.refresh(mapping)
 
@@ -215,24 +294,26 @@ class ScheduleService:
         template_id: UUID,
     ) -> bool:
         """Remove (soft delete) a template from a sequence."""
-        # Find the mapping
-        query = select(SequenceWeekMapping).where(
-            SequenceWeekMapping.sequence_id == sequence_id,
-            SequenceWeekMapping.week_template_id == template_id,
-            SequenceWeekMapping.removed_at.is_(None),
+        # Soft delete the active mapping in one UPDATE ... RETURNING, stamped by the
+        # database clock; no returned row means there was no such mapping
+        result = await db.execute(
+            update(SequenceWeekMapping)
+            .where(
+                SequenceWeekMapping.sequence_id == sequence_id,
+                SequenceWeekMapping.week_template_id == template_id,
+                SequenceWeekMapping.removed_at.is_(None),
+            )
+            .values(removed_at=func.now())
+            .returning(SequenceWeekMapping.id)
         )
 
-        result = await db.execute(query)
-        mapping = result.scalar_one_or_none()
-
-        if not mapping:
+        if result.first() is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Template mapping not found in sequence",
             )
 
-        # Soft delete
-        mapping.removed_at = datetime.utcnow()
+        ScheduleService._forget_sequence(db, sequence_id)
         await db.commit()
 
         return True
@@ -244,24 +325,12 @@ class ScheduleService:
         template_ids: List[UUID],
     ) -> List[SequenceWeekMapping]:
         """Reorder templates in a sequence."""
-        # Verify sequence exists
-        sequence = await ScheduleService.get_sequence_by_id(
-            db=db,
-            sequence_id=sequence_id,
-            include_mappings=False,
-        )
-
-        if not sequence:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Schedule sequence not found",
-            )
-
-        # Get all active mappings
-        mappings = await ScheduleService.get_active_templates_for_sequence(
+        # Verify sequence exists and get all active mappings
+        sequence = await ScheduleService._get_sequence_with_active_mappings(
             db=db,
             sequence_id=sequence_id,
         )
+        mappings = sequence.week_mappings
 
         # Build dict of mappings by template_id
         mapping_dict = {m.week_template_id: m for m in mappings}
@@ -273,17 +342,35 @@ class ScheduleService:
                 detail="Template IDs do not match sequence templates",
             )
 
-        # Update positions
-        for index, template_id in enumerate(template_ids, start=1):
-            mapping_dict[template_id].position = index
-
+        # Update all positions with one UPDATE ... SET position = CASE WHEN week_template_id = ...
+        new_positions = {
+            template_id: index for index, template_id in enumerate(template_ids, start=1)
+        }
+        await db.execute(
+            update(SequenceWeekMapping)
+            .where(
+                SequenceWeekMapping.sequence_id == sequence_id,
+                SequenceWeekMapping.removed_at.is_(None),
+                SequenceWeekMapping.week_template_id.in_(template_ids),
+            )
+            .values(
+                position=case(
+                    *[
+                        (SequenceWeekMapping.week_template_id == template_id, index)
+                        for template_id, index in new_positions.items()
+                    ]
+                )
+            )
+            .execution_options(synchronize_session=False)
+        )
         await db.commit()
 
-        # Return reordered mappings
-        return await ScheduleService.get_active_templates_for_sequence(
-            db=db,
-            sequence_id=sequence_id,
-        )
+        # Mirror the new positions onto the loaded mappings without re-flushing them
+        for template_id, index in new_positions.items():
+            set_committed_value(mapping_dict[template_id], "position", index)
+
+        # Return reordered mappings; they and their templates are already loaded
+        return sorted(mapping_dict.values(), key=lambda m: m.position)
 
     @staticmethod
     async def get_current_template(
@@ -291,46 +378,52 @@ class ScheduleService:
         sequence_id: UUID,
     ) -> Optional[WeekTemplate]:
         """Get the currently active week template for a sequence."""
-        # Get sequence with current_week_index
-        sequence = await ScheduleService.get_sequence_by_id(
-            db=db,
-            sequence_id=sequence_id,
-            include_mappings=False,
+        # Get current_week_index and the active mapping count in one query
+        active_count = (
+            select(func.count(SequenceWeekMapping.id))
+            .where(
+                SequenceWeekMapping.sequence_id == ScheduleSequence.id,
+                SequenceWeekMapping.removed_at.is_(None),
+            )
+            .scalar_subquery()
         )
+        result = await db.execute(
+            select(ScheduleSequence.current_week_index, active_count).where(
+                ScheduleSequence.id == sequence_id
+            )
+        )
+        row = result.first()
 
-        if not sequence:
+        if row is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Schedule sequence not found",
             )
 
-        # Get active mappings
-        mappings = await ScheduleService.get_active_templates_for_sequence(
-            db=db,
-            sequence_id=sequence_id,
-        )
-
-        if not mappings:
+        current_week_index, mapping_count = row
+        if not mapping_count:
             return None
 
         # Calculate current template based on index (0-based)
         # Loop back to start if index exceeds template count
-        current_index = sequence.current_week_index % len(mappings)
-
-        # Find mapping at current position (positions are 1-based)
-        for mapping in mappings:
-            if mapping.position == current_index + 1:
-                # Load template with assignments
-                from app.services.template_service import TemplateService
-
-                template = await TemplateService.get_template_by_id(
-                    db=db,
-                    template_id=mapping.week_template_id,
-                    include_assignments=True,
-                )
-                return template
+        current_index = current_week_index % mapping_count
 
-        return None
+        # Load the template at the current position (positions are 1-based) with
+        # its assignments
+        result = await db.execute(
+            select(WeekTemplate)
+            .join(SequenceWeekMapping, SequenceWeekMapping.week_template_id == WeekTemplate.id)
+            .where(
+                SequenceWeekMapping.sequence_id == sequence_id,
+                SequenceWeekMapping.removed_at.is_(None),
+                SequenceWeekMapping.position == current_index + 1,
+            )
+            .options(
+                selectinload(WeekTemplate.day_assignments).joinedload(WeekDayAssignment.recipe)
+            )
+            .limit(1)
+        )
+        return result.scalar_one_or_none()
 
     # ========================================================================
     # Week Day Assignment Methods
@@ -342,13 +435,7 @@ class ScheduleService:
         template_id: UUID,
     ) -> List[WeekDayAssignment]:
         """Get all day assignments for a template."""
-        query = (
-            select(WeekDayAssignment)
-            .where(WeekDayAssignment.week_template_id == template_id)
-            .order_by(WeekDayAssignment.day_of_week, WeekDayAssignment.order)
-        )
-
-        result = await db.execute(query)
+        result = await db.execute(_TEMPLATE_ASSIGNMENTS_QUERY, {"template_id": template_id})
         return result.scalars().all()
 
     @staticmethod
@@ -373,18 +460,20 @@ class ScheduleService:
                 detail="Week template not found",
             )
 
-        assignment = WeekDayAssignment(
-            week_template_id=template_id,
-            day_of_week=assignment_data.day_of_week,
-            assigned_user_id=assignment_data.assigned_user_id,
-            action=assignment_data.action,
-            recipe_id=assignment_data.recipe_id,
-            order=assignment_data.order,
+        result = await db.execute(
+            insert(WeekDayAssignment)
+            .values(
+                week_template_id=template_id,
+                day_of_week=assignment_data.day_of_week,
+                assigned_user_id=assignment_data.assigned_user_id,
+                action=assignment_data.action,
+                recipe_id=assignment_data.recipe_id,
+                order=assignment_data.order,
+            )
+            .returning(WeekDayAssignment)
         )
-
-        db.add(assignment)
+        assignment = result.scalar_one()
         await db.commit()
-        await db.refresh(assignment)
 
         return assignment
 
@@ -395,9 +484,7 @@ class ScheduleService:
         assignment_data: WeekDayAssignmentUpdate,
     ) -> WeekDayAssignment:
         """Update a day assignment."""
-        query = select(WeekDayAssignment).where(WeekDayAssignment.id == assignment_id)
-        result = await db.execute(query)
-        assignment = result.scalar_one_or_none()
+        assignment = await db.get(WeekDayAssignment, assignment_id)
 
         if not assignment:
             raise HTTPException(
@@ -428,9 +515,7 @@ class ScheduleService:
         assignment_id: UUID,
     ) -> None:
         """Delete a day assignment."""
-        query = select(WeekDayAssignment).where(WeekDayAssignment.id == assignment_id)
-        result = await db.execute(query)
-        assignment = result.scalar_one_or_none()
+        assignment = await db.get(WeekDayAssignment, assignment_id)
 
         if not assignment:
             raise HTTPException(
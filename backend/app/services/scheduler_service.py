@@ -1,57 +1,84 @@
 """Scheduler service for automated notifications and week advancement."""
 
+from apscheduler.executors.asyncio import AsyncIOExecutor
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from datetime import datetime, timedelta
+from functools import lru_cache
 from zoneinfo import ZoneInfo
-from sqlalchemy import select
+from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
+import asyncio
 import logging
 
 from app.db.session import AsyncSessionLocal
 from app.models.settings import Settings
-from app.models.schedule import ScheduleSequence, WeekTemplate, SequenceWeekMapping
+from app.models.schedule import (
+    ScheduleSequence,
+    WeekTemplate,
+    SequenceWeekMapping,
+    WeekDayAssignment,
+)
 from app.models.meal_plan import MealPlanInstance, GroceryList
 from app.services.discord_service import get_bot
-from app.services.schedule_service import ScheduleService
 from app.services.meal_plan_service import MealPlanService
 from app.services.notification_messages import build_notification_message
 
 logger = logging.getLogger(__name__)
 
-scheduler = AsyncIOScheduler()
-last_notification_date = None
+# Every job is a coroutine, so it runs on the event loop; no job ever overlaps
+# itself, and missed runs collapse into one so nothing is sent or advanced twice
+scheduler = AsyncIOScheduler(
+    executors={"default": AsyncIOExecutor()},
+    job_defaults={"coalesce": True, "max_instances": 1},
+)
 
 
-async def check_and_send_notifications():
-    """Check if it's time to send daily notifications."""
-    global last_notification_date
+@lru_cache(maxsize=8)
+def _tz(name: str) -> ZoneInfo:
+    """Resolve a timezone name once; settings only ever use a handful of them."""
+    return ZoneInfo(name)
+
+
+async def check_and_send_notifications(timezone: str = "UTC"):
+    """Send today's notifications; scheduled daily at the configured notification time."""
+    today = datetime.now(_tz(timezone)).date()
 
     async with AsyncSessionLocal() as session:
-        # Get settings
-        result = await session.execute(select(Settings).limit(1))
-        settings = result.scalar_one_or_none()
+        await send_daily_notifications(session, today)
 
-        if not settings:
-            return
 
-        # Convert to configured timezone
-        tz = ZoneInfo(settings.notification_timezone)
-        now = datetime.now(tz)
-        today = now.date()
+def schedule_notifications(notification_time: str, notification_timezone: str):
+    """(Re)schedule the daily notification job for the configured local time.
 
-        # Check if already notified today
-        if last_notification_date == today:
-            return
+    Called at startup and whenever the notification settings change, so the job
+    fires once a day at the right minute instead of polling the settings.
+    """
+    notify_hour, notify_minute = map(int, notification_time.split(":"))
 
-        # Parse notification time
-        notify_hour, notify_minute = map(int, settings.notification_time.split(":"))
+    # Settings writes that don't move the time leave the existing job alone
+    job = scheduler.get_job("notification_check")
+    if job is not None and job.kwargs.get("timezone") == notification_timezone:
+        fields = {field.name: str(field) for field in job.trigger.fields}
+        if fields["hour"] == str(notify_hour) and fields["minute"] == str(notify_minute):
+            return
 
-        # Check if current time matches notification time (within 5 minutes)
-        if now.hour == notify_hour and abs(now.minute - notify_minute) < 5:
-            await send_daily_notifications(session, today)
-            last_notification_date = today
+    scheduler.add_job(
+        check_and_send_notifications,
+        CronTrigger(
+            hour=notify_hour,
+            minute=notify_minute,
+            timezone=_tz(notification_timezone),
+        ),
+        id="notification_check",
+        kwargs={"timezone": notification_timezone},
+        replace_existing=True,
+        # A run delayed by a busy or restarting process still goes out if it's
+        # only a little late
+        misfire_grace_time=15 * 60,
+    )
+    logger.info(f"Daily notifications scheduled for {notification_time} {notification_timezone}")
 
 
 async def send_daily_notifications(session: AsyncSession, date):
@@ -63,33 +90,25 @@ async def send_daily_notifications(session: AsyncSession, date):
     bot = get_bot()
     settings = get_settings()
 
-    # Calculate day of week (0=Sunday, 6=Saturday)
-    day_of_week = date.weekday()
-    if day_of_week == 6:  # Python's weekday: Monday=0, Sunday=6
-        day_of_week = 0  # Convert to our format: Sunday=0
-    else:
-        day_of_week += 1  # Monday=1, Tuesday=2, etc.
+    # Calculate day of week (0=Sunday, 6=Saturday) from Python's Monday=0, Sunday=6
+    day_of_week = (date.weekday() + 1) % 7
 
-    # Get active meal plan instances for today (with eager loading for relationships)
+    # Get active meal plan instances for today: today falls within the week
+    # (start_date to start_date + 6 days), a range scan on the start date index.
+    # Only today's template assignments are loaded; the others are never read.
     result = await session.execute(
         select(MealPlanInstance)
         .options(
-            selectinload(MealPlanInstance.week_template).selectinload(WeekTemplate.day_assignments)
+            selectinload(MealPlanInstance.week_template).selectinload(
+                WeekTemplate.day_assignments.and_(WeekDayAssignment.day_of_week == day_of_week)
+            )
+        )
+        .where(
+            MealPlanInstance.instance_start_date <= date,
+            MealPlanInstance.instance_start_date >= date - timedelta(days=6),
         )
-        .where(MealPlanInstance.instance_start_date <= date)
     )
-    instances = result.scalars().all()
-
-    # Filter to instances where today falls within the week (start_date to start_date + 6 days)
-    from datetime import timedelta
-
-    active_instances = [
-        inst
-        for inst in instances
-        if inst.instance_start_date
-        <= date
-        <= inst.instance_start_date + timedelta(days=6)
-    ]
+    active_instances = result.scalars().all()
 
     if not active_instances:
         logger.info(f"No active meal plan instances for {date}")
@@ -98,6 +117,17 @@ async def send_daily_notifications(session: AsyncSession, date):
     # Get bot name for signatures
     bot_name = bot.bot.user.name if bot.bot and bot.bot.user else 'Kitchen Bot'
 
+    # Today's grocery lists for all active instances, for linking from shop notifications
+    grocery_list_result = await session.execute(
+        select(GroceryList.meal_plan_instance_id, GroceryList.id)
+        .where(GroceryList.meal_plan_instance_id.in_([inst.id for inst in active_instances]))
+        .where(GroceryList.shopping_date == date)
+    )
+    grocery_list_ids = {
+        instance_id: str(grocery_list_id)
+        for instance_id, grocery_list_id in grocery_list_result.all()
+    }
+
     # Process each instance
     for instance in active_instances:
         # Get merged assignments (template + overrides) for this day
@@ -116,17 +146,10 @@ async def send_daily_notifications(session: AsyncSession, date):
             if not user:
                 continue
 
-            # For shop actions, find the grocery list for today
+            # For shop actions, link the grocery list for today
             grocery_list_id = None
             if assignment.action == "shop":
-                grocery_list_result = await session.execute(
-                    select(GroceryList)
-                    .where(GroceryList.meal_plan_instance_id == instance.id)
-                    .where(GroceryList.shopping_date == date)
-                )
-                grocery_list = grocery_list_result.scalar_one_or_none()
-                if grocery_list:
-                    grocery_list_id = str(grocery_list.id)
+                grocery_list_id = grocery_list_ids.get(instance.id)
 
             # Build notification message
             message = build_notification_message(
@@ -149,18 +172,39 @@ async def send_daily_notifications(session: AsyncSession, date):
 async def advance_week():
     """Advance to next week for all active sequences."""
     async with AsyncSessionLocal() as session:
-        # Get all sequences
-        result = await session.execute(select(ScheduleSequence))
+        # Get all sequences with their active template mappings (and templates) up front
+        sequences_query = select(ScheduleSequence).options(
+            selectinload(
+                ScheduleSequence.week_mappings.and_(SequenceWeekMapping.removed_at.is_(None))
+            ).joinedload(SequenceWeekMapping.week_template)
+        )
+        result = await session.execute(sequences_query)
         sequences = result.scalars().all()
 
-        bot = get_bot()
+        # Most recent instance start date per active template, for every sequence at once
+        template_ids = {
+            mapping.week_template_id
+            for sequence in sequences
+            for mapping in sequence.week_mappings
+        }
+        latest_start_by_template = {}
+        if template_ids:
+            result = await session.execute(
+                select(
+                    MealPlanInstance.week_template_id,
+                    func.max(MealPlanInstance.instance_start_date),
+                )
+                .where(MealPlanInstance.week_template_id.in_(template_ids))
+                .group_by(MealPlanInstance.week_template_id)
+            )
+            latest_start_by_template = dict(result.all())
+
+        pending_messages = []
 
         for sequence in sequences:
+            sequence_id = sequence.id
             try:
-                # Get active template mappings for this sequence
-                mappings = await ScheduleService.get_active_templates_for_sequence(
-                    db=session, sequence_id=sequence.id
-                )
+                mappings = sequence.week_mappings
 
                 if not mappings:
                     logger.warning(f"No active templates for sequence {sequence.id}")
@@ -169,62 +213,42 @@ async def advance_week():
                 # Calculate current position
                 current_position = sequence.current_week_index % len(mappings)
 
-                # Find current mapping
-                current_mapping = None
-                for mapping in mappings:
-                    if (
-                        mapping.position == current_position + 1
-                    ):  # positions are 1-based
-                        current_mapping = mapping
+                # Walk forward to the next position whose template isn't retired
+                # (positions are 1-based); the templates are already loaded, so
+                # a run of retired weeks is skipped in one pass
+                by_position = {mapping.position: mapping for mapping in mappings}
+                next_position = None
+                next_mapping = None
+                for step in range(1, len(mappings) + 1):
+                    position = (current_position + step) % len(mappings)
+                    mapping = by_position.get(position + 1)
+                    if mapping and not mapping.week_template.retired_at:
+                        next_position, next_mapping = position, mapping
                         break
 
-                if not current_mapping:
-                    logger.error(
-                        f"Could not find current mapping for sequence {sequence.id}"
-                    )
-                    continue
-
-                # Check if current template is retired - if so, skip creating instance
-                if current_mapping.week_template.retired_at:
-                    logger.info(
-                        f"Skipping retired template {current_mapping.week_template_id} for sequence {sequence.id}"
+                if not next_mapping:
+                    logger.warning(
+                        f"No non-retired templates to advance to for sequence {sequence.id}"
                     )
-                    # Just advance the index, don't create instance
-                    sequence.current_week_index = (current_position + 1) % len(mappings)
-                    await session.commit()
                     continue
 
-                # Get the most recent instance to calculate next start date
-                current_instance = await MealPlanService.get_current_instance(
-                    db=session, sequence_id=sequence.id
-                )
+                # Get the most recent instance start date for this sequence's templates
+                latest_start_dates = [
+                    latest_start_by_template[mapping.week_template_id]
+                    for mapping in mappings
+                    if mapping.week_template_id in latest_start_by_template
+                ]
 
                 # Calculate next start date
-                if current_instance:
-                    next_start_date = current_instance.instance_start_date + timedelta(
-                        days=7
-                    )
+                if latest_start_dates:
+                    next_start_date = max(latest_start_dates) + timedelta(days=7)
                 else:
                     # No previous instance, start today
                     next_start_date = datetime.now().date()
 
                 # Advance to next week index
-                next_position = (current_position + 1) % len(mappings)
                 sequence.current_week_index = next_position
 
-                # Find next mapping
-                next_mapping = None
-                for mapping in mappings:
-                    if mapping.position == next_position + 1:  # positions are 1-based
-                        next_mapping = mapping
-                        break
-
-                if not next_mapping:
-                    logger.error(
-                        f"Could not find next mapping for sequence {sequence.id}"
-                    )
-                    continue
-
                 # Create new instance for next week
                 new_instance = await MealPlanService.create_instance(
                     db=session,
@@ -233,17 +257,23 @@ async def advance_week():
                     sequence_id=sequence.id,
                 )
 
+                # Sequences sharing this template continue from the new instance;
+                # recorded as soon as it's committed, so a failure below can't
+                # lead another sequence to create the same week again
+                latest_start_by_template[next_mapping.week_template_id] = max(
+                    next_start_date,
+                    latest_start_by_template.get(next_mapping.week_template_id, next_start_date),
+                )
+
                 # Auto-generate grocery lists for shop days
                 await MealPlanService.auto_generate_grocery_lists(
                     db=session,
                     instance=new_instance,
                 )
 
-                await session.commit()
-
-                # Send notification
+                # Queue notification; sent once the session is released
                 template_name = next_mapping.week_template.name
-                await bot.send_message(
+                pending_messages.append(
                     f"🔄 **Week Advanced**\n\n"
                     f"Sequence: {sequence.name}\n"
                     f"New Template: {template_name}\n"
@@ -255,26 +285,39 @@ async def advance_week():
                 )
 
             except Exception as e:
-                logger.error(f"Error advancing sequence {sequence.id}: {e}")
+                logger.error(f"Error advancing sequence {sequence_id}: {e}")
+                # Discard the failed sequence's pending work so the session stays
+                # usable (create_instance commits as it goes, so there is no
+                # savepoint to return to), then reload what the rollback expired
+                await session.rollback()
+                await session.execute(sequences_query)
                 continue
 
+        # create_instance and grocery list generation commit their own work; this
+        # one commit covers whatever the loop left pending
+        await session.commit()
 
-def configure_scheduler():
-    """Configure scheduler jobs based on settings."""
-    # Notification check every 5 minutes
-    scheduler.add_job(
-        check_and_send_notifications,
-        CronTrigger(minute="*/5"),
-        id="notification_check",
-        replace_existing=True,
+    # Discord round trips don't hold the database session, and go out concurrently;
+    # one failed send is logged without losing the others
+    bot = get_bot()
+    results = await asyncio.gather(
+        *(bot.send_message(message) for message in pending_messages),
+        return_exceptions=True,
     )
+    for result in results:
+        if isinstance(result, BaseException):
+            logger.error(f"Error sending week advancement notification: {result}")
+
 
+def configure_scheduler():
+    """Configure fixed scheduler jobs (notifications follow settings, see schedule_notifications)."""
     # Week advancement - default Sunday at midnight
     scheduler.add_job(
         advance_week,
         CronTrigger(day_of_week="sun", hour=0, minute=0),
         id="week_advancement",
         replace_existing=True,
+        misfire_grace_time=60 * 60,
     )
 
     logger.info("Scheduler configured")
@@ -283,6 +326,15 @@ def configure_scheduler():
 async def start_scheduler():
     """Start the scheduler."""
     configure_scheduler()
+
+    # Notifications only go out once settings exist
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(select(Settings).limit(1))
+        settings = result.scalar_one_or_none()
+
+    if settings:
+        schedule_notifications(settings.notification_time, settings.notification_timezone)
+
     scheduler.start()
     logger.info("Scheduler started")
 
@@ -1,14 +1,47 @@
 """Service layer for week template management."""
 from typing import Optional, List
 from uuid import UUID
-from datetime import datetime
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from datetime import datetime, timezone
+from sqlalchemy import bindparam, delete, exists, func, insert, literal, select, update
+from sqlalchemy.orm import joinedload, selectinload
 
 from app.models.schedule import WeekTemplate, WeekDayAssignment, SequenceWeekMapping, ScheduleSequence
 from app.models.meal_plan import MealPlanInstance
 from app.schemas.schedule import WeekTemplateCreate, WeekTemplateUpdate, WeekDayAssignmentCreate
 
+# Hot read statements, built once; only the bound parameters vary per call
+_ALL_TEMPLATES_QUERY = select(WeekTemplate).order_by(WeekTemplate.name)
+
+_ACTIVE_TEMPLATES_QUERY = (
+    select(WeekTemplate)
+    .where(WeekTemplate.retired_at.is_(None))
+    .order_by(WeekTemplate.name)
+)
+
+_TEMPLATE_QUERY = select(WeekTemplate).where(WeekTemplate.id == bindparam("template_id"))
+
+_TEMPLATE_WITH_ASSIGNMENTS_QUERY = _TEMPLATE_QUERY.options(
+    selectinload(WeekTemplate.day_assignments).joinedload(WeekDayAssignment.recipe)
+)
+
+# Columns carried over verbatim when a template's assignments are copied
+_COPIED_ASSIGNMENT_COLUMNS = ("day_of_week", "assigned_user_id", "action", "recipe_id", "order")
+
+
+def _assignment_rows(template_id: UUID, assignments: List[WeekDayAssignmentCreate]) -> List[dict]:
+    """Turn assignment schemas into row dicts for a bulk insert into a template."""
+    return [
+        {
+            "week_template_id": template_id,
+            "day_of_week": assignment_data.day_of_week,
+            "assigned_user_id": assignment_data.assigned_user_id,
+            "action": assignment_data.action,
+            "recipe_id": assignment_data.recipe_id,
+            "order": assignment_data.order,
+        }
+        for assignment_data in assignments
+    ]
+
 
 class TemplateService:
     """Service for managing week templates."""
@@ -25,12 +58,7 @@ class TemplateService:
         Returns:
             List of WeekTemplate objects
         """
-        query = select(WeekTemplate)
-
-        if not include_retired:
-            query = query.where(WeekTemplate.retired_at.is_(None))
-
-        query = query.order_by(WeekTemplate.name)
+        query = _ALL_TEMPLATES_QUERY if include_retired else _ACTIVE_TEMPLATES_QUERY
         result = await db.execute(query)
         return result.scalars().all()
 
@@ -51,16 +79,8 @@ class TemplateService:
         Returns:
             WeekTemplate object or None if not found
         """
-        query = select(WeekTemplate).where(WeekTemplate.id == template_id)
-
-        if include_assignments:
-            query = query.options(
-                selectinload(WeekTemplate.day_assignments).selectinload(
-                    WeekDayAssignment.recipe
-                )
-            )
-
-        result = await db.execute(query)
+        query = _TEMPLATE_WITH_ASSIGNMENTS_QUERY if include_assignments else _TEMPLATE_QUERY
+        result = await db.execute(query, {"template_id": template_id})
         return result.scalar_one_or_none()
 
     @staticmethod
@@ -83,22 +103,16 @@ class TemplateService:
         db.add(template)
         await db.flush()  # Get the ID
 
-        # Create day assignments
-        for assignment_data in template_data.assignments:
-            assignment = WeekDayAssignment(
-                week_template_id=template.id,
-                day_of_week=assignment_data.day_of_week,
-                assigned_user_id=assignment_data.assigned_user_id,
-                action=assignment_data.action,
-                recipe_id=assignment_data.recipe_id,
-                order=assignment_data.order,
+        # Create day assignments in one bulk insert
+        if template_data.assignments:
+            await db.execute(
+                insert(WeekDayAssignment),
+                _assignment_rows(template.id, template_data.assignments),
             )
-            db.add(assignment)
 
         await db.commit()
-        await db.refresh(template)
-
-        # Load with assignments
+        # Load with assignments; this also fills in the server-generated
+        # timestamps, so no separate refresh is needed
         return await TemplateService.get_template_by_id(db, template.id)
 
     @staticmethod
@@ -118,7 +132,7 @@ class TemplateService:
         Returns:
             Updated WeekTemplate object or None if not found
         """
-        template = await TemplateService.get_template_by_id(db, template_id, include_assignments=True)
+        template = await TemplateService.get_template_by_id(db, template_id, include_assignments=False)
         if not template:
             return None
 
@@ -128,27 +142,20 @@ class TemplateService:
 
         # Update assignments if provided
         if template_data.assignments is not None:
-            # Delete all existing assignments
-            for assignment in template.day_assignments:
-                await db.delete(assignment)
-            await db.flush()
-
-            # Create new assignments
-            for assignment_data in template_data.assignments:
-                assignment = WeekDayAssignment(
-                    week_template_id=template.id,
-                    day_of_week=assignment_data.day_of_week,
-                    assigned_user_id=assignment_data.assigned_user_id,
-                    action=assignment_data.action,
-                    recipe_id=assignment_data.recipe_id,
-                    order=assignment_data.order,
+            # Replace all existing assignments: one DELETE, one bulk INSERT
+            await db.execute(
+                delete(WeekDayAssignment).where(WeekDayAssignment.week_template_id == template.id)
+            )
+
+            if template_data.assignments:
+                await db.execute(
+                    insert(WeekDayAssignment),
+                    _assignment_rows(template.id, template_data.assignments),
                 )
-                db.add(assignment)
 
         await db.commit()
-        await db.refresh(template)
-
-        # Return with assignments loaded
+        # Load with assignments; this also fills in the server-generated
+        # timestamps, so no separate refresh is needed
         return await TemplateService.get_template_by_id(db, template.id)
 
     @staticmethod
@@ -168,8 +175,8 @@ class TemplateService:
         Returns:
             New forked WeekTemplate object or None if original not found
         """
-        # Load original template with assignments
-        original = await TemplateService.get_template_by_id(db, template_id, include_assignments=True)
+        # Load original template (its assignments are copied in the database)
+        original = await TemplateService.get_template_by_id(db, template_id, include_assignments=False)
         if not original:
             return None
 
@@ -182,21 +189,32 @@ class TemplateService:
         await db.flush()  # Get the ID
 
         # Deep copy all day assignments
-        for original_assignment in original.day_assignments:
-            forked_assignment = WeekDayAssignment(
-                week_template_id=forked.id,
-                day_of_week=original_assignment.day_of_week,
-                assigned_user_id=original_assignment.assigned_user_id,
-                action=original_assignment.action,
-                recipe_id=original_assignment.recipe_id,
-                order=original_assignment.order,
+        copied_columns = [
+            getattr(WeekDayAssignment, column) for column in _COPIED_ASSIGNMENT_COLUMNS
+        ]
+        if db.get_bind().dialect.name == "postgresql":
+            # One INSERT ... SELECT; ids are Python-side defaults, so generate them here
+            await db.execute(
+                insert(WeekDayAssignment).from_select(
+                    ["id", "week_template_id", *_COPIED_ASSIGNMENT_COLUMNS],
+                    select(
+                        func.gen_random_uuid(),
+                        literal(forked.id, WeekDayAssignment.week_template_id.type),
+                        *copied_columns,
+                    ).where(WeekDayAssignment.week_template_id == template_id),
+                )
+            )
+        else:
+            result = await db.execute(
+                select(*copied_columns).where(WeekDayAssignment.week_template_id == template_id)
             )
-            db.add(forked_assignment)
+            rows = [{"week_template_id": forked.id, **row._asdict()} for row in result]
+            if rows:
+                await db.execute(insert(WeekDayAssignment), rows)
 
         await db.commit()
-        await db.refresh(forked)
-
-        # Load with assignments
+        # Load with assignments; this also fills in the server-generated
+        # timestamps, so no separate refresh is needed
         return await TemplateService.get_template_by_id(db, forked.id)
 
     @staticmethod
@@ -225,44 +243,57 @@ class TemplateService:
             return None
 
         # Check if any MealPlanInstances reference this template
-        instances_query = select(MealPlanInstance).where(
-            MealPlanInstance.week_template_id == template_id
+        has_instances = await db.scalar(
+            select(exists().where(MealPlanInstance.week_template_id == template_id))
         )
-        instances_result = await db.execute(instances_query)
-        instances = instances_result.scalars().all()
-        can_hard_delete = len(instances) == 0
+        can_hard_delete = not has_instances
+
+        # One timestamp for the template and every mapping it's removed from
+        now = datetime.now(timezone.utc)
 
         # Soft delete the template
-        template.retired_at = datetime.utcnow()
+        template.retired_at = now
 
-        # Find all sequence mappings for this template
-        mappings_query = select(SequenceWeekMapping).where(
+        # Active mappings of every sequence this template is in, as they stand
+        # before its mappings are removed, grouped by sequence
+        affected_sequence_ids = select(SequenceWeekMapping.sequence_id).where(
             SequenceWeekMapping.week_template_id == template_id,
             SequenceWeekMapping.removed_at.is_(None)
-        ).options(selectinload(SequenceWeekMapping.sequence))
-
-        mappings_result = await db.execute(mappings_query)
-        mappings = mappings_result.scalars().all()
+        )
+        active_mappings_query = select(SequenceWeekMapping).where(
+            SequenceWeekMapping.sequence_id.in_(affected_sequence_ids),
+            SequenceWeekMapping.removed_at.is_(None)
+        ).options(joinedload(SequenceWeekMapping.sequence)).order_by(SequenceWeekMapping.position)
 
-        affected_sequences = []
+        active_mappings_by_sequence = {}
+        active_mappings_result = await db.execute(active_mappings_query)
+        for active_mapping in active_mappings_result.scalars():
+            active_mappings_by_sequence.setdefault(active_mapping.sequence_id, []).append(
+                active_mapping
+            )
 
-        for mapping in mappings:
-            # Mark mapping as removed
-            mapping.removed_at = datetime.utcnow()
+        # Remove the template from every sequence with one UPDATE; one sequence
+        # id comes back per removed mapping
+        removed_result = await db.execute(
+            update(SequenceWeekMapping)
+            .where(
+                SequenceWeekMapping.week_template_id == template_id,
+                SequenceWeekMapping.removed_at.is_(None)
+            )
+            .values(removed_at=now)
+            .returning(SequenceWeekMapping.sequence_id)
+        )
+        removed_sequence_ids = removed_result.scalars().all()
 
-            sequence = mapping.sequence
+        affected_sequences = []
 
+        for sequence_id in removed_sequence_ids:
             # Check if this sequence is currently on this template
-            # Get active mappings for this sequence
-            active_mappings_query = select(SequenceWeekMapping).where(
-                SequenceWeekMapping.sequence_id == sequence.id,
-                SequenceWeekMapping.removed_at.is_(None)
-            ).order_by(SequenceWeekMapping.position)
-
-            active_mappings_result = await db.execute(active_mappings_query)
-            active_mappings = active_mappings_result.scalars().all()
+            active_mappings = active_mappings_by_sequence[sequence_id]
+            sequence = active_mappings[0].sequence
 
-            # Find current position (excluding the one we just removed)
+            # Look up the current position in the pre-removal snapshot, which
+            # still includes the mapping the UPDATE just removed
             current_position = sequence.current_week_index
             if current_position < len(active_mappings) and active_mappings[current_position].week_template_id == template_id:
                 # This sequence is currently on the retired template
@@ -301,13 +332,11 @@ class TemplateService:
             return False
 
         # Check if any MealPlanInstances reference this template
-        instances_query = select(MealPlanInstance).where(
-            MealPlanInstance.week_template_id == template_id
+        has_instances = await db.scalar(
+            select(exists().where(MealPlanInstance.week_template_id == template_id))
         )
-        instances_result = await db.execute(instances_query)
-        instances = instances_result.scalars().all()
 
-        if len(instances) > 0:
+        if has_instances:
             return False  # Cannot delete, has instances
 
         # Safe to delete
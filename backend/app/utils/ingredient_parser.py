@@ -1,5 +1,6 @@
 """Utility functions for parsing ingredient strings from recipe imports."""
 import re
+from functools import lru_cache
 from typing import Optional, Tuple
 
 from app.models.recipe import IngredientUnit
@@ -24,6 +25,14 @@ FRACTION_MAP = {
     '⅞': 0.875,
 }
 
+# Every unicode fraction is non-ASCII, so plain-ASCII quantities (the common
+# case) can skip looking for them entirely
+_FRACTION_CHARS = frozenset(FRACTION_MAP)
+
+# Puts a space before each unicode fraction in one translate() pass, so a
+# fraction attached to a whole number ("1½") parses as a mixed number ("1 ½")
+_FRACTION_SPACING = str.maketrans({char: f' {char}' for char in FRACTION_MAP})
+
 # Map common unit names to our enum values
 UNIT_ALIASES = {
     # Volume
@@ -97,6 +106,33 @@ UNIT_ALIASES = {
     'to taste': IngredientUnit.TO_TASTE,
 }
 
+# Words read as units in the slash context: every alias plus its plural, so a
+# plural is one set lookup instead of a second probe with the 's' stripped
+_UNIT_WORDS = frozenset(UNIT_ALIASES) | frozenset(
+    f'{alias}s' for alias in UNIT_ALIASES if not alias.endswith('s')
+)
+
+# Unit words that, found at the start of any word in an ITEM ingredient's name,
+# mean the unit was probably misparsed
+_REAL_UNITS = ('package', 'jar', 'can', 'bunch', 'clove', 'cup', 'ounce', 'gram',
+               'tablespoon', 'teaspoon', 'pound', 'liter')
+
+
+# Compiled once at import; parse_ingredient_line runs once per line on every import
+_QUANTITY_CHARS = r'\d\s\-\/¼½¾⅓⅔⅕⅖⅗⅘⅙⅚⅛⅜⅝⅞\.'
+_PARENTHETICAL_RE = re.compile(r'\([^)]*\)')
+_WHITESPACE_RE = re.compile(r'\s+')
+# Optional quantity + optional unit + optional ingredient name
+# Matches: "2 cups flour", "1½ cups sugar", "2-3 tablespoons butter", "1 3/4 cups"
+_INGREDIENT_LINE_RE = re.compile(
+    rf'^(?P<quantity>[{_QUANTITY_CHARS}]+)?\s*(?P<unit>[a-zA-Z\s]+?)(?:\s+(?P<name>.+))?$'
+)
+_LEADING_QUANTITY_RE = re.compile(rf'^[{_QUANTITY_CHARS}]+')
+_TRAILING_PARENTHETICAL_RE = re.compile(r'\s*\([^)]*\)\s*$')
+_EMBEDDED_MEASUREMENT_RE = re.compile(r'\b\d+\s+(ounce|gram|cup|tablespoon|teaspoon)')
+# One scan for every real unit at a word start, instead of a substring check per unit
+_REAL_UNIT_RE = re.compile(rf'(?:^| )(?:{"|".join(_REAL_UNITS)})')
+
 
 def parse_fraction(fraction_str: str) -> float:
     """Convert fraction string to decimal.
@@ -106,10 +142,13 @@ def parse_fraction(fraction_str: str) -> float:
     - Plain fractions: 1/2, 3/4, etc.
     - Mixed numbers: 1 1/2, 2 3/4, etc.
     """
-    # Check unicode fractions first
-    for char, value in FRACTION_MAP.items():
-        if char in fraction_str:
-            return value
+    # Check unicode fractions first: one pass over the (short) string, one dict
+    # probe per character, and none at all for plain ASCII
+    if not fraction_str.isascii():
+        for char in fraction_str:
+            value = FRACTION_MAP.get(char)
+            if value is not None:
+                return value
 
     # Handle plain fraction like "1/2"
     if '/' in fraction_str:
@@ -129,10 +168,12 @@ def parse_quantity(quantity_str: str) -> float:
     Handles:
     - Simple numbers: "2", "3.5"
     - Fractions: "1/2", "¾"
-    - Mixed numbers: "1 1/2", "2 ¾"
+    - Mixed numbers: "1 1/2", "2 ¾", "1½"
     - Ranges: "2-3" (uses midpoint)
     """
     quantity_str = quantity_str.strip()
+    if not quantity_str.isascii():
+        quantity_str = quantity_str.translate(_FRACTION_SPACING).strip()
 
     # Handle ranges like "2-3 cups" - use midpoint
     if '-' in quantity_str:
@@ -157,7 +198,10 @@ def parse_quantity(quantity_str: str) -> float:
             pass
 
     # Handle standalone fractions
-    if '/' in quantity_str or any(char in quantity_str for char in FRACTION_MAP):
+    has_unicode_fraction = (
+        not quantity_str.isascii() and not _FRACTION_CHARS.isdisjoint(quantity_str)
+    )
+    if '/' in quantity_str or has_unicode_fraction:
         return parse_fraction(quantity_str)
 
     # Simple number
@@ -167,6 +211,9 @@ def parse_quantity(quantity_str: str) -> float:
         return 1.0
 
 
+# Pure function of the line, and imports repeat the same lines ("1 tsp salt")
+# across recipes, so results are memoized; every returned value is immutable
+@lru_cache(maxsize=4096)
 def parse_ingredient_line(line: str) -> Tuple[Optional[float], Optional[IngredientUnit], str]:
     """Parse an ingredient line into quantity, unit, and name.
 
@@ -197,9 +244,15 @@ def parse_ingredient_line(line: str) -> Tuple[Optional[float], Optional[Ingredie
     # Pattern: (NUMBER UNIT) or (ADJECTIVE) at the start of the line after initial number
     # Example: "1 (10-ounce) package" -> "1 package"
     # Example: "9 ounces (dry) lasagna" -> "9 ounces lasagna"
-    line = re.sub(r'\([^)]*\)', '', line).strip()
+    # Most lines have no parentheses and only single spaces, so each regex only
+    # runs when there's something for it to replace (isprintable() is False for
+    # any whitespace other than a plain space)
+    if '(' in line:
+        line = _PARENTHETICAL_RE.sub('', line)
+    line = line.strip()
     # Clean up any double spaces left behind
-    line = re.sub(r'\s+', ' ', line)
+    if '  ' in line or not line.isprintable():
+        line = _WHITESPACE_RE.sub(' ', line)
 
     # Step 1: Check for alternative measurements and strip them
     # Strategy: Find slashes that have a unit word immediately before them
@@ -207,27 +260,30 @@ def parse_ingredient_line(line: str) -> Tuple[Optional[float], Optional[Ingredie
     # Example: "1 3/4 cups/231 grams all-purpose flour" - the slash after "cups" is the alternative
     ingredient_suffix = ""  # Text after alternative measurement (the actual ingredient name)
     if '/' in original_line:
-        # Find all slashes and check context around each one
-        slash_positions = [i for i, char in enumerate(original_line) if char == '/']
-
-        for slash_pos in slash_positions:
-            # Get the word before the slash
-            before_slash = original_line[:slash_pos].strip()
-            after_slash = original_line[slash_pos + 1:].strip()
+        # Walk the slashes left to right, looking only at the word just before
+        # each one rather than re-splitting the whole prefix every time
+        slash_pos = original_line.find('/')
+        while slash_pos != -1:
+            # Get the word before the slash: skip back over spaces, then the word
+            word_end = slash_pos
+            while word_end and original_line[word_end - 1].isspace():
+                word_end -= 1
+            word_start = word_end
+            while word_start and not original_line[word_start - 1].isspace():
+                word_start -= 1
 
             # Check if there's a unit word immediately before this slash
-            before_words = before_slash.lower().split()
-            if before_words:
-                last_word_before = before_words[-1]
-                # Check if last word before slash is a unit
-                is_unit_before = (last_word_before in UNIT_ALIASES or
-                                  last_word_before.rstrip('s') in UNIT_ALIASES)
-
-                if is_unit_before and after_slash and after_slash[0].isdigit():
+            last_word_before = original_line[word_start:word_end].lower()
+            is_unit_before = last_word_before in _UNIT_WORDS
+
+            if is_unit_before:
+                after_slash = original_line[slash_pos + 1:].strip()
+
+                if after_slash and after_slash[0].isdigit():
                     # This slash comes after a unit and before a number
                     # This is an alternative measurement separator
                     # Keep everything before this slash for parsing
-                    line = before_slash
+                    line = original_line[:slash_pos].strip()
 
                     # Extract the ingredient name from after the alternative measurement
                     # Pattern: "231 grams all-purpose flour" -> want "all-purpose flour"
@@ -238,24 +294,24 @@ def parse_ingredient_line(line: str) -> Tuple[Optional[float], Optional[Ingredie
                     elif len(alt_parts) == 2:
                         # Check if second part is a unit or ingredient
                         second_word = alt_parts[1].lower()
-                        if second_word not in UNIT_ALIASES and second_word.rstrip('s') not in UNIT_ALIASES:
+                        if second_word not in _UNIT_WORDS:
                             # It's probably an ingredient
                             ingredient_suffix = alt_parts[1]
 
                     break
 
-    # Step 2: Standard parsing with regex
-    # Pattern: optional quantity + optional unit + optional ingredient name
-    # Matches: "2 cups flour", "1½ cups sugar", "2-3 tablespoons butter", "1 3/4 cups"
-    pattern = r'^([\d\s\-\/¼½¾⅓⅔⅕⅖⅗⅘⅙⅚⅛⅜⅝⅞\.]+)?\s*([a-zA-Z\s]+?)(?:\s+(.+))?$'
+            slash_pos = original_line.find('/', slash_pos + 1)
 
-    match = re.match(pattern, line.strip())
+    # Step 2: Standard parsing with regex
+    match = _INGREDIENT_LINE_RE.match(line.strip())
 
     if not match:
         # No quantity/unit found, treat whole line as ingredient name with no unit
         return (1.0, None, original_line)
 
-    quantity_str, unit_str, ingredient_name = match.groups()
+    quantity_str = match.group('quantity')
+    unit_str = match.group('unit')
+    ingredient_name = match.group('name')
 
     # Parse quantity
     quantity = 1.0
@@ -272,7 +328,7 @@ def parse_ingredient_line(line: str) -> Tuple[Optional[float], Optional[Ingredie
         # Extract the ingredient name before "to taste"
         ingredient_name = line.lower().replace('to taste', '').strip()
         # Remove any remaining quantity/unit text
-        ingredient_name = re.sub(r'^[\d\s\-\/¼½¾⅓⅔⅕⅖⅗⅘⅙⅚⅛⅜⅝⅞\.]+', '', ingredient_name).strip()
+        ingredient_name = _LEADING_QUANTITY_RE.sub('', ingredient_name).strip()
     elif unit_str_clean in UNIT_ALIASES:
         unit = UNIT_ALIASES[unit_str_clean]
     else:
@@ -296,11 +352,12 @@ def parse_ingredient_line(line: str) -> Tuple[Optional[float], Optional[Ingredie
     ingredient_name = ingredient_name.strip()
 
     # Remove notes in parentheses at the end
-    ingredient_name = re.sub(r'\s*\([^)]*\)\s*$', '', ingredient_name)
+    if '(' in ingredient_name:
+        ingredient_name = _TRAILING_PARENTHETICAL_RE.sub('', ingredient_name)
 
     # Remove trailing commas and extra notes
     if ',' in ingredient_name:
-        ingredient_name = ingredient_name.split(',')[0].strip()
+        ingredient_name = ingredient_name.split(',', 1)[0].strip()
 
     # Step 3: Detect ambiguous/incomplete parses
     # If the parse seems uncertain, return full original line for user correction
@@ -319,18 +376,13 @@ def parse_ingredient_line(line: str) -> Tuple[Optional[float], Optional[Ingredie
     if ingredient_name:
         ingredient_lower = ingredient_name.lower()
         # Check for numbers in ingredient name (excluding common cases like "7-grain")
-        if re.search(r'\b\d+\s+(ounce|gram|cup|tablespoon|teaspoon)', ingredient_lower):
+        if _EMBEDDED_MEASUREMENT_RE.search(ingredient_lower):
             is_ambiguous = True
 
     # Check 4: Unit is ITEM and ingredient name looks like it has a real unit
     if unit == IngredientUnit.ITEM and ingredient_name:
-        ingredient_lower = ingredient_name.lower()
         # Check if any real unit word appears in ingredient name
-        real_units = ['package', 'jar', 'can', 'bunch', 'clove', 'cup', 'ounce', 'gram',
-                      'tablespoon', 'teaspoon', 'pound', 'liter']
-        if any(f' {unit_word}' in f' {ingredient_lower}' or
-               ingredient_lower.startswith(f'{unit_word} ')
-               for unit_word in real_units):
+        if _REAL_UNIT_RE.search(ingredient_name.lower()):
             is_ambiguous = True
 
     # If ambiguous, return full original line for manual correction with no unit
@@ -13,7 +13,7 @@ import asyncio
 import uuid
 from collections import defaultdict
 
-from sqlalchemy import select, update
+from sqlalchemy import insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.session import AsyncSessionLocal
@@ -46,45 +46,57 @@ async def migrate():
         for ing in ingredients:
             recipe_groups[ing.recipe_id][ing.prep_note.strip()].append(ing.id)
 
-        total_steps_created = 0
-        total_links_created = 0
+        # Existing prep steps for every affected recipe in one query
+        # recipe_id -> { lowercased description -> prep step id }
+        existing = await db.execute(
+            select(RecipePrepStep.id, RecipePrepStep.recipe_id, RecipePrepStep.description)
+            .where(RecipePrepStep.recipe_id.in_(recipe_groups.keys()))
+        )
+        existing_by_recipe = defaultdict(dict)
+        for step_id, step_recipe_id, step_description in existing:
+            existing_by_recipe[step_recipe_id][step_description.lower()] = step_id
+
+        # New rows are collected here and written with one executemany INSERT each;
+        # ids are assigned up front so links can reference new steps directly
+        step_rows = []
+        link_rows = []
 
         for recipe_id, descriptions in recipe_groups.items():
-            # Check for existing prep steps in this recipe
-            existing = await db.execute(
-                select(RecipePrepStep)
-                .where(RecipePrepStep.recipe_id == recipe_id)
-            )
-            existing_steps = {ps.description.lower(): ps for ps in existing.scalars().all()}
+            existing_steps = existing_by_recipe[recipe_id]
             next_order = len(existing_steps)
 
             for description, ingredient_ids in descriptions.items():
                 # Reuse existing step or create new one
                 key = description.lower()
                 if key in existing_steps:
-                    prep_step = existing_steps[key]
+                    prep_step_id = existing_steps[key]
                 else:
-                    prep_step = RecipePrepStep(
-                        id=uuid.uuid4(),
-                        recipe_id=recipe_id,
-                        description=description,
-                        order=next_order,
-                    )
-                    db.add(prep_step)
-                    await db.flush()
-                    existing_steps[key] = prep_step
+                    prep_step_id = uuid.uuid4()
+                    step_rows.append({
+                        "id": prep_step_id,
+                        "recipe_id": recipe_id,
+                        "description": description,
+                        "order": next_order,
+                    })
+                    existing_steps[key] = prep_step_id
                     next_order += 1
-                    total_steps_created += 1
 
                 # Link each ingredient to the prep step
-                for ing_id in ingredient_ids:
-                    link = PrepStepIngredient(
-                        id=uuid.uuid4(),
-                        prep_step_id=prep_step.id,
-                        recipe_ingredient_id=ing_id,
-                    )
-                    db.add(link)
-                    total_links_created += 1
+                link_rows.extend(
+                    {
+                        "id": uuid.uuid4(),
+                        "prep_step_id": prep_step_id,
+                        "recipe_ingredient_id": ing_id,
+                    }
+                    for ing_id in ingredient_ids
+                )
+
+        if step_rows:
+            await db.execute(insert(RecipePrepStep), step_rows)
+        await db.execute(insert(PrepStepIngredient), link_rows)
+
+        total_steps_created = len(step_rows)
+        total_links_created = len(link_rows)
 
         # Clear all prep_note fields that were migrated
         await db.execute(
@@ -80,6 +80,18 @@ from app.core.security import create_access_token
 settings = get_settings()
 
 
+@pytest.fixture(autouse=True)
+def clear_recipe_service_caches():
+    """Reset RecipeService's in-process caches so tests don't share results."""
+    from app.services.recipe_service import RecipeService
+
+    RecipeService.clear_common_ingredient_cache()
+    RecipeService.clear_import_preview_cache()
+    yield
+    RecipeService.clear_common_ingredient_cache()
+    RecipeService.clear_import_preview_cache()
+
+
 @pytest.fixture(scope="function")
 def db_engine():
     """Create a test database engine (SQLite or PostgreSQL based on TEST_DATABASE_URL)."""
@@ -10,11 +10,18 @@ Tests cover:
 - Owner filtering
 """
 
+import json
+from unittest.mock import patch
+
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
 
+from app.models.recipe import Recipe
+from app.services.recipe_service import RecipeService
+
 
 class TestRecipeBasicOperations:
     """Test basic recipe CRUD operations."""
@@ -163,6 +170,23 @@ class TestRecipeBasicOperations:
         data = response.json()
         assert len(data) >= 3
 
+    def test_list_recipes_paginated(
+        self,
+        async_authenticated_client: TestClient,
+    ):
+        """Test paging through recipes with limit and offset."""
+        for name in ["Paged A", "Paged B", "Paged C"]:
+            async_authenticated_client.post(
+                "/recipes",
+                json={"name": name, "dish_type": "dinner", "ingredients": [], "instructions": []},
+            )
+
+        first_page = async_authenticated_client.get("/recipes?limit=2").json()
+        second_page = async_authenticated_client.get("/recipes?limit=2&offset=2").json()
+
+        assert [r["name"] for r in first_page] == ["Paged A", "Paged B"]
+        assert [r["name"] for r in second_page] == ["Paged C"]
+
     def test_update_recipe(
         self,
         async_authenticated_client: TestClient,
@@ -340,6 +364,82 @@ class TestRecipeBasicOperations:
         assert update_response.status_code == 422
         assert "Unknown ingredient ids" in update_response.json()["detail"]
 
+    def test_import_multiple_recipes_json(
+        self,
+        async_authenticated_client: TestClient,
+    ):
+        """Bulk JSON import creates valid recipes and reports invalid ones."""
+        payload = {
+            "recipes": [
+                {
+                    "name": "Imported Soup",
+                    "ingredients": [{"ingredient_name": "stock", "quantity": 4, "unit": "cup", "order": 0}],
+                    "instructions": [{"step_number": 1, "description": "Heat"}],
+                },
+                {
+                    "name": "Imported Toast",
+                    "ingredients": [{"ingredient_name": "bread", "order": 0}],
+                    "instructions": [],
+                },
+                {"name": "Missing Fields"},
+            ]
+        }
+
+        response = async_authenticated_client.post(
+            "/recipes/import-multiple-json",
+            files={"file": ("recipes.json", json.dumps(payload), "application/json")},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["imported"] == 2
+        assert data["failed"] == 1
+        assert "Missing Fields" in data["errors"][0]
+
+        names = [r["name"] for r in async_authenticated_client.get("/recipes").json()]
+        assert "Imported Soup" in names
+        assert "Imported Toast" in names
+
+    def test_import_multiple_recipes_json_reports_database_errors(
+        self,
+        async_authenticated_client: TestClient,
+    ):
+        """A recipe that fails on insert is reported without losing the others."""
+        insert_recipe_rows = RecipeService._insert_recipe_rows
+
+        async def fail_on_broken(db, rows):
+            if any(row["name"] == "Broken" for row in rows[Recipe]):
+                raise IntegrityError("INSERT INTO recipes", {}, Exception("constraint failed"))
+            await insert_recipe_rows(db, rows)
+
+        payload = {
+            "recipes": [
+                {
+                    "name": name,
+                    "ingredients": [{"ingredient_name": "stock", "order": 0}],
+                    "instructions": [],
+                }
+                for name in ("Good Soup", "Broken", "Good Stew")
+            ]
+        }
+
+        with patch.object(RecipeService, "_insert_recipe_rows", side_effect=fail_on_broken):
+            response = async_authenticated_client.post(
+                "/recipes/import-multiple-json",
+                files={"file": ("recipes.json", json.dumps(payload), "application/json")},
+            )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["imported"] == 2
+        assert data["failed"] == 1
+        assert data["errors"][0].startswith("Recipe 2 ('Broken')")
+
+        names = [r["name"] for r in async_authenticated_client.get("/recipes").json()]
+        assert "Good Soup" in names
+        assert "Good Stew" in names
+        assert "Broken" not in names
+
 
 class TestRecipeRetirement:
     """Test recipe retirement and validation."""
@@ -1403,6 +1503,58 @@ class TestRecipeIndex:
         # Should have 'S' entry for "stuff" ingredient
         assert "S" in index_with_retired
 
+    def test_index_entries_sorted_within_letter(self, async_authenticated_client: TestClient):
+        """Test ingredient and standalone recipe entries are interleaved alphabetically."""
+        recipes = [
+            {
+                "name": "Banana Bread",
+                "dish_type": "dessert",
+                "ingredients": [],
+                "instructions": [],
+            },
+            {
+                "name": "Carbonara",
+                "ingredients": [
+                    {
+                        "ingredient_name": "bacon",
+                        "quantity": 1,
+                        "unit": "pound",
+                        "order": 0,
+                        "is_indexed": True,
+                    },
+                    {
+                        "ingredient_name": "black pepper",
+                        "quantity": 1,
+                        "unit": "teaspoon",
+                        "order": 1,
+                        "is_indexed": True,
+                    },
+                ],
+                "instructions": [],
+            },
+            {
+                "name": "BLT",
+                "ingredients": [
+                    {
+                        "ingredient_name": "bacon",
+                        "quantity": 4,
+                        "unit": "count",
+                        "order": 0,
+                        "is_indexed": True,
+                    },
+                ],
+                "instructions": [],
+            },
+        ]
+        for recipe in recipes:
+            assert async_authenticated_client.post("/recipes", json=recipe).status_code == 201
+
+        index = async_authenticated_client.get("/recipes/index").json()["index"]
+
+        assert [e["name"] for e in index["B"]] == ["bacon", "Banana Bread", "black pepper"]
+        bacon_entry = index["B"][0]
+        assert [r["name"] for r in bacon_entry["recipes"]] == ["BLT", "Carbonara"]
+
     def test_index_empty(self, async_authenticated_client: TestClient):
         """Test index returns empty dict when no recipes exist."""
         response = async_authenticated_client.get("/recipes/index")
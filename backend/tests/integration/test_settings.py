@@ -93,3 +93,35 @@ def test_settings_requires_auth(async_client: TestClient):
     # PUT without auth
     response = async_client.put("/settings", json={"notification_time": "09:00"})
     assert response.status_code == 401
+
+
+def test_update_settings_rejects_invalid_timezone(async_authenticated_client: TestClient):
+    """Test that an unknown timezone is rejected instead of saved."""
+    response = async_authenticated_client.put(
+        "/settings",
+        json={"notification_time": "07:00", "notification_timezone": "Mars/Olympus_Mons"},
+    )
+
+    assert response.status_code == 400
+
+
+def test_update_settings_rejects_null_values(async_authenticated_client: TestClient):
+    """Test that explicit nulls are rejected instead of failing the request."""
+    # First create settings
+    async_authenticated_client.put(
+        "/settings",
+        json={
+            "notification_time": "07:00",
+            "notification_timezone": "UTC",
+        },
+    )
+
+    for field in ("notification_time", "notification_timezone"):
+        response = async_authenticated_client.put("/settings", json={field: None})
+
+        assert response.status_code == 400
+
+    # The stored settings are left as they were
+    data = async_authenticated_client.get("/settings").json()
+    assert data["notification_time"] == "07:00"
+    assert data["notification_timezone"] == "UTC"
@@ -155,6 +155,10 @@ class TestParseQuantity:
         """Parses mixed number with unicode fraction."""
         assert parse_quantity('2 ½') == 2.5
 
+    def test_attached_unicode_fraction(self):
+        """Parses a unicode fraction written directly after the whole number."""
+        assert parse_quantity('1½') == 1.5
+
     def test_mixed_number_larger(self):
         """Parses larger mixed number."""
         assert parse_quantity('3 3/4') == 3.75
@@ -232,6 +236,13 @@ class TestParseIngredientLine:
         assert unit == IngredientUnit.CUP
         assert name == 'milk'
 
+    def test_attached_unicode_fraction_quantity(self):
+        """Parses a unicode fraction attached to the whole number."""
+        qty, unit, name = parse_ingredient_line('1½ cups sugar')
+        assert qty == 1.5
+        assert unit == IngredientUnit.CUP
+        assert name == 'sugar'
+
     def test_weight_ounces(self):
         """Parses ounces weight measurement."""
         qty, unit, name = parse_ingredient_line('8 oz cream cheese')
@@ -466,3 +477,13 @@ class TestParseIngredientLineEdgeCases:
         qty, unit, name = parse_ingredient_line('2 slices 7-grain bread')
         # Since 'slices' is not a recognized unit
         assert qty == 2.0
+
+    def test_repeated_line_is_served_from_cache(self):
+        """Repeated lines reuse the memoized parse."""
+        parse_ingredient_line.cache_clear()
+
+        first = parse_ingredient_line('1 tsp salt')
+        second = parse_ingredient_line('1 tsp salt')
+
+        assert first == second == (1.0, IngredientUnit.TEASPOON, 'salt')
+        assert parse_ingredient_line.cache_info().hits == 1
@@ -376,6 +376,20 @@ class TestMapIngredient:
         aliases = [a.alias for a in alias_result.scalars().all()]
         assert "all-purpose flour" in aliases
 
+    async def test_invalidates_common_ingredient_cache(self, async_db_session):
+        """Test that a cached miss for the mapped name is dropped."""
+        from app.services.recipe_service import RecipeService
+
+        common = CommonIngredientFactory.build(name="Olive Oil", category="pantry")
+        async_db_session.add(common)
+        await async_db_session.commit()
+
+        assert await RecipeService.find_common_ingredient(async_db_session, "evoo") is None
+
+        await IngredientService.map_ingredient(async_db_session, "evoo", common.id)
+
+        assert await RecipeService.find_common_ingredient(async_db_session, "evoo") == common.id
+
     async def test_raises_for_missing_common_ingredient(self, async_db_session):
         """Test that ValueError is raised when common ingredient doesn't exist."""
         fake_id = uuid4()
@@ -2,6 +2,7 @@
 
 import pytest
 from datetime import date
+from unittest.mock import patch
 from uuid import uuid4
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
@@ -29,6 +30,49 @@ async def load_instance_with_relationships(db, instance_id):
 class TestGetMergedAssignmentsForDay:
     """Test the get_merged_assignments_for_day method."""
 
+    async def test_loads_users_and_recipes_in_one_query_each(
+        self, async_db_session, async_test_user
+    ):
+        """Test that several assignments don't cost a user and recipe query apiece."""
+        template = WeekTemplate(id=uuid4(), name="Busy Week")
+        recipes = [Recipe(id=uuid4(), name=f"Dish {i}", owner_id=async_test_user.id) for i in range(3)]
+        async_db_session.add_all([template, *recipes])
+        async_db_session.add_all(
+            [
+                WeekDayAssignment(
+                    id=uuid4(),
+                    week_template_id=template.id,
+                    day_of_week=2,
+                    assigned_user_id=async_test_user.id,
+                    action="cook",
+                    recipe_id=recipe.id,
+                    order=i,
+                )
+                for i, recipe in enumerate(recipes)
+            ]
+        )
+        instance = MealPlanInstance(
+            id=uuid4(), week_template_id=template.id, instance_start_date=date(2025, 1, 5)
+        )
+        async_db_session.add(instance)
+        await async_db_session.commit()
+
+        instance = await load_instance_with_relationships(async_db_session, instance.id)
+
+        with patch.object(
+            async_db_session, "execute", wraps=async_db_session.execute
+        ) as spy:
+            results = await MealPlanService.get_merged_assignments_for_day(
+                db=async_db_session,
+                instance=instance,
+                day_of_week=2,
+            )
+
+        # Overrides, users, recipes
+        assert spy.await_count == 3
+        assert [recipe.name for _, _, recipe in results] == ["Dish 0", "Dish 1", "Dish 2"]
+        assert all(user.id == async_test_user.id for _, user, _ in results)
+
     async def test_uses_template_assignments_when_no_overrides(
         self, async_db_session, async_test_user
     ):
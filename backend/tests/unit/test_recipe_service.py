@@ -14,21 +14,32 @@ Tests cover:
 - Prep Step CRUD: get, create, update, delete
 """
 
+import asyncio
+import httpx
 import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 from datetime import datetime
 
 from fastapi import HTTPException
-from app.services.recipe_service import RecipeService
+from recipe_scrapers._exceptions import ElementNotFoundInHtml
+from sqlalchemy import select
+
+from app.models.recipe import PrepStepIngredient
+from app.services.recipe_service import COPY_ROW_THRESHOLD, RecipeService, _copy_records
 from app.schemas.recipe import (
     RecipeCreate,
     RecipeUpdate,
     RecipeIngredientCreate,
     RecipeIngredientUpdate,
+    RecipeIngredientUpsert,
     RecipeInstructionCreate,
     RecipeInstructionUpdate,
     RecipePrepStepCreate,
     RecipePrepStepUpdate,
+    RecipeImportPreviewResponse,
+    RecipeImportPreviewIngredient,
+    RecipeImportPreviewInstruction,
 )
 from tests.factories import (
     UserFactory,
@@ -42,6 +53,7 @@ from tests.factories import (
     CommonIngredientFactory,
     IngredientAliasFactory,
 )
+from tests.conftest import USING_SQLITE
 
 
 @pytest.mark.asyncio
@@ -146,6 +158,18 @@ class TestGetRecipes:
         names = [r.name for r in test_recipes]
         assert names == sorted(names)
 
+    async def test_limit_and_offset_page_results(self, async_db_session, async_test_user):
+        """Test that limit/offset return consecutive pages in name order."""
+        for name in ["Alpha", "Bravo", "Charlie"]:
+            async_db_session.add(RecipeFactory.build(owner_id=async_test_user.id, name=name))
+        await async_db_session.commit()
+
+        first_page = await RecipeService.get_recipes(async_db_session, limit=2)
+        second_page = await RecipeService.get_recipes(async_db_session, limit=2, offset=2)
+
+        assert [r.name for r in first_page] == ["Alpha", "Bravo"]
+        assert [r.name for r in second_page] == ["Charlie"]
+
 
 @pytest.mark.asyncio
 class TestGetRecipeById:
@@ -309,6 +333,81 @@ class TestCreateRecipe:
         assert result.ingredients[0].common_ingredient_id == common.id
 
 
+@pytest.mark.asyncio
+class TestBulkCreateRecipes:
+    """Test the bulk_create_recipes method."""
+
+    async def test_creates_recipes_with_children(self, async_db_session, async_test_user):
+        """Test creating several recipes with ingredients, instructions, and prep steps."""
+        common = CommonIngredientFactory.build(name="onion", category="produce")
+        async_db_session.add(common)
+        await async_db_session.commit()
+
+        recipes_data = [
+            RecipeCreate(
+                name="Soup",
+                dish_type="soup",
+                ingredients=[
+                    RecipeIngredientCreate(
+                        ingredient_name="Onion",
+                        quantity=1.0,
+                        unit="whole",
+                        order=0,
+                        prep_step_description="Dice",
+                    ),
+                    RecipeIngredientCreate(
+                        ingredient_name="Carrot",
+                        quantity=2.0,
+                        unit="whole",
+                        order=1,
+                        prep_step_description="Dice",
+                    ),
+                ],
+                instructions=[RecipeInstructionCreate(step_number=1, description="Simmer")],
+            ),
+            RecipeCreate(
+                name="Salad",
+                ingredients=[
+                    RecipeIngredientCreate(ingredient_name="Lettuce", quantity=1.0, order=0),
+                ],
+                instructions=[],
+                prep_steps=[
+                    RecipePrepStepCreate(description="Wash", order=0, ingredient_orders=[0]),
+                ],
+            ),
+        ]
+
+        recipe_ids = await RecipeService.bulk_create_recipes(
+            async_db_session, recipes_data, async_test_user.id
+        )
+
+        assert len(recipe_ids) == 2
+
+        soup = await RecipeService.get_recipe_by_id(async_db_session, recipe_ids[0])
+        assert soup.name == "Soup"
+        assert soup.owner_id == async_test_user.id
+        assert len(soup.ingredients) == 2
+        assert len(soup.instructions) == 1
+        onion = next(i for i in soup.ingredients if i.ingredient_name == "Onion")
+        assert onion.common_ingredient_id == common.id
+        # Both ingredients share a single "Dice" prep step
+        assert len(soup.prep_steps) == 1
+        assert len(soup.prep_steps[0].ingredient_links) == 2
+
+        salad = await RecipeService.get_recipe_by_id(async_db_session, recipe_ids[1])
+        assert salad.name == "Salad"
+        assert len(salad.prep_steps) == 1
+        assert salad.prep_steps[0].ingredient_links[0].recipe_ingredient_id == (
+            salad.ingredients[0].id
+        )
+
+    async def test_empty_input(self, async_db_session, async_test_user):
+        """Test that no recipes are created for an empty list."""
+        result = await RecipeService.bulk_create_recipes(async_db_session, [], async_test_user.id)
+
+        assert result == []
+
+
 @pytest.mark.asyncio
 class TestUpdateRecipe:
     """Test the update_recipe method."""
@@ -325,6 +424,30 @@ class TestUpdateRecipe:
         assert result is not None
         assert result.name == "Updated Name"
 
+    async def test_scalar_update_keeps_loaded_collections(self, async_db_session, async_test_user):
+        """Test a metadata-only update still returns the recipe's ingredients and instructions."""
+        recipe = RecipeFactory.build(owner_id=async_test_user.id, name="Original Name")
+        async_db_session.add(recipe)
+        await async_db_session.flush()
+        async_db_session.add(
+            RecipeIngredientFactory.build(recipe_id=recipe.id, ingredient_name="Flour", order=0)
+        )
+        async_db_session.add(
+            RecipeInstructionFactory.build(recipe_id=recipe.id, step_number=1, description="Mix")
+        )
+        await async_db_session.commit()
+        original_updated_at = recipe.updated_at
+
+        result = await RecipeService.update_recipe(
+            async_db_session, recipe.id, RecipeUpdate(name="Updated Name")
+        )
+
+        assert result.name == "Updated Name"
+        assert result.updated_at is not None
+        assert result.updated_at >= original_updated_at
+        assert [ing.ingredient_name for ing in result.ingredients] == ["Flour"]
+        assert [inst.description for inst in result.instructions] == ["Mix"]
+
     async def test_raises_for_missing_recipe(self, async_db_session):
         """Test that HTTPException is raised when recipe doesn't exist."""
         fake_id = uuid4()
@@ -502,7 +625,7 @@ class TestRestoreRecipe:
 
 @pytest.mark.asyncio
 class TestCheckRecipeUsage:
-    """Test the check_recipe_usage method."""
+    """Test the check_recipe_usage and has_recipe_usage methods."""
 
     async def test_returns_templates_using_recipe(self, async_db_session, async_test_user):
         """Test finding templates that use a recipe."""
@@ -528,6 +651,7 @@ class TestCheckRecipeUsage:
 
         assert len(result) == 1
         assert result[0]["name"] == "Template 1"
+        assert await RecipeService.has_recipe_usage(async_db_session, recipe.id) is True
 
     async def test_excludes_retired_templates(self, async_db_session, async_test_user):
         """Test that retired templates are not included."""
@@ -552,6 +676,7 @@ class TestCheckRecipeUsage:
         result = await RecipeService.check_recipe_usage(async_db_session, recipe.id)
 
         assert len(result) == 0
+        assert await RecipeService.has_recipe_usage(async_db_session, recipe.id) is False
 
     async def test_returns_empty_for_unused_recipe(self, async_db_session, async_test_user):
         """Test that empty list is returned for unused recipe."""
@@ -562,6 +687,7 @@ class TestCheckRecipeUsage:
         result = await RecipeService.check_recipe_usage(async_db_session, recipe.id)
 
         assert len(result) == 0
+        assert await RecipeService.has_recipe_usage(async_db_session, recipe.id) is False
 
 
 @pytest.mark.asyncio
@@ -645,6 +771,34 @@ class TestIngredientCRUD:
         assert result.quantity == 2.0
         assert result.unit == "tablespoon"
 
+    async def test_update_ingredient_moves_prep_step_link(self, async_db_session, async_test_user):
+        """Test relinking an ingredient replaces its link and drops the orphaned prep step."""
+        recipe = RecipeFactory.build(owner_id=async_test_user.id, name="Recipe")
+        async_db_session.add(recipe)
+        await async_db_session.flush()
+
+        ingredient = RecipeIngredientFactory.build(recipe_id=recipe.id, ingredient_name="Onion")
+        old_step = RecipePrepStepFactory.build(recipe_id=recipe.id, description="Dice", order=0)
+        new_step = RecipePrepStepFactory.build(recipe_id=recipe.id, description="Slice", order=1)
+        async_db_session.add_all([ingredient, old_step, new_step])
+        await async_db_session.flush()
+        async_db_session.add(
+            PrepStepIngredientFactory.build(
+                prep_step_id=old_step.id, recipe_ingredient_id=ingredient.id
+            )
+        )
+        await async_db_session.commit()
+
+        await RecipeService.update_ingredient(
+            async_db_session, ingredient.id, RecipeIngredientUpdate(prep_step_id=new_step.id)
+        )
+
+        prep_steps = await RecipeService.get_prep_steps(async_db_session, recipe.id)
+        assert [ps.description for ps in prep_steps] == ["Slice"]
+        assert [link.recipe_ingredient_id for link in prep_steps[0].ingredient_links] == [
+            ingredient.id
+        ]
+
     async def test_update_ingredient_raises_for_missing(self, async_db_session):
         """Test that HTTPException is raised when ingredient doesn't exist."""
         fake_id = uuid4()
@@ -844,6 +998,85 @@ class TestFindCommonIngredient:
         assert result is None
 
 
+@pytest.mark.asyncio
+class TestResolveCommonIngredients:
+    """Test the resolve_common_ingredients batch helper."""
+
+    async def test_resolves_names_and_aliases(self, async_db_session):
+        """Test resolving a mix of names, aliases, and unknown ingredients."""
+        flour = CommonIngredientFactory.build(name="all-purpose flour", category="pantry")
+        butter = CommonIngredientFactory.build(name="Butter", category="dairy")
+        async_db_session.add_all([flour, butter])
+        await async_db_session.flush()
+
+        alias = IngredientAliasFactory.build(common_ingredient_id=flour.id, alias="flour")
+        async_db_session.add(alias)
+        await async_db_session.commit()
+
+        result = await RecipeService.resolve_common_ingredients(
+            async_db_session, ["Flour ", "BUTTER", "nonexistent"]
+        )
+
+        assert result == {"flour": flour.id, "butter": butter.id}
+
+    async def test_alias_wins_over_name(self, async_db_session):
+        """Test that an alias match takes precedence over a common ingredient name."""
+        onion = CommonIngredientFactory.build(name="onion", category="produce")
+        yellow_onion = CommonIngredientFactory.build(name="yellow onion", category="produce")
+        async_db_session.add_all([onion, yellow_onion])
+        await async_db_session.flush()
+
+        alias = IngredientAliasFactory.build(common_ingredient_id=yellow_onion.id, alias="onion")
+        async_db_session.add(alias)
+        await async_db_session.commit()
+
+        result = await RecipeService.resolve_common_ingredients(async_db_session, ["onion"])
+
+        assert result == {"onion": yellow_onion.id}
+
+    async def test_empty_input(self, async_db_session):
+        """Test that an empty name list returns an empty mapping."""
+        result = await RecipeService.resolve_common_ingredients(async_db_session, [])
+
+        assert result == {}
+
+
+@pytest.mark.asyncio
+class TestCommonIngredientCache:
+    """Test the in-process cache behind common ingredient lookups."""
+
+    async def test_caches_lookup_results(self, async_db_session):
+        """Test that a repeated lookup is served from the cache."""
+        common = CommonIngredientFactory.build(name="salt", category="spices")
+        async_db_session.add(common)
+        await async_db_session.commit()
+
+        assert await RecipeService.find_common_ingredient(async_db_session, "Salt") == common.id
+
+        # Rename directly in the DB (bypassing IngredientService) - cache still answers
+        common.name = "kosher salt"
+        await async_db_session.commit()
+
+        assert await RecipeService.find_common_ingredient(async_db_session, "salt") == common.id
+        assert await RecipeService.resolve_common_ingredients(async_db_session, ["SALT"]) == {
+            "salt": common.id
+        }
+
+    async def test_caches_misses(self, async_db_session):
+        """Test that a name with no match is cached as a miss until cleared."""
+        assert await RecipeService.find_common_ingredient(async_db_session, "paprika") is None
+
+        common = CommonIngredientFactory.build(name="paprika", category="spices")
+        async_db_session.add(common)
+        await async_db_session.commit()
+
+        assert await RecipeService.find_common_ingredient(async_db_session, "paprika") is None
+
+        RecipeService.clear_common_ingredient_cache()
+
+        assert await RecipeService.find_common_ingredient(async_db_session, "paprika") == common.id
+
+
 @pytest.mark.asyncio
 class TestPrepStepCRUD:
     """Test prep step CRUD operations."""
@@ -981,6 +1214,30 @@ class TestPrepStepCRUD:
         assert len(result.ingredient_links) == 1
         assert result.ingredient_links[0].recipe_ingredient_id == ing2_id
 
+    async def test_update_prep_step_ignores_other_recipes_ingredients(
+        self, async_db_session, async_test_user
+    ):
+        """Test that ingredient IDs from a different recipe are not linked."""
+        recipe = RecipeFactory.build(owner_id=async_test_user.id, name="Recipe")
+        other_recipe = RecipeFactory.build(owner_id=async_test_user.id, name="Other")
+        async_db_session.add_all([recipe, other_recipe])
+        await async_db_session.flush()
+
+        own_ingredient = RecipeIngredientFactory.build(recipe_id=recipe.id, order=0)
+        foreign_ingredient = RecipeIngredientFactory.build(recipe_id=other_recipe.id, order=0)
+        prep_step = RecipePrepStepFactory.build(recipe_id=recipe.id, description="Chop", order=0)
+        async_db_session.add_all([own_ingredient, foreign_ingredient, prep_step])
+        await async_db_session.commit()
+
+        update_data = RecipePrepStepUpdate(
+            ingredient_ids=[foreign_ingredient.id, own_ingredient.id]
+        )
+        result = await RecipeService.update_prep_step(async_db_session, prep_step.id, update_data)
+
+        assert [link.recipe_ingredient_id for link in result.ingredient_links] == [
+            own_ingredient.id
+        ]
+
     async def test_update_prep_step_raises_for_missing(self, async_db_session):
         """Test that HTTPException is raised when prep step doesn't exist."""
         fake_id = uuid4()
@@ -1008,6 +1265,33 @@ class TestPrepStepCRUD:
         result = await RecipeService.get_prep_steps(async_db_session, recipe.id)
         assert len(result) == 0
 
+    async def test_delete_prep_step_removes_ingredient_links(
+        self, async_db_session, async_test_user
+    ):
+        """Test deleting a prep step also deletes its ingredient links."""
+        recipe = RecipeFactory.build(owner_id=async_test_user.id, name="Recipe")
+        async_db_session.add(recipe)
+        await async_db_session.flush()
+        ingredient = RecipeIngredientFactory.build(recipe_id=recipe.id, order=0)
+        prep_step = RecipePrepStepFactory.build(recipe_id=recipe.id, description="Slice", order=0)
+        async_db_session.add_all([ingredient, prep_step])
+        await async_db_session.flush()
+        async_db_session.add(
+            PrepStepIngredientFactory.build(
+                prep_step_id=prep_step.id, recipe_ingredient_id=ingredient.id
+            )
+        )
+        await async_db_session.commit()
+
+        await RecipeService.delete_prep_step(async_db_session, prep_step.id)
+
+        result = await async_db_session.execute(
+            select(PrepStepIngredient).where(
+                PrepStepIngredient.recipe_ingredient_id == ingredient.id
+            )
+        )
+        assert result.scalars().all() == []
+
     async def test_delete_prep_step_raises_for_missing(self, async_db_session):
         """Test that HTTPException is raised when prep step doesn't exist."""
         fake_id = uuid4()
@@ -1125,3 +1409,254 @@ class TestUpdateRecipeWithPrepSteps:
         assert result is not None
         assert len(result.prep_steps) == 1
         assert result.prep_steps[0].description == "New prep step"
+
+    async def test_links_prep_steps_to_ingredients_from_same_update(
+        self, async_db_session, async_test_user
+    ):
+        """Test ingredient_orders resolve against ingredients added in the same update."""
+        recipe = RecipeFactory.build(owner_id=async_test_user.id, name="Recipe")
+        async_db_session.add(recipe)
+        await async_db_session.flush()
+
+        old_ingredient = RecipeIngredientFactory.build(
+            recipe_id=recipe.id, ingredient_name="Old", order=0
+        )
+        async_db_session.add(old_ingredient)
+        await async_db_session.commit()
+
+        update_data = RecipeUpdate(
+            ingredients=[
+                RecipeIngredientUpsert(
+                    ingredient_name="Carrot", quantity=2.0, unit="whole", order=0
+                ),
+                RecipeIngredientUpsert(
+                    ingredient_name="Celery", quantity=1.0, unit="whole", order=1
+                ),
+            ],
+            prep_steps=[
+                RecipePrepStepCreate(description="Chop", order=0, ingredient_orders=[1]),
+            ],
+        )
+
+        result = await RecipeService.update_recipe(async_db_session, recipe.id, update_data)
+
+        celery = next(ing for ing in result.ingredients if ing.ingredient_name == "Celery")
+        assert len(result.prep_steps) == 1
+        assert [link.recipe_ingredient_id for link in result.prep_steps[0].ingredient_links] == [
+            celery.id
+        ]
+
+
+@pytest.mark.asyncio
+class TestImportRecipePreview:
+    """Tests for RecipeService.import_recipe_preview."""
+
+    SCHEMA_ORG_HTML = """
+    <html><head><title>Toast</title>
+    <script type="application/ld+json">
+    {"@context": "https://schema.org", "@type": "Recipe", "name": "Toast",
+     "recipeIngredient": ["2 cups flour", "1 tbsp butter"],
+     "recipeInstructions": [{"@type": "HowToStep", "text": "Toast the bread."},
+                            {"@type": "HowToStep", "text": "Spread the butter."}]}
+    </script></head><body></body></html>
+    """
+
+    async def test_unsupported_site_reuses_fetched_html_for_fallback(self):
+        """Test the schema.org fallback parses the page fetched once, without refetching."""
+        with patch(
+            "app.services.recipe_service._fetch_html",
+            new=AsyncMock(return_value=self.SCHEMA_ORG_HTML),
+        ) as mock_fetch:
+            result = await RecipeService.import_recipe_preview("https://example.com/toast")
+
+        mock_fetch.assert_awaited_once_with("https://example.com/toast")
+        assert result.name == "Toast"
+        assert [i.ingredient_name for i in result.ingredients] == ["flour", "butter"]
+        assert [i.description for i in result.instructions] == [
+            "Toast the bread.",
+            "Spread the butter.",
+        ]
+        # Fields the markup doesn't provide come back empty rather than failing
+        assert result.prep_time_minutes is None
+        assert result.description is None
+
+    async def test_repeat_preview_is_served_from_cache(self):
+        """Test previewing the same URL twice only fetches it once."""
+        with patch(
+            "app.services.recipe_service._fetch_html",
+            new=AsyncMock(return_value=self.SCHEMA_ORG_HTML),
+        ) as mock_fetch:
+            first = await RecipeService.import_recipe_preview("https://example.com/toast")
+            first.name = "Edited by caller"
+            second = await RecipeService.import_recipe_preview("https://example.com/toast")
+
+        mock_fetch.assert_awaited_once()
+        assert second.name == "Toast"
+
+    async def test_use_cache_false_scrapes_again(self):
+        """Test use_cache=False bypasses a cached preview."""
+        with patch(
+            "app.services.recipe_service._fetch_html",
+            new=AsyncMock(return_value=self.SCHEMA_ORG_HTML),
+        ) as mock_fetch:
+            await RecipeService.import_recipe_preview("https://example.com/toast")
+            await RecipeService.import_recipe_preview("https://example.com/toast", use_cache=False)
+
+        assert mock_fetch.await_count == 2
+
+    async def test_concurrent_previews_share_one_scrape(self):
+        """Test simultaneous previews of the same URL fetch the page once."""
+        with patch(
+            "app.services.recipe_service._fetch_html",
+            new=AsyncMock(return_value=self.SCHEMA_ORG_HTML),
+        ) as mock_fetch:
+            first, second = await asyncio.gather(
+                RecipeService.import_recipe_preview("https://example.com/toast", use_cache=False),
+                RecipeService.import_recipe_preview("https://example.com/toast", use_cache=False),
+            )
+
+        mock_fetch.assert_awaited_once()
+        assert first.name == second.name == "Toast"
+        assert first is not second
+
+    async def test_scraper_error_raises_http_exception(self):
+        """Test a recipe-scrapers error while extracting fields is reported, not leaked."""
+        scraper = MagicMock()
+        scraper.ingredients.side_effect = ElementNotFoundInHtml("ingredients")
+
+        with patch(
+            "app.services.recipe_service._fetch_html",
+            new=AsyncMock(return_value=self.SCHEMA_ORG_HTML),
+        ), patch("app.services.recipe_service.scrape_html", return_value=scraper):
+            with pytest.raises(HTTPException) as exc_info:
+                await RecipeService.import_recipe_preview("https://example.com/toast")
+
+        assert exc_info.value.status_code == 500
+        assert "Failed to parse recipe" in exc_info.value.detail
+
+    async def test_fetch_failure_raises_400(self):
+        """Test a page that can't be fetched is reported as a bad request."""
+        with patch(
+            "app.services.recipe_service._fetch_html",
+            new=AsyncMock(side_effect=httpx.ConnectError("connection refused")),
+        ):
+            with pytest.raises(HTTPException) as exc_info:
+                await RecipeService.import_recipe_preview("https://example.com/toast")
+
+        assert exc_info.value.status_code == 400
+
+
+@pytest.mark.asyncio
+class TestReimportRecipe:
+    """Tests for RecipeService.reimport_recipe."""
+
+    async def test_replaces_ingredients_and_instructions(self, async_db_session, async_test_user):
+        """Test re-import swaps in the scraped ingredients and instructions."""
+        recipe = RecipeFactory.build(
+            owner_id=async_test_user.id,
+            name="Old Name",
+            source_url="https://example.com/toast",
+        )
+        async_db_session.add(recipe)
+        await async_db_session.flush()
+        async_db_session.add(
+            RecipeIngredientFactory.build(recipe_id=recipe.id, ingredient_name="Old", order=0)
+        )
+        async_db_session.add(
+            RecipeInstructionFactory.build(recipe_id=recipe.id, step_number=1, description="Old")
+        )
+        await async_db_session.commit()
+
+        preview = RecipeImportPreviewResponse(
+            name="Toast",
+            source_url="https://example.com/toast",
+            ingredients=[
+                RecipeImportPreviewIngredient(ingredient_name="bread", quantity=2.0),
+                RecipeImportPreviewIngredient(ingredient_name="butter", quantity=1.0),
+            ],
+            instructions=[
+                RecipeImportPreviewInstruction(step_number=1, description="Toast the bread."),
+            ],
+        )
+        with patch.object(
+            RecipeService, "import_recipe_preview", new=AsyncMock(return_value=preview)
+        ):
+            result = await RecipeService.reimport_recipe(async_db_session, recipe.id)
+
+        assert result.name == "Toast"
+        assert [ing.ingredient_name for ing in result.ingredients] == ["bread", "butter"]
+        assert [ing.order for ing in result.ingredients] == [0, 1]
+        assert [inst.description for inst in result.instructions] == ["Toast the bread."]
+
+    async def test_removes_prep_step_links_of_replaced_ingredients(
+        self, async_db_session, async_test_user
+    ):
+        """Test re-import deletes the links that pointed at the old ingredients."""
+        recipe = RecipeFactory.build(
+            owner_id=async_test_user.id, source_url="https://example.com/toast"
+        )
+        async_db_session.add(recipe)
+        await async_db_session.flush()
+        ingredient = RecipeIngredientFactory.build(recipe_id=recipe.id, order=0)
+        prep_step = RecipePrepStepFactory.build(recipe_id=recipe.id, description="Slice", order=0)
+        async_db_session.add_all([ingredient, prep_step])
+        await async_db_session.flush()
+        async_db_session.add(
+            PrepStepIngredientFactory.build(
+                prep_step_id=prep_step.id, recipe_ingredient_id=ingredient.id
+            )
+        )
+        await async_db_session.commit()
+
+        preview = RecipeImportPreviewResponse(
+            name="Toast",
+            source_url="https://example.com/toast",
+            ingredients=[RecipeImportPreviewIngredient(ingredient_name="bread", quantity=2.0)],
+            instructions=[],
+        )
+        with patch.object(
+            RecipeService, "import_recipe_preview", new=AsyncMock(return_value=preview)
+        ):
+            await RecipeService.reimport_recipe(async_db_session, recipe.id)
+
+        prep_steps = await RecipeService.get_prep_steps(async_db_session, recipe.id)
+        assert [ps.ingredient_links for ps in prep_steps] == [[]]
+
+    async def test_large_reimport_inserts_every_row(self, async_db_session, async_test_user):
+        """Test a re-import above the COPY threshold writes every row (via COPY on PostgreSQL)."""
+        recipe = RecipeFactory.build(
+            owner_id=async_test_user.id, source_url="https://example.com/feast"
+        )
+        async_db_session.add(recipe)
+        await async_db_session.commit()
+
+        preview = RecipeImportPreviewResponse(
+            name="Feast",
+            source_url="https://example.com/feast",
+            ingredients=[
+                RecipeImportPreviewIngredient(ingredient_name=f"item {i}", quantity=1.0)
+                for i in range(COPY_ROW_THRESHOLD + 1)
+            ],
+            instructions=[],
+        )
+        with patch.object(
+            RecipeService, "import_recipe_preview", new=AsyncMock(return_value=preview)
+        ), patch(
+            "app.services.recipe_service._copy_records", wraps=_copy_records
+        ) as copy_records:
+            result = await RecipeService.reimport_recipe(async_db_session, recipe.id)
+
+        assert copy_records.await_count == (0 if USING_SQLITE else 1)
+        assert len(result.ingredients) == COPY_ROW_THRESHOLD + 1
+        assert not any(ing.is_indexed for ing in result.ingredients)
+
+    async def test_raises_without_source_url(self, async_db_session, async_test_user):
+        """Test that a recipe without a source URL can't be re-imported."""
+        recipe = RecipeFactory.build(owner_id=async_test_user.id, source_url=None)
+        async_db_session.add(recipe)
+        await async_db_session.commit()
+
+        with pytest.raises(HTTPException) as exc_info:
+            await RecipeService.reimport_recipe(async_db_session, recipe.id)
+
+        assert exc_info.value.status_code == 400
@@ -8,8 +8,11 @@ Tests cover:
 """
 
 import pytest
+from datetime import datetime, timezone
+from unittest.mock import patch
 from uuid import uuid4
 from fastapi import HTTPException
+from sqlalchemy import event
 
 from app.services.schedule_service import ScheduleService
 from app.schemas.schedule import (
@@ -100,6 +103,30 @@ class TestGetSequenceById:
         assert result is not None
         assert len(result.week_mappings) == 1
 
+    async def test_repeat_lookup_is_memoized_per_session(self, async_db_session):
+        """Test that a second lookup in the same session doesn't query again."""
+        seq = ScheduleSequenceFactory.build()
+        async_db_session.add(seq)
+        await async_db_session.commit()
+
+        first = await ScheduleService.get_sequence_by_id(async_db_session, seq.id)
+        with patch.object(async_db_session, "execute", wraps=async_db_session.execute) as spy:
+            second = await ScheduleService.get_sequence_by_id(async_db_session, seq.id)
+
+        assert second is first
+        spy.assert_not_called()
+
+    async def test_lookup_after_delete_is_not_served_from_memo(self, async_db_session):
+        """Test that deleting a sequence drops it from the per-session memo."""
+        seq = ScheduleSequenceFactory.build()
+        async_db_session.add(seq)
+        await async_db_session.commit()
+
+        await ScheduleService.get_sequence_by_id(async_db_session, seq.id)
+        await ScheduleService.delete_sequence(async_db_session, seq.id)
+
+        assert await ScheduleService.get_sequence_by_id(async_db_session, seq.id) is None
+
 
 @pytest.mark.asyncio
 class TestCreateSequence:
@@ -199,6 +226,25 @@ class TestDeleteSequence:
         check = await ScheduleService.get_sequence_by_id(async_db_session, seq_id)
         assert check is None
 
+    async def test_deletes_sequence_mappings(self, async_db_session):
+        """Test deleting a sequence also deletes its template mappings."""
+        seq = ScheduleSequenceFactory.build()
+        template = WeekTemplateFactory.build()
+        async_db_session.add_all([seq, template])
+        await async_db_session.flush()
+        async_db_session.add(
+            SequenceWeekMappingFactory.build(
+                sequence_id=seq.id, week_template_id=template.id, position=1
+            )
+        )
+        await async_db_session.commit()
+
+        await ScheduleService.delete_sequence(async_db_session, seq.id)
+
+        assert await ScheduleService.get_active_templates_for_sequence(
+            async_db_session, seq.id
+        ) == []
+
     async def test_raises_for_missing_sequence(self, async_db_session):
         """Test that HTTPException is raised for non-existent sequence."""
         fake_id = uuid4()
@@ -270,6 +316,41 @@ class TestGetActiveTemplatesForSequence:
         positions = [m.position for m in result]
         assert positions == [1, 2, 3]
 
+    async def test_loads_templates_in_one_batch(self, async_db_session):
+        """Test that the mapped templates come back in one query, however many there are."""
+        seq = ScheduleSequenceFactory.build()
+        templates = [WeekTemplateFactory.build(name=f"Week {i}") for i in range(1, 5)]
+        async_db_session.add_all([seq, *templates])
+        await async_db_session.flush()
+        async_db_session.add_all(
+            [
+                SequenceWeekMappingFactory.build(
+                    sequence_id=seq.id, week_template_id=template.id, position=position
+                )
+                for position, template in enumerate(templates, start=1)
+            ]
+        )
+        await async_db_session.commit()
+
+        statements = []
+
+        def count_query(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        engine = async_db_session.bind.sync_engine
+        event.listen(engine, "before_cursor_execute", count_query)
+        try:
+            result = await ScheduleService.get_active_templates_for_sequence(
+                async_db_session, seq.id
+            )
+            names = [m.week_template.name for m in result]
+        finally:
+            event.remove(engine, "before_cursor_execute", count_query)
+
+        assert names == ["Week 1", "Week 2", "Week 3", "Week 4"]
+        # Mappings, then one IN query for all of their templates
+        assert len(statements) == 2
+
 
 @pytest.mark.asyncio
 class TestAddTemplateToSequence:
@@ -311,6 +392,30 @@ class TestAddTemplateToSequence:
 
         assert result.position == 2
 
+    async def test_auto_position_ignores_removed_mappings(self, async_db_session):
+        """Test that removed mappings don't count toward the auto-assigned position."""
+        seq = ScheduleSequenceFactory.build()
+        async_db_session.add(seq)
+
+        t1 = WeekTemplateFactory.build()
+        t2 = WeekTemplateFactory.build()
+        async_db_session.add_all([t1, t2])
+        await async_db_session.flush()
+
+        async_db_session.add(
+            SequenceWeekMappingFactory.build(
+                sequence_id=seq.id,
+                week_template_id=t1.id,
+                position=1,
+                removed_at=datetime.now(timezone.utc),
+            )
+        )
+        await async_db_session.commit()
+
+        result = await ScheduleService.add_template_to_sequence(async_db_session, seq.id, t2.id)
+
+        assert result.position == 1
+
     async def test_raises_for_missing_sequence(self, async_db_session):
         """Test HTTPException for non-existent sequence."""
         template = WeekTemplateFactory.build()
@@ -423,6 +528,8 @@ class TestReorderSequenceTemplates:
         assert pos_by_name["Week 3"] == 1
         assert pos_by_name["Week 1"] == 2
         assert pos_by_name["Week 2"] == 3
+        # Returned in the new order
+        assert [m.week_template.name for m in result] == ["Week 3", "Week 1", "Week 2"]
 
     async def test_raises_for_mismatched_template_ids(self, async_db_session):
         """Test HTTPException when template IDs don't match."""
@@ -502,6 +609,39 @@ class TestGetCurrentTemplate:
         assert result is not None
         assert result.name == "First Week"
 
+    async def test_ignores_removed_mappings(self, async_db_session):
+        """Test that removed mappings don't count toward the wrap-around."""
+        # Index 1 with one active template wraps to position 1
+        seq = ScheduleSequenceFactory.build(current_week_index=1)
+        async_db_session.add(seq)
+
+        t1 = WeekTemplateFactory.build(name="Active Week")
+        t2 = WeekTemplateFactory.build(name="Removed Week")
+        async_db_session.add_all([t1, t2])
+        await async_db_session.flush()
+
+        m1 = SequenceWeekMappingFactory.build(sequence_id=seq.id, week_template_id=t1.id, position=1)
+        m2 = SequenceWeekMappingFactory.build(
+            sequence_id=seq.id,
+            week_template_id=t2.id,
+            position=2,
+            removed_at=datetime.now(timezone.utc),
+        )
+        async_db_session.add_all([m1, m2])
+        await async_db_session.commit()
+
+        result = await ScheduleService.get_current_template(async_db_session, seq.id)
+
+        assert result is not None
+        assert result.name == "Active Week"
+
+    async def test_raises_for_missing_sequence(self, async_db_session):
+        """Test HTTPException for non-existent sequence."""
+        with pytest.raises(HTTPException) as exc:
+            await ScheduleService.get_current_template(async_db_session, uuid4())
+
+        assert exc.value.status_code == 404
+
 
 @pytest.mark.asyncio
 class TestAssignmentCRUD:
@@ -9,77 +9,118 @@ import pytest
 from datetime import date, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import select
 
 from app.models.schedule import ScheduleSequence, WeekTemplate, SequenceWeekMapping
 from app.models.meal_plan import MealPlanInstance, GroceryList
 from app.models.settings import Settings
+from app.services.meal_plan_service import MealPlanService
+from tests.factories import (
+    MealPlanInstanceFactory,
+    ScheduleSequenceFactory,
+    SequenceWeekMappingFactory,
+    WeekTemplateFactory,
+    WeekDayAssignmentFactory,
+)
 
 
 class TestSchedulerConfiguration:
     """Test scheduler configuration."""
 
     def test_configure_scheduler_adds_jobs(self):
-        """Test that configure_scheduler adds expected jobs."""
+        """Test that configure_scheduler adds the week advancement job."""
         with patch("app.services.scheduler_service.scheduler") as mock_scheduler:
             mock_scheduler.add_job = MagicMock()
 
             from app.services.scheduler_service import configure_scheduler
             configure_scheduler()
 
-            # Verify jobs were added
-            assert mock_scheduler.add_job.call_count == 2
-
-            # Check job IDs
+            # Notifications are scheduled from settings, not here
             call_args = [call.kwargs.get("id") for call in mock_scheduler.add_job.call_args_list]
-            assert "notification_check" in call_args
-            assert "week_advancement" in call_args
+            assert call_args == ["week_advancement"]
 
+    def test_schedule_notifications_uses_configured_time(self):
+        """Test that the notification job fires daily at the configured local time."""
+        with patch("app.services.scheduler_service.scheduler") as mock_scheduler:
+            from app.services.scheduler_service import schedule_notifications
+            schedule_notifications("08:30", "America/Chicago")
+
+            call = mock_scheduler.add_job.call_args
+            trigger = call.args[1]
+            fields = {field.name: str(field) for field in trigger.fields}
+            assert fields["hour"] == "8"
+            assert fields["minute"] == "30"
+            assert str(trigger.timezone) == "America/Chicago"
+            assert call.kwargs["id"] == "notification_check"
+            assert call.kwargs["kwargs"] == {"timezone": "America/Chicago"}
+            assert call.kwargs["replace_existing"] is True
+
+    def test_jobs_never_overlap_or_pile_up(self):
+        """Test that jobs run one at a time on the event loop and coalesce missed runs."""
+        from apscheduler.executors.asyncio import AsyncIOExecutor
+        from app.services.scheduler_service import scheduler
 
-@pytest.mark.asyncio
-class TestCheckAndSendNotifications:
-    """Test the check_and_send_notifications logic."""
+        assert scheduler._job_defaults["max_instances"] == 1
+        assert scheduler._job_defaults["coalesce"] is True
+        assert isinstance(scheduler._lookup_executor("default"), AsyncIOExecutor)
 
-    @patch("app.services.scheduler_service.AsyncSessionLocal")
-    @patch("app.services.scheduler_service.send_daily_notifications")
-    async def test_skips_if_no_settings(self, mock_send, mock_session_local):
-        """Test that notifications are skipped when no settings exist."""
-        from app.services.scheduler_service import check_and_send_notifications
+        with patch("app.services.scheduler_service.scheduler") as mock_scheduler:
+            from app.services.scheduler_service import configure_scheduler, schedule_notifications
+            configure_scheduler()
+            schedule_notifications("08:30", "UTC")
 
-        # Mock session that returns no settings
-        mock_session = AsyncMock()
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_session.execute.return_value = mock_result
-        mock_session.__aenter__.return_value = mock_session
-        mock_session.__aexit__.return_value = None
-        mock_session_local.return_value = mock_session
+            for call in mock_scheduler.add_job.call_args_list:
+                assert call.kwargs["misfire_grace_time"] > 0
+
+    def test_schedule_notifications_keeps_unchanged_job(self):
+        """Test that rescheduling to the same time leaves the existing job in place."""
+        from apscheduler.schedulers.asyncio import AsyncIOScheduler
+
+        with patch("app.services.scheduler_service.scheduler", AsyncIOScheduler()) as fresh:
+            from app.services.scheduler_service import schedule_notifications
+            schedule_notifications("08:30", "UTC")
+
+            with patch.object(fresh, "add_job", wraps=fresh.add_job) as add_job:
+                schedule_notifications("08:30", "UTC")
+                add_job.assert_not_called()
+
+                schedule_notifications("09:00", "UTC")
+                add_job.assert_called_once()
+                fields = {field.name: str(field) for field in add_job.call_args.args[1].fields}
+                assert fields["hour"] == "9"
+
+    def test_schedule_notifications_rejects_malformed_time(self):
+        """Test that a malformed time raises instead of scheduling."""
+        with patch("app.services.scheduler_service.scheduler") as mock_scheduler:
+            from app.services.scheduler_service import schedule_notifications
 
-        await check_and_send_notifications()
+            with pytest.raises(ValueError):
+                schedule_notifications("25:00", "UTC")
 
-        mock_send.assert_not_called()
+            mock_scheduler.add_job.assert_not_called()
+
+
+@pytest.mark.asyncio
+class TestCheckAndSendNotifications:
+    """Test the check_and_send_notifications job."""
 
-    @patch("app.services.scheduler_service.last_notification_date", date.today())
     @patch("app.services.scheduler_service.AsyncSessionLocal")
     @patch("app.services.scheduler_service.send_daily_notifications")
-    async def test_skips_if_already_notified_today(self, mock_send, mock_session_local):
-        """Test that notifications are skipped if already sent today."""
+    async def test_sends_for_today_in_configured_timezone(self, mock_send, mock_session_local):
+        """Test that the job sends notifications for today's date in the given timezone."""
         from app.services.scheduler_service import check_and_send_notifications
 
-        # Mock session with settings
         mock_session = AsyncMock()
-        mock_settings = MagicMock(spec=Settings)
-        mock_settings.notification_timezone = "UTC"
-        mock_settings.notification_time = "08:00"
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = mock_settings
-        mock_session.execute.return_value = mock_result
         mock_session.__aenter__.return_value = mock_session
         mock_session.__aexit__.return_value = None
         mock_session_local.return_value = mock_session
 
-        await check_and_send_notifications()
+        await check_and_send_notifications(timezone="Pacific/Kiritimati")
 
-        mock_send.assert_not_called()
+        expected = datetime.now(ZoneInfo("Pacific/Kiritimati")).date()
+        mock_send.assert_awaited_once_with(mock_session, expected)
 
 
 @pytest.mark.asyncio
@@ -131,6 +172,110 @@ class TestSendDailyNotifications:
         # Should not send message for rest action
         mock_bot.send_message.assert_not_called()
 
+    @patch("app.services.scheduler_service.get_bot")
+    @patch("app.services.scheduler_service.MealPlanService")
+    async def test_uses_sunday_based_day_of_week(self, mock_mps, mock_get_bot):
+        """Test that each weekday is looked up with our Sunday=0 numbering."""
+        from app.services.scheduler_service import send_daily_notifications
+
+        mock_get_bot.return_value = MagicMock()
+        mock_mps.get_merged_assignments_for_day = AsyncMock(return_value=[])
+
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = [MagicMock(spec=MealPlanInstance)]
+        mock_session = AsyncMock()
+        mock_session.execute.return_value = mock_result
+
+        # 2026-01-04 is a Sunday
+        sunday = date(2026, 1, 4)
+        for offset in range(7):
+            await send_daily_notifications(mock_session, sunday + timedelta(days=offset))
+            day_of_week = mock_mps.get_merged_assignments_for_day.await_args.kwargs["day_of_week"]
+            assert day_of_week == offset
+
+    @patch("app.services.scheduler_service.build_notification_message")
+    @patch("app.services.scheduler_service.get_bot")
+    @patch("app.services.scheduler_service.MealPlanService")
+    async def test_links_shop_action_to_todays_grocery_list(
+        self, mock_mps, mock_get_bot, mock_build_message
+    ):
+        """Test that shop notifications link the instance's grocery list from one lookup."""
+        from app.services.scheduler_service import send_daily_notifications
+
+        mock_bot = MagicMock()
+        mock_bot.bot.user.name = "Test Bot"
+        mock_bot.send_message = AsyncMock()
+        mock_get_bot.return_value = mock_bot
+
+        mock_assignment = MagicMock()
+        mock_assignment.action = "shop"
+        mock_user = MagicMock()
+        mock_user.username = "testuser"
+        mock_mps.get_merged_assignments_for_day = AsyncMock(
+            return_value=[(mock_assignment, mock_user, None), (mock_assignment, mock_user, None)]
+        )
+
+        mock_instance = MagicMock(spec=MealPlanInstance)
+        mock_instance.id = uuid4()
+        mock_instance.instance_start_date = date.today()
+
+        instances_result = MagicMock()
+        instances_result.scalars.return_value.all.return_value = [mock_instance]
+        grocery_list_id = uuid4()
+        grocery_lists_result = MagicMock()
+        grocery_lists_result.all.return_value = [(mock_instance.id, grocery_list_id)]
+
+        mock_session = AsyncMock()
+        mock_session.execute.side_effect = [instances_result, grocery_lists_result]
+
+        await send_daily_notifications(mock_session, date.today())
+
+        # One query for instances, one for all grocery lists
+        assert mock_session.execute.await_count == 2
+        assert mock_bot.send_message.await_count == 2
+        for call in mock_build_message.call_args_list:
+            assert call.kwargs["grocery_list_id"] == str(grocery_list_id)
+
+    @patch("app.services.scheduler_service.build_notification_message")
+    @patch("app.services.scheduler_service.get_bot")
+    async def test_notifies_only_todays_assignments(
+        self, mock_get_bot, mock_build_message, async_db_session, async_test_user
+    ):
+        """Test that only the template's assignments for today are notified."""
+        from app.services.scheduler_service import send_daily_notifications
+
+        mock_bot = MagicMock()
+        mock_bot.bot.user.name = "Test Bot"
+        mock_bot.send_message = AsyncMock()
+        mock_get_bot.return_value = mock_bot
+
+        template = WeekTemplateFactory.build()
+        async_db_session.add(template)
+        await async_db_session.flush()
+        async_db_session.add_all(
+            [
+                WeekDayAssignmentFactory.build(
+                    week_template_id=template.id,
+                    day_of_week=day_of_week,
+                    assigned_user_id=async_test_user.id,
+                    action="shop",
+                )
+                for day_of_week in range(7)
+            ]
+        )
+        # 2026-01-04 is a Sunday, so 2026-01-07 is day 3
+        async_db_session.add(
+            MealPlanInstanceFactory.build(
+                week_template_id=template.id, instance_start_date=date(2026, 1, 4)
+            )
+        )
+        await async_db_session.commit()
+
+        await send_daily_notifications(async_db_session, date(2026, 1, 7))
+
+        assert mock_bot.send_message.await_count == 1
+        assert mock_build_message.call_args.kwargs["assignment"].day_of_week == 3
+
 
 @pytest.mark.asyncio
 class TestAdvanceWeek:
@@ -154,6 +299,8 @@ class TestAdvanceWeek:
         mock_sequence = MagicMock(spec=ScheduleSequence)
         mock_sequence.id = uuid4()
         mock_sequence.name = "Test Sequence"
+        # No active mappings preloaded
+        mock_sequence.week_mappings = []
 
         mock_result = MagicMock()
         mock_result.scalars.return_value.all.return_value = [mock_sequence]
@@ -163,14 +310,354 @@ class TestAdvanceWeek:
         mock_session.__aexit__.return_value = None
         mock_session_local.return_value = mock_session
 
-        # Mock ScheduleService to return no mappings
-        with patch("app.services.scheduler_service.ScheduleService") as mock_ss:
-            mock_ss.get_active_templates_for_sequence = AsyncMock(return_value=[])
+        await advance_week()
+
+        # Should not send message when no templates
+        mock_bot.send_message.assert_not_called()
+
+    @patch("app.services.scheduler_service.AsyncSessionLocal")
+    @patch("app.services.scheduler_service.get_bot")
+    async def test_continues_from_latest_instance(
+        self, mock_get_bot, mock_session_local, async_db_session
+    ):
+        """Test advancing creates the next template's instance a week after the latest one."""
+        from app.services.scheduler_service import advance_week
+
+        mock_bot = MagicMock()
+        mock_bot.send_message = AsyncMock()
+        mock_get_bot.return_value = mock_bot
+
+        mock_session_local.return_value.__aenter__.return_value = async_db_session
+        mock_session_local.return_value.__aexit__.return_value = None
+
+        sequence = ScheduleSequenceFactory.build(current_week_index=0)
+        t1 = WeekTemplateFactory.build(name="Week 1")
+        t2 = WeekTemplateFactory.build(name="Week 2")
+        async_db_session.add_all([sequence, t1, t2])
+        await async_db_session.flush()
+        async_db_session.add_all(
+            [
+                SequenceWeekMappingFactory.build(
+                    sequence_id=sequence.id, week_template_id=t1.id, position=1
+                ),
+                SequenceWeekMappingFactory.build(
+                    sequence_id=sequence.id, week_template_id=t2.id, position=2
+                ),
+                MealPlanInstance(week_template_id=t1.id, instance_start_date=date(2026, 1, 4)),
+            ]
+        )
+        await async_db_session.commit()
+
+        await advance_week()
+
+        result = await async_db_session.execute(
+            select(MealPlanInstance).where(MealPlanInstance.week_template_id == t2.id)
+        )
+        new_instance = result.scalar_one()
+        assert new_instance.instance_start_date == date(2026, 1, 11)
+        assert sequence.current_week_index == 1
+        mock_bot.send_message.assert_awaited_once()
 
+    @patch("app.services.scheduler_service.AsyncSessionLocal")
+    @patch("app.services.scheduler_service.get_bot")
+    async def test_sends_messages_after_session_is_released(
+        self, mock_get_bot, mock_session_local, async_db_session
+    ):
+        """Test that Discord messages for every sequence go out after the session closes."""
+        from app.services.scheduler_service import advance_week
+
+        events = []
+
+        async def record_send(message):
+            events.append("sent")
+            return True
+
+        async def record_exit(*args):
+            events.append("closed")
+
+        mock_bot = MagicMock()
+        mock_bot.send_message = AsyncMock(side_effect=record_send)
+        mock_get_bot.return_value = mock_bot
+
+        mock_session_local.return_value.__aenter__.return_value = async_db_session
+        mock_session_local.return_value.__aexit__.side_effect = record_exit
+
+        for _ in range(2):
+            sequence = ScheduleSequenceFactory.build(current_week_index=0)
+            templates = [WeekTemplateFactory.build() for _ in range(2)]
+            async_db_session.add_all([sequence, *templates])
+            await async_db_session.flush()
+            async_db_session.add_all(
+                [
+                    SequenceWeekMappingFactory.build(
+                        sequence_id=sequence.id, week_template_id=template.id, position=position
+                    )
+                    for position, template in enumerate(templates, start=1)
+                ]
+            )
+        await async_db_session.commit()
+
+        await advance_week()
+
+        assert events == ["closed", "sent", "sent"]
+
+    @patch("app.services.scheduler_service.AsyncSessionLocal")
+    @patch("app.services.scheduler_service.get_bot")
+    async def test_failed_send_does_not_stop_other_messages(
+        self, mock_get_bot, mock_session_local, async_db_session
+    ):
+        """Test one failed Discord send is logged and the other messages still go out."""
+        from app.services.scheduler_service import advance_week
+
+        sent = []
+
+        async def fail_first_send(message):
+            if not sent:
+                sent.append(None)
+                raise ConnectionError("discord unavailable")
+            sent.append(message)
+            return True
+
+        mock_bot = MagicMock()
+        mock_bot.send_message = AsyncMock(side_effect=fail_first_send)
+        mock_get_bot.return_value = mock_bot
+
+        mock_session_local.return_value.__aenter__.return_value = async_db_session
+        mock_session_local.return_value.__aexit__.return_value = None
+
+        for _ in range(2):
+            sequence = ScheduleSequenceFactory.build(current_week_index=0)
+            templates = [WeekTemplateFactory.build() for _ in range(2)]
+            async_db_session.add_all([sequence, *templates])
+            await async_db_session.flush()
+            async_db_session.add_all(
+                [
+                    SequenceWeekMappingFactory.build(
+                        sequence_id=sequence.id, week_template_id=template.id, position=position
+                    )
+                    for position, template in enumerate(templates, start=1)
+                ]
+            )
+        await async_db_session.commit()
+
+        with patch("app.services.scheduler_service.logger") as mock_logger:
+            await advance_week()
+
+        assert mock_bot.send_message.await_count == 2
+        assert len([message for message in sent if message]) == 1
+        mock_logger.error.assert_called_once()
+
+    @patch("app.services.scheduler_service.AsyncSessionLocal")
+    @patch("app.services.scheduler_service.get_bot")
+    async def test_skips_run_of_retired_templates(
+        self, mock_get_bot, mock_session_local, async_db_session
+    ):
+        """Test advancing passes over consecutive retired weeks to the next active one."""
+        from app.services.scheduler_service import advance_week
+
+        mock_bot = MagicMock()
+        mock_bot.send_message = AsyncMock()
+        mock_get_bot.return_value = mock_bot
+
+        mock_session_local.return_value.__aenter__.return_value = async_db_session
+        mock_session_local.return_value.__aexit__.return_value = None
+
+        sequence = ScheduleSequenceFactory.build(current_week_index=0)
+        current = WeekTemplateFactory.build()
+        retired = [WeekTemplateFactory.build(retired_at=datetime(2026, 1, 1)) for _ in range(2)]
+        upcoming = WeekTemplateFactory.build()
+        templates = [current, *retired, upcoming]
+        async_db_session.add_all([sequence, *templates])
+        await async_db_session.flush()
+        async_db_session.add_all(
+            [
+                SequenceWeekMappingFactory.build(
+                    sequence_id=sequence.id, week_template_id=template.id, position=position
+                )
+                for position, template in enumerate(templates, start=1)
+            ]
+        )
+        await async_db_session.commit()
+
+        await advance_week()
+        await async_db_session.rollback()
+
+        result = await async_db_session.execute(
+            select(ScheduleSequence.current_week_index).where(ScheduleSequence.id == sequence.id)
+        )
+        assert result.scalar_one() == 3
+        result = await async_db_session.execute(
+            select(MealPlanInstance.week_template_id).where(
+                MealPlanInstance.sequence_id == sequence.id
+            )
+        )
+        assert result.scalars().all() == [upcoming.id]
+
+    @patch("app.services.scheduler_service.AsyncSessionLocal")
+    @patch("app.services.scheduler_service.get_bot")
+    async def test_all_retired_leaves_index_unchanged(
+        self, mock_get_bot, mock_session_local, async_db_session
+    ):
+        """Test a sequence with only retired templates is left where it is."""
+        from app.services.scheduler_service import advance_week
+
+        mock_bot = MagicMock()
+        mock_bot.send_message = AsyncMock()
+        mock_get_bot.return_value = mock_bot
+
+        mock_session_local.return_value.__aenter__.return_value = async_db_session
+        mock_session_local.return_value.__aexit__.return_value = None
+
+        sequence = ScheduleSequenceFactory.build(current_week_index=1)
+        retired = [WeekTemplateFactory.build(retired_at=datetime(2026, 1, 1)) for _ in range(2)]
+        async_db_session.add_all([sequence, *retired])
+        await async_db_session.flush()
+        async_db_session.add_all(
+            [
+                SequenceWeekMappingFactory.build(
+                    sequence_id=sequence.id, week_template_id=template.id, position=position
+                )
+                for position, template in enumerate(retired, start=1)
+            ]
+        )
+        await async_db_session.commit()
+
+        await advance_week()
+        await async_db_session.rollback()
+
+        result = await async_db_session.execute(
+            select(ScheduleSequence.current_week_index).where(ScheduleSequence.id == sequence.id)
+        )
+        assert result.scalar_one() == 1
+        mock_bot.send_message.assert_not_called()
+
+    @patch("app.services.scheduler_service.AsyncSessionLocal")
+    @patch("app.services.scheduler_service.get_bot")
+    async def test_failed_sequence_does_not_block_others(
+        self, mock_get_bot, mock_session_local, async_db_session
+    ):
+        """Test a database error in one sequence is rolled back and the rest still advance."""
+        from app.services.scheduler_service import advance_week
+
+        mock_bot = MagicMock()
+        mock_bot.send_message = AsyncMock()
+        mock_get_bot.return_value = mock_bot
+
+        mock_session_local.return_value.__aenter__.return_value = async_db_session
+        mock_session_local.return_value.__aexit__.return_value = None
+
+        sequences = []
+        next_templates = []
+        for _ in range(3):
+            sequence = ScheduleSequenceFactory.build(current_week_index=0)
+            templates = [WeekTemplateFactory.build() for _ in range(2)]
+            async_db_session.add_all([sequence, *templates])
+            await async_db_session.flush()
+            async_db_session.add_all(
+                [
+                    SequenceWeekMappingFactory.build(
+                        sequence_id=sequence.id, week_template_id=template.id, position=position
+                    )
+                    for position, template in enumerate(templates, start=1)
+                ]
+            )
+            sequences.append(sequence)
+            next_templates.append(templates[1])
+        await async_db_session.commit()
+        sequence_ids = [sequence.id for sequence in sequences]
+        broken_template_id = next_templates[0].id
+
+        create_instance = MealPlanService.create_instance
+
+        async def fail_for_broken_template(db, template_id, **kwargs):
+            if template_id == broken_template_id:
+                # A failed flush leaves the session needing a rollback
+                db.add(MealPlanInstance(week_template_id=template_id, instance_start_date=None))
+                await db.flush()
+            return await create_instance(db=db, template_id=template_id, **kwargs)
+
+        with patch.object(
+            MealPlanService, "create_instance", side_effect=fail_for_broken_template
+        ):
+            await advance_week()
+        await async_db_session.rollback()
+
+        result = await async_db_session.execute(
+            select(ScheduleSequence.id, ScheduleSequence.current_week_index).where(
+                ScheduleSequence.id.in_(sequence_ids)
+            )
+        )
+        assert dict(result.all()) == {
+            sequence_ids[0]: 0,
+            sequence_ids[1]: 1,
+            sequence_ids[2]: 1,
+        }
+        result = await async_db_session.execute(
+            select(MealPlanInstance.sequence_id).where(
+                MealPlanInstance.sequence_id.in_(sequence_ids)
+            )
+        )
+        assert sorted(result.scalars().all()) == sorted(sequence_ids[1:])
+        assert mock_bot.send_message.await_count == 2
+
+    @patch("app.services.scheduler_service.AsyncSessionLocal")
+    @patch("app.services.scheduler_service.get_bot")
+    async def test_shared_template_not_duplicated_after_grocery_failure(
+        self, mock_get_bot, mock_session_local, async_db_session
+    ):
+        """Test a committed instance still counts for other sequences if grocery lists fail."""
+        from app.services.scheduler_service import advance_week
+
+        mock_bot = MagicMock()
+        mock_bot.send_message = AsyncMock()
+        mock_get_bot.return_value = mock_bot
+
+        mock_session_local.return_value.__aenter__.return_value = async_db_session
+        mock_session_local.return_value.__aexit__.return_value = None
+
+        shared = WeekTemplateFactory.build(name="Shared")
+        async_db_session.add(shared)
+        for _ in range(2):
+            sequence = ScheduleSequenceFactory.build(current_week_index=0)
+            current = WeekTemplateFactory.build()
+            async_db_session.add_all([sequence, current])
+            await async_db_session.flush()
+            async_db_session.add_all(
+                [
+                    SequenceWeekMappingFactory.build(
+                        sequence_id=sequence.id, week_template_id=current.id, position=1
+                    ),
+                    SequenceWeekMappingFactory.build(
+                        sequence_id=sequence.id, week_template_id=shared.id, position=2
+                    ),
+                    MealPlanInstance(
+                        week_template_id=current.id, instance_start_date=date(2026, 1, 4)
+                    ),
+                ]
+            )
+        await async_db_session.commit()
+        shared_id = shared.id
+
+        calls = []
+
+        async def fail_first_call(db, instance):
+            calls.append(instance.id)
+            if len(calls) == 1:
+                raise RuntimeError("grocery generation failed")
+            return []
+
+        with patch.object(
+            MealPlanService, "auto_generate_grocery_lists", side_effect=fail_first_call
+        ):
             await advance_week()
+        await async_db_session.rollback()
 
-            # Should not send message when no templates
-            mock_bot.send_message.assert_not_called()
+        result = await async_db_session.execute(
+            select(MealPlanInstance.instance_start_date).where(
+                MealPlanInstance.week_template_id == shared_id
+            )
+        )
+        assert sorted(result.scalars().all()) == [date(2026, 1, 11), date(2026, 1, 18)]
 
 
 class TestDayOfWeekConversion:
@@ -279,33 +766,52 @@ class TestNotificationTimeWindow:
 class TestSchedulerEdgeCases:
     """Test edge cases and error handling."""
 
+    @patch("app.services.scheduler_service.scheduler")
+    @patch("app.services.scheduler_service.schedule_notifications")
     @patch("app.services.scheduler_service.AsyncSessionLocal")
-    @patch("app.services.scheduler_service.send_daily_notifications")
-    async def test_crashes_on_missing_notification_time(self, mock_send, mock_session_local):
-        """Test that None notification_time causes AttributeError.
-
-        Note: This documents current behavior. The implementation doesn't
-        guard against None notification_time - it will crash trying to
-        call .split() on None.
-        """
-        from app.services.scheduler_service import check_and_send_notifications
+    async def test_start_schedules_notifications_from_settings(
+        self, mock_session_local, mock_schedule, mock_scheduler
+    ):
+        """Test that startup schedules notifications at the stored time."""
+        from app.services.scheduler_service import start_scheduler
 
-        mock_session = AsyncMock()
         mock_settings = MagicMock(spec=Settings)
-        mock_settings.notification_timezone = "UTC"
-        mock_settings.notification_time = None  # Missing time
+        mock_settings.notification_time = "06:45"
+        mock_settings.notification_timezone = "Europe/Berlin"
         mock_result = MagicMock()
         mock_result.scalar_one_or_none.return_value = mock_settings
+        mock_session = AsyncMock()
+        mock_session.execute.return_value = mock_result
+        mock_session.__aenter__.return_value = mock_session
+        mock_session.__aexit__.return_value = None
+        mock_session_local.return_value = mock_session
+
+        await start_scheduler()
+
+        mock_schedule.assert_called_once_with("06:45", "Europe/Berlin")
+        mock_scheduler.start.assert_called_once()
+
+    @patch("app.services.scheduler_service.scheduler")
+    @patch("app.services.scheduler_service.schedule_notifications")
+    @patch("app.services.scheduler_service.AsyncSessionLocal")
+    async def test_start_without_settings_skips_notifications(
+        self, mock_session_local, mock_schedule, mock_scheduler
+    ):
+        """Test that no notification job is scheduled until settings exist."""
+        from app.services.scheduler_service import start_scheduler
+
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = None
+        mock_session = AsyncMock()
         mock_session.execute.return_value = mock_result
         mock_session.__aenter__.return_value = mock_session
         mock_session.__aexit__.return_value = None
         mock_session_local.return_value = mock_session
 
-        # Current implementation crashes - documents limitation
-        with pytest.raises(AttributeError):
-            await check_and_send_notifications()
+        await start_scheduler()
 
-        mock_send.assert_not_called()
+        mock_schedule.assert_not_called()
+        mock_scheduler.start.assert_called_once()
 
     async def test_scheduler_singleton(self):
         """Test that scheduler is a singleton."""
@@ -288,6 +288,29 @@ class TestUpdateTemplate:
         assert result.day_assignments[0].day_of_week == 5
         assert result.day_assignments[0].action == "takeout"
 
+    async def test_empty_assignments_clears_template(self, async_db_session, async_test_user):
+        """Test that an empty assignment list removes every existing assignment."""
+        template = WeekTemplateFactory.build(name="Week to Clear")
+        async_db_session.add(template)
+        await async_db_session.flush()
+        async_db_session.add_all(
+            [
+                WeekDayAssignmentFactory.build(
+                    week_template_id=template.id,
+                    day_of_week=day_of_week,
+                    assigned_user_id=async_test_user.id,
+                )
+                for day_of_week in range(3)
+            ]
+        )
+        await async_db_session.commit()
+
+        result = await TemplateService.update_template(
+            async_db_session, template.id, WeekTemplateUpdate(assignments=[])
+        )
+
+        assert result.day_assignments == []
+
 
 @pytest.mark.asyncio
 class TestForkTemplate:
@@ -411,6 +434,60 @@ class TestRetireTemplate:
 
         assert result["can_hard_delete"] is False
 
+    async def test_advances_only_sequences_on_retired_template(self, async_db_session):
+        """Test that sequences currently on the template advance and the rest stay put."""
+        template = WeekTemplateFactory.build(name="Retiring Week")
+        other = WeekTemplateFactory.build(name="Staying Week")
+        on_template = ScheduleSequenceFactory.build(current_week_index=0)
+        elsewhere = ScheduleSequenceFactory.build(current_week_index=0)
+        async_db_session.add_all([template, other, on_template, elsewhere])
+        await async_db_session.flush()
+        async_db_session.add_all(
+            [
+                SequenceWeekMappingFactory.build(
+                    sequence_id=on_template.id, week_template_id=template.id, position=1
+                ),
+                SequenceWeekMappingFactory.build(
+                    sequence_id=on_template.id, week_template_id=other.id, position=2
+                ),
+                SequenceWeekMappingFactory.build(
+                    sequence_id=elsewhere.id, week_template_id=other.id, position=1
+                ),
+                SequenceWeekMappingFactory.build(
+                    sequence_id=elsewhere.id, week_template_id=template.id, position=2
+                ),
+            ]
+        )
+        await async_db_session.commit()
+
+        result = await TemplateService.retire_template(async_db_session, template.id)
+
+        assert [entry["sequence_id"] for entry in result["affected_sequences"]] == [
+            on_template.id
+        ]
+        assert on_template.current_week_index == 1
+        assert elsewhere.current_week_index == 0
+
+    async def test_removes_mappings_at_retirement_time(self, async_db_session):
+        """Test that every mapping is removed with the template's retired_at timestamp."""
+        template = WeekTemplateFactory.build(name="Widely Used Week")
+        sequences = [ScheduleSequenceFactory.build() for _ in range(3)]
+        async_db_session.add_all([template, *sequences])
+        await async_db_session.flush()
+        mappings = [
+            SequenceWeekMappingFactory.build(sequence_id=sequence.id, week_template_id=template.id)
+            for sequence in sequences
+        ]
+        async_db_session.add_all(mappings)
+        await async_db_session.commit()
+
+        result = await TemplateService.retire_template(async_db_session, template.id)
+
+        retired_at = result["template"].retired_at
+        for mapping in mappings:
+            await async_db_session.refresh(mapping)
+            assert mapping.removed_at == retired_at
+
 
 @pytest.mark.asyncio
 class TestDeleteTemplate: